@@ -0,0 +1 @@
+"""Benchmarks of rattr, see `benchmarks.scaling`."""
@@ -0,0 +1,221 @@
+"""A deterministic generator of synthetic packages to benchmark rattr against.
+
+The generated package is laid out as:
+
+    <root>/
+        target.py           - calls the functions of the first module
+        <name>/
+            __init__.py
+            mod_0.py        - imports mod_1 (and others), calls their functions
+            mod_1.py
+            ...
+
+Each module has `functions_per_module` entry functions, which get, set, and delete
+attributes of their arguments, and call a chain of `call_depth` helpers; the deepest
+helper calls a function imported from another module. The shape is given by
+`SyntheticPackageConfig`:
+
+    modules                 - the number of modules in the package
+    functions_per_module    - the number of entry functions in each module
+    call_depth              - the number of helpers called beneath each entry function
+    import_fan_out          - the number of later modules imported by each module,
+                              the next module is always imported s.t. every module is
+                              reachable from the target
+    starred_import_chain    - the first N modules import the next by a starred import,
+                              (i.e. `from <name>.mod_1 import *`), giving a chain of
+                              starred imports to expand
+    recursion_cycles        - the first N entry functions of each module are called
+                              again by their deepest helper, giving a call cycle
+    seed                    - the seed of the choice of imported modules and functions
+
+The same config always gives the same package, byte-for-byte.
+
+Usage:
+
+    python -m benchmarks.generate <root> [--modules N] [--functions-per-module N] ...
+"""
+from __future__ import annotations
+
+import argparse
+import random
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import attrs
+from attrs.validators import ge
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+@attrs.frozen
+class SyntheticPackageConfig:
+    modules: int = attrs.field(default=10, validator=ge(1))
+    functions_per_module: int = attrs.field(default=10, validator=ge(1))
+    call_depth: int = attrs.field(default=3, validator=ge(0))
+    import_fan_out: int = attrs.field(default=3, validator=ge(1))
+    starred_import_chain: int = attrs.field(default=4, validator=ge(0))
+    recursion_cycles: int = attrs.field(default=1, validator=ge(0))
+    seed: int = 0
+    name: str = "synthetic"
+
+    @starred_import_chain.validator
+    def _check_starred_import_chain(self, _: attrs.Attribute, value: int) -> None:
+        if value >= self.modules:
+            raise ValueError("'starred_import_chain' must be less than 'modules'")
+
+    @recursion_cycles.validator
+    def _check_recursion_cycles(self, _: attrs.Attribute, value: int) -> None:
+        if value > self.functions_per_module:
+            raise ValueError(
+                "'recursion_cycles' must not be more than 'functions_per_module'"
+            )
+
+
+def generate_package(root: Path, config: SyntheticPackageConfig) -> Path:
+    """Write the synthetic package to the given directory and return the target."""
+    rng = random.Random(config.seed)
+
+    package = root / config.name
+    package.mkdir(parents=True, exist_ok=True)
+
+    (package / "__init__.py").write_text("")
+
+    for index in range(config.modules):
+        source = "\n".join(_module_source(index, config, rng))
+        (package / f"mod_{index}.py").write_text(source)
+
+    target = root / "target.py"
+    target.write_text("\n".join(_target_source(config)))
+
+    return target
+
+
+def _module_source(
+    index: int,
+    config: SyntheticPackageConfig,
+    rng: random.Random,
+) -> Iterator[str]:
+    callees: list[str] = []
+
+    if index < config.starred_import_chain:
+        yield f"from {config.name}.mod_{index + 1} import *"
+        callees.append(f"fn_{index + 1}_{rng.randrange(config.functions_per_module)}")
+
+    for module in _imported_modules(index, config, rng):
+        function = f"fn_{module}_{rng.randrange(config.functions_per_module)}"
+        yield f"from {config.name}.mod_{module} import {function}"
+        callees.append(function)
+
+    yield ""
+
+    for function in range(config.functions_per_module):
+        callee = rng.choice(callees) if callees else None
+        is_recursive = function < config.recursion_cycles
+
+        yield from _function_source(index, function, config, callee, is_recursive)
+
+
+def _imported_modules(
+    index: int,
+    config: SyntheticPackageConfig,
+    rng: random.Random,
+) -> list[int]:
+    """Return the later modules imported by the module, always including the next."""
+    later = list(range(index + 1, config.modules))
+
+    if not later:
+        return []
+
+    # When in the starred import chain the next module is imported by the starred import
+    if index < config.starred_import_chain:
+        required, others = [], later[1:]
+    else:
+        required, others = later[:1], later[1:]
+
+    fan_out = min(config.import_fan_out - 1, len(others))
+
+    return [*required, *sorted(rng.sample(others, fan_out))]
+
+
+def _function_source(
+    index: int,
+    function: int,
+    config: SyntheticPackageConfig,
+    callee: str | None,
+    is_recursive: bool,
+) -> Iterator[str]:
+    name = f"fn_{index}_{function}"
+    helpers = [f"helper_{index}_{function}_{d}" for d in range(config.call_depth)]
+
+    yield f"def {name}(obj, other):"
+    yield f"    obj.attr_{function} = other.attr_{index}"
+    yield "    values = [item.value for item in other.items if item.is_enabled]"
+
+    if helpers:
+        yield f"    return {helpers[0]}(obj, values)"
+    else:
+        yield from _deepest_call(name, callee, is_recursive)
+
+    yield ""
+
+    for depth, helper in enumerate(helpers):
+        yield f"def {helper}(obj, values):"
+        yield f"    if obj.flag_{depth}:"
+        yield f"        del obj.stale_{depth}"
+
+        if depth + 1 < len(helpers):
+            yield f"    return {helpers[depth + 1]}(obj.child, values)"
+        else:
+            yield from _deepest_call(name, callee, is_recursive)
+
+        yield ""
+
+
+def _deepest_call(name: str, callee: str | None, is_recursive: bool) -> Iterator[str]:
+    if is_recursive:
+        yield "    if obj.parent is not None:"
+        yield f"        {name}(obj.parent, values)"
+
+    if callee is not None:
+        yield f"    return {callee}(obj, values)"
+    else:
+        yield "    return obj.result"
+
+
+def _target_source(config: SyntheticPackageConfig) -> Iterator[str]:
+    functions = [f"fn_0_{i}" for i in range(config.functions_per_module)]
+
+    yield f"from {config.name}.mod_0 import {', '.join(functions)}"
+    yield ""
+
+    for i, function in enumerate(functions):
+        yield f"def target_{i}(obj, other):"
+        yield f"    return {function}(obj.target, other)"
+        yield ""
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.generate",
+        description="Write a synthetic package to benchmark rattr against.",
+    )
+    parser.add_argument("root", type=Path)
+
+    for field in attrs.fields(SyntheticPackageConfig):
+        parser.add_argument(
+            f"--{field.name.replace('_', '-')}",
+            type=type(field.default),
+            default=field.default,
+            dest=field.name,
+        )
+
+    arguments = vars(parser.parse_args())
+    root = arguments.pop("root")
+
+    target = generate_package(root, SyntheticPackageConfig(**arguments))
+    print(target)
+
+
+if __name__ == "__main__":
+    main()
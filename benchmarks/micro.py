@@ -0,0 +1,590 @@
+"""Micro-benchmarks of the functions which dominate rattr's profiles.
+
+Each benchmark is a setup function, registered by `@benchmark`, which prepares the
+inputs (untimed) and returns the callable to be timed. The callable is timed by
+`timeit`, with the number of calls per repeat chosen s.t. a repeat takes at least
+`--min-time` seconds, and the fastest and the median repeat are reported per call.
+
+The results can be saved as a baseline and compared against on later runs, where a
+benchmark is a regression when its fastest time is slower than the baseline by more
+than `--tolerance` (i.e. 0.1 is 10% slower); when comparing the exit code is 1 if any
+benchmark regressed.
+
+The functions behind an `@cache` are timed cold (i.e. the caches are cleared on each
+call), as otherwise only the cache lookup is timed.
+
+Usage:
+
+    python -m benchmarks.micro [-k PATTERN] [--repeat N] [--min-time SECONDS]
+    python -m benchmarks.micro --save baseline.json
+    python -m benchmarks.micro --compare baseline.json [--tolerance 0.1]
+"""
+from __future__ import annotations
+
+import argparse
+import ast
+import json
+import platform
+import re
+import statistics
+import sys
+import timeit
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import attrs
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import Any, Final
+
+    from rattr.models.context import Context
+
+    Setup = Callable[[], Callable[[], object]]
+
+
+BENCHMARKS: Final[dict[str, Setup]] = {}
+"""The setup function of each benchmark, by name."""
+
+BENCHMARK_FILE: Final = Path(__file__).resolve()
+"""The file in which the benchmarks are run, i.e. the location of any new symbol."""
+
+DEFAULT_TOLERANCE: Final = 0.1
+
+
+def benchmark(
+    setup: Setup | None = None,
+    *,
+    name: str | None = None,
+) -> Any:
+    """Register the setup function of a benchmark, named after the setup by default."""
+
+    def register(setup: Setup) -> Setup:
+        BENCHMARKS[name or setup.__name__] = setup
+        return setup
+
+    if setup is not None:
+        return register(setup)
+
+    return register
+
+
+@attrs.frozen
+class BenchmarkResult:
+    best: float
+    """The fastest repeat, in seconds per call."""
+
+    median: float
+    """The median repeat, in seconds per call."""
+
+    number: int
+    """The number of calls per repeat."""
+
+
+@attrs.frozen
+class Comparison:
+    name: str
+    result: BenchmarkResult
+    baseline: BenchmarkResult | None
+    tolerance: float
+
+    @property
+    def change(self) -> float | None:
+        """The change in the fastest time, relative to the baseline."""
+        if self.baseline is None:
+            return None
+        return self.result.best / self.baseline.best - 1
+
+    @property
+    def is_regression(self) -> bool:
+        return self.change is not None and self.change > self.tolerance
+
+
+# ==================================================================================== #
+# Benchmarks
+# ==================================================================================== #
+
+CONTEXT_SOURCE: Final = """\
+import os
+import os.path
+from math import pi, sqrt as square_root
+from collections import *
+
+CONSTANT = 1
+
+class Class:
+    def __init__(self, a):
+        self.a = a
+
+    def method(self, b):
+        return self.a + b
+
+def fn(a, b, *args, c=None, **kwargs):
+    return a.b + b.c
+
+def other(x):
+    return fn(x, x.y)
+
+lambda_fn = lambda z: z.attr
+"""
+
+SNIPPETS: Final = {
+    "simple": """\
+def simple(a, b):
+    a.x = b.y
+    return a.z
+""",
+    "comprehensions": """\
+def comprehensions(items, lookup):
+    keys = [item.key for item in items if item.is_enabled]
+    values = {key: lookup[key].value for key in keys}
+    totals = sum(v.amount for v in values.values() if v.amount > lookup.minimum)
+    return {k.name: (v, totals) for k, v in zip(keys, values.items())}
+""",
+    "calls": """\
+def calls(obj, other):
+    obj.result = helper(obj.child, other.attr)
+    for item in other.items:
+        if item.flag:
+            process(item, obj.key, key=other.key)
+        else:
+            del item.stale
+    with other.lock as lock:
+        lock.value = getattr(obj, "name", None)
+    return obj.method(other).attr[0].final
+""",
+}
+
+
+def _compile_context(source: str = CONTEXT_SOURCE) -> Context:
+    from rattr.models.context import compile_root_context
+
+    return compile_root_context(ast.parse(source)).expand_starred_imports()
+
+
+@benchmark
+def unbind_name() -> Callable[[], object]:
+    from rattr.models.symbol import Name
+    from rattr.results._simplify_utils import unbind_name
+
+    names = [
+        *(Name(f"a.attr_{i}", "a") for i in range(50)),
+        *(Name(f"*a.attr_{i}.nested", "a") for i in range(50)),
+    ]
+
+    def run() -> None:
+        for name in names:
+            unbind_name(name, "bound")
+
+    return run
+
+
+@benchmark
+def construct_call_swaps() -> Callable[[], object]:
+    from rattr.models.symbol import Call, CallArguments, CallInterface, Func
+    from rattr.results._simplify_utils import construct_call_swaps
+
+    func = Func(
+        "fn",
+        interface=CallInterface(
+            posonlyargs=("p",),
+            args=("a", "b", "c"),
+            vararg="args",
+            kwonlyargs=("k",),
+            kwarg="kwargs",
+        ),
+    )
+    calls = [
+        Call("fn", args=CallArguments(args=("x", "y", "z", "w"))),
+        Call("fn", args=CallArguments(args=("x",), kwargs={"b": "y", "c": "z"})),
+        Call("fn", args=CallArguments(args=("x", "y"), kwargs={"k": "v", "e": "f"})),
+    ]
+
+    def run() -> None:
+        for call in calls:
+            construct_call_swaps(func, call)
+
+    return run
+
+
+@benchmark(name="Context.get_call_target")
+def context_get_call_target() -> Callable[[], object]:
+    context = _compile_context()
+    culprit = ast.parse("fn()").body[0]
+
+    callees = [
+        "fn()",
+        "other()",
+        "Class()",
+        "Class.method()",
+        "lambda_fn()",
+        "os.path.join()",
+        "square_root()",
+        "print()",
+        "undefined()",
+    ]
+
+    def run() -> None:
+        for callee in callees:
+            context.get_call_target(callee, culprit, warn=False)
+
+    return run
+
+
+@benchmark(name="Context.__getitem__")
+def context_getitem() -> Callable[[], object]:
+    from rattr.models.context import Context
+    from rattr.models.symbol import Name
+
+    context = _compile_context()
+
+    # i.e. a name resolved from within a nested function, in a method, in a class
+    for depth in range(3):
+        context = Context(parent=context)
+        context.add(Name(f"local_{depth}"))
+
+    names = ["local_2", "local_0", "fn", "Class", "os", "pi", "CONSTANT", "print"]
+
+    def run() -> None:
+        for name in names:
+            context[name]
+
+    return run
+
+
+@benchmark
+def find_module_spec_fast() -> Callable[[], object]:
+    from rattr.module_locator._locate import locate_module_in_python_path
+    from rattr.module_locator.util import find_module_spec_fast
+
+    modules = ["os.path", "json", "attrs", "rattr.models.symbol", "not.a.module"]
+
+    def run() -> None:
+        find_module_spec_fast.cache_clear()
+        locate_module_in_python_path.cache_clear()
+
+        for module in modules:
+            find_module_spec_fast(module)
+
+    return run
+
+
+@benchmark
+def derive_module_name_from_path() -> Callable[[], object]:
+    from rattr import models
+    from rattr.module_locator._locate import locate_module_in_python_path
+    from rattr.module_locator.util import (
+        derive_module_name_from_path,
+        find_module_spec_fast,
+    )
+
+    files = [
+        Path(models.__file__).parent / "symbol" / "_symbols.py",
+        Path(models.__file__).parent / "context" / "__init__.py",
+        Path(ast.__file__),
+    ]
+
+    def run() -> None:
+        derive_module_name_from_path.cache_clear()
+        find_module_spec_fast.cache_clear()
+        locate_module_in_python_path.cache_clear()
+
+        for file in files:
+            derive_module_name_from_path(file)
+
+    return run
+
+
+def _cacheable_results() -> Any:
+    from rattr.models.results import CacheableResults, FileResults, FunctionResults
+    from rattr.models.results.cacheable import CacheableImportInfo
+
+    results = FileResults(
+        {
+            f"fn_{i}": FunctionResults.new(
+                gets={f"a.get_{j}" for j in range(10)},
+                sets={f"b.set_{j}" for j in range(5)},
+                dels={f"c.del_{j}" for j in range(2)},
+                calls={f"fn_{i + 1}()", "print()"},
+            )
+            for i in range(100)
+        }
+    )
+
+    return CacheableResults(
+        version="0.0.0",
+        arguments_hash="arguments",
+        plugins_hash="plugins",
+        filepath=Path("/path/to/target.py"),
+        filehash="filehash",
+        imports=[
+            CacheableImportInfo(filepath=Path(f"/path/to/module_{i}.py"), filehash="")
+            for i in range(20)
+        ],
+        results=results,
+    )
+
+
+@benchmark(name="serialise[CacheableResults]")
+def serialise_cacheable_results() -> Callable[[], object]:
+    from rattr.models.util import serialise
+
+    results = _cacheable_results()
+
+    def run() -> None:
+        serialise(results)
+
+    return run
+
+
+@benchmark(name="deserialise[CacheableResults]")
+def deserialise_cacheable_results() -> Callable[[], object]:
+    from rattr.models.results import CacheableResults
+    from rattr.models.util import deserialise, serialise
+
+    serialised = serialise(_cacheable_results())
+
+    def run() -> None:
+        deserialise(serialised, type=CacheableResults)
+
+    return run
+
+
+def _function_analyser(snippet: str) -> Setup:
+    def setup() -> Callable[[], object]:
+        from rattr.analyser.function import FunctionAnalyser
+
+        context = _compile_context(CONTEXT_SOURCE + SNIPPETS[snippet])
+        function = ast.parse(SNIPPETS[snippet]).body[0]
+
+        def run() -> None:
+            FunctionAnalyser(function, context).analyse()
+
+        return run
+
+    return setup
+
+
+for _snippet in SNIPPETS:
+    benchmark(
+        _function_analyser(_snippet),
+        name=f"FunctionAnalyser.analyse[{_snippet}]",
+    )
+
+
+# ==================================================================================== #
+# Runner
+# ==================================================================================== #
+
+
+def run_benchmark(
+    setup: Setup,
+    *,
+    repeat: int = 5,
+    min_time: float = 0.2,
+) -> BenchmarkResult:
+    """Return the timing of the callable given by the setup, see `--min-time`."""
+    timer = timeit.Timer(setup())
+
+    number = 1
+    while timer.timeit(number) < min_time:
+        number *= 2
+
+    times = [time / number for time in timer.repeat(repeat=repeat, number=number)]
+
+    return BenchmarkResult(
+        best=min(times),
+        median=statistics.median(times),
+        number=number,
+    )
+
+
+def run_benchmarks(
+    pattern: str | None = None,
+    *,
+    repeat: int = 5,
+    min_time: float = 0.2,
+) -> dict[str, BenchmarkResult]:
+    """Return the timing of each benchmark matching the pattern (or every benchmark)."""
+    from rattr.config.state import enter_file
+
+    results: dict[str, BenchmarkResult] = {}
+
+    with enter_file(BENCHMARK_FILE):
+        for name, setup in BENCHMARKS.items():
+            if pattern is not None and re.search(pattern, name) is None:
+                continue
+
+            results[name] = run_benchmark(setup, repeat=repeat, min_time=min_time)
+
+    return results
+
+
+def compare(
+    results: dict[str, BenchmarkResult],
+    baseline: dict[str, BenchmarkResult],
+    *,
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> list[Comparison]:
+    """Return the comparison of each result to its baseline, if any."""
+    return [
+        Comparison(
+            name=name,
+            result=result,
+            baseline=baseline.get(name),
+            tolerance=tolerance,
+        )
+        for name, result in results.items()
+    ]
+
+
+def save_baseline(file: Path, results: dict[str, BenchmarkResult]) -> None:
+    from rattr import _version
+
+    baseline = {
+        "rattr": _version.version,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "benchmarks": {name: attrs.asdict(result) for name, result in results.items()},
+    }
+
+    file.write_text(json.dumps(baseline, indent=4) + "\n")
+
+
+def load_baseline(file: Path) -> dict[str, BenchmarkResult]:
+    baseline = json.loads(file.read_text())
+
+    return {
+        name: BenchmarkResult(**result)
+        for name, result in baseline["benchmarks"].items()
+    }
+
+
+def show_comparisons(comparisons: list[Comparison]) -> None:
+    """Prettily print the results, and the change from the baseline if any."""
+    width = max(len(c.name) for c in comparisons)
+    row = f"{{:{width}}} | {{:>12}} | {{:>12}} | {{:>12}} | {{:>8}} | {{}}"
+
+    header = row.format("", "Best (us)", "Median (us)", "Baseline", "Change", "")
+    print(header)
+    print("=" * len(header))
+
+    for comparison in comparisons:
+        result, baseline, change = (
+            comparison.result,
+            comparison.baseline,
+            comparison.change,
+        )
+
+        if change is None:
+            status = ""
+        elif comparison.is_regression:
+            status = "REGRESSION"
+        elif change < -comparison.tolerance:
+            status = "improved"
+        else:
+            status = "ok"
+
+        print(
+            row.format(
+                comparison.name,
+                format(result.best * 1e6, ".3f"),
+                format(result.median * 1e6, ".3f"),
+                format(baseline.best * 1e6, ".3f") if baseline is not None else "-",
+                format(change, "+.1%") if change is not None else "-",
+                status,
+            )
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.micro",
+        description="Micro-benchmark the functions which dominate rattr's profiles.",
+    )
+    parser.add_argument(
+        "-k",
+        default=None,
+        help="only run the benchmarks matching the given pattern",
+        metavar="PATTERN",
+        dest="pattern",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="the number of repeats of each benchmark (default: %(default)s)",
+        metavar="N",
+    )
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=0.2,
+        help="the minimum time of each repeat (default: %(default)s)",
+        metavar="SECONDS",
+    )
+    parser.add_argument(
+        "--save",
+        type=Path,
+        default=None,
+        help="save the results as a baseline to the given file",
+        metavar="FILE",
+    )
+    parser.add_argument(
+        "--compare",
+        type=Path,
+        default=None,
+        help="compare the results to the baseline in the given file",
+        metavar="FILE",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=DEFAULT_TOLERANCE,
+        help=(
+            "the slow-down relative to the baseline allowed before a benchmark is a "
+            "regression (default: %(default)s, i.e. 10%%)"
+        ),
+    )
+
+    arguments = parser.parse_args()
+
+    _init_rattr_config()
+
+    results = run_benchmarks(
+        arguments.pattern,
+        repeat=arguments.repeat,
+        min_time=arguments.min_time,
+    )
+
+    if arguments.compare is not None:
+        baseline = load_baseline(arguments.compare)
+    else:
+        baseline = {}
+
+    comparisons = compare(results, baseline, tolerance=arguments.tolerance)
+    show_comparisons(comparisons)
+
+    if arguments.save is not None:
+        save_baseline(arguments.save, results)
+
+    if any(comparison.is_regression for comparison in comparisons):
+        return 1
+
+    return 0
+
+
+def _init_rattr_config() -> None:
+    from rattr.cli import parse_arguments
+    from rattr.config import Config, State
+
+    arguments = parse_arguments(
+        sys_args=["--warning-level", "none", str(BENCHMARK_FILE)],
+        project_toml_conf={},
+    )
+    Config(arguments=arguments, state=State())
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,258 @@
+"""Measure how rattr scales with the size of the analysed code, see `SIZES`.
+
+For each size a synthetic package is generated (see `benchmarks.generate`) and the
+full pipeline, i.e. `parse_and_analyse_file` then `generate_results_from_ir`, is run
+against its target. The time of each phase, the lines analysed per second, and the peak
+RSS are reported as JSON.
+
+Each run is made in a fresh interpreter, s.t. the peak RSS is that of the run alone and
+the module locator's caches are cold; the fastest of `--repeat` runs is reported.
+
+Given `--jobs`, each size is run once per number of jobs (see `rattr --jobs`), s.t. the
+speedup of the parallel analysis and results over `--jobs 1` can be compared. The
+"deep" size, whose call trees are long, is the slowest to simplify by the call tree
+engine; the speedup is bounded by the number of CPUs, which is reported.
+
+Usage:
+
+    python -m benchmarks.scaling [--sizes small medium ...] [--jobs 1 4 ...]
+        [--repeat N] [-o FILE]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import attrs
+
+from benchmarks.generate import SyntheticPackageConfig, generate_package
+
+if TYPE_CHECKING:
+    from typing import Any, Final
+
+
+SIZES: Final = {
+    "tiny": SyntheticPackageConfig(modules=5, functions_per_module=5),
+    "small": SyntheticPackageConfig(modules=20, functions_per_module=10),
+    "medium": SyntheticPackageConfig(modules=100, functions_per_module=20),
+    "large": SyntheticPackageConfig(modules=400, functions_per_module=25),
+    "huge": SyntheticPackageConfig(modules=1000, functions_per_module=25),
+    "deep": SyntheticPackageConfig(
+        modules=4,
+        functions_per_module=200,
+        call_depth=25,
+        starred_import_chain=3,
+    ),
+}
+"""The generated package of each size, "huge" is roughly 500k lines."""
+
+DEFAULT_SIZES: Final = ("small", "medium", "large")
+
+REPOSITORY_ROOT: Final = Path(__file__).resolve().parents[1]
+
+
+def run_benchmark(config: SyntheticPackageConfig, *, jobs: int = 1) -> dict[str, Any]:
+    """Return the measurements of a run against the package, in a fresh interpreter."""
+    process = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "benchmarks.scaling",
+            "--run-one",
+            json.dumps(attrs.asdict(config)),
+            "--run-jobs",
+            str(jobs),
+        ],
+        capture_output=True,
+        check=True,
+        cwd=REPOSITORY_ROOT,
+        text=True,
+    )
+
+    return json.loads(process.stdout)
+
+
+def run_one(config: SyntheticPackageConfig, *, jobs: int = 1) -> dict[str, Any]:
+    """Return the measurements of a run against the package, in this interpreter."""
+    # NB: Imported here, s.t. the run includes the cost of importing rattr
+    from rattr.analyser.file import parse_and_analyse_file
+    from rattr.analyser.util import peak_rss, timer
+    from rattr.cli import parse_arguments
+    from rattr.config import Config, State
+    from rattr.config.state import enter_target
+    from rattr.results import generate_results_from_ir
+
+    with tempfile.TemporaryDirectory() as directory:
+        root = Path(directory).resolve()
+        target = generate_package(root, config)
+
+        # The module locator looks in the working dir, i.e. `sys.path[0]`
+        os.chdir(root)
+        sys.path.insert(0, str(root))
+
+        arguments = parse_arguments(
+            sys_args=[
+                *("--warning-level", "none"),
+                *("--stdout", "silent"),
+                *("--jobs", str(jobs)),
+                str(target),
+            ],
+            project_toml_conf={},
+        )
+        rattr_config = Config(arguments=arguments, state=State())
+
+        baseline_rss = peak_rss()
+
+        with enter_target(target), timer() as total:
+            file_ir, import_irs, stats = parse_and_analyse_file()
+
+            with timer() as results_timer:
+                generate_results_from_ir(target_ir=file_ir, import_irs=import_irs)
+
+    lines = stats.file_lines + stats.import_lines
+
+    return {
+        "lines": lines,
+        "modules": stats.number_of_unique_imports + 1,
+        "functions": len(file_ir) + sum(len(ir) for ir in import_irs.values()),
+        "time": {
+            "parse": stats.parse_time,
+            "root_context": stats.root_context_time,
+            "assert": stats.assert_time,
+            "analyse_imports": stats.analyse_imports_time,
+            "analyse_file": stats.analyse_file_time,
+            "results": results_timer.time,
+            "total": total.time,
+        },
+        "lines_per_second": lines / total.time,
+        "peak_rss": peak_rss(),
+        "baseline_rss": baseline_rss,
+        "badness": rattr_config.state.full_badness,
+    }
+
+
+def run_benchmarks(
+    sizes: list[str],
+    *,
+    jobs: list[int] | None = None,
+    repeat: int = 1,
+) -> dict[str, Any]:
+    """Return the report of the fastest of `repeat` runs at each of the given sizes.
+
+    Given more than one number of jobs, the speedup of each over the first is reported.
+    """
+    from rattr import _version
+
+    if jobs is None:
+        jobs = [1]
+
+    benchmarks: list[dict[str, Any]] = []
+
+    for size in sizes:
+        config = SIZES[size]
+        baseline: dict[str, Any] | None = None
+
+        for jobs_ in jobs:
+            runs = [run_benchmark(config, jobs=jobs_) for _ in range(repeat)]
+            fastest = min(runs, key=lambda run: run["time"]["total"])
+
+            benchmark = {
+                "size": size,
+                "config": attrs.asdict(config),
+                "jobs": jobs_,
+                **fastest,
+            }
+
+            if baseline is None:
+                baseline = fastest
+            else:
+                benchmark["speedup"] = {
+                    phase: baseline["time"][phase] / fastest["time"][phase]
+                    for phase in ("analyse_imports", "results", "total")
+                }
+
+            benchmarks.append(benchmark)
+
+    return {
+        "rattr": _version.version,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "repeat": repeat,
+        "benchmarks": benchmarks,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.scaling",
+        description="Measure how rattr scales with the size of the analysed code.",
+    )
+    parser.add_argument(
+        "--sizes",
+        nargs="+",
+        choices=list(SIZES),
+        default=list(DEFAULT_SIZES),
+        help="the sizes to run (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--jobs",
+        nargs="+",
+        type=int,
+        default=[1],
+        help=(
+            "run each size with each number of jobs, 0 for one per CPU "
+            "(default: %(default)s)"
+        ),
+        metavar="N",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=1,
+        help="report the fastest of N runs of each size (default: %(default)s)",
+        metavar="N",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        default=None,
+        help="write the report to the given file rather than to stdout",
+        metavar="FILE",
+    )
+    parser.add_argument("--run-one", default=None, help=argparse.SUPPRESS)
+    parser.add_argument("--run-jobs", type=int, default=1, help=argparse.SUPPRESS)
+
+    arguments = parser.parse_args()
+
+    if arguments.run_one is not None:
+        config = SyntheticPackageConfig(**json.loads(arguments.run_one))
+        print(json.dumps(run_one(config, jobs=arguments.run_jobs)))
+        return
+
+    report = json.dumps(
+        run_benchmarks(
+            arguments.sizes,
+            jobs=arguments.jobs,
+            repeat=arguments.repeat,
+        ),
+        indent=4,
+    )
+
+    if arguments.output is not None:
+        arguments.output.write_text(report + "\n")
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
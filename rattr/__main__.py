@@ -1,39 +1,157 @@
 #!/usr/bin/env python3
-"""Rattr entry point."""
+"""Rattr entry point.
+
+NB: The analyser, the results, and the (de)serialisation are imported on first use,
+s.t. `--help`, `--version`, and an up-to-date cache do not pay for them at startup
+(see `tests/test_startup.py`).
+"""
 from __future__ import annotations
 
+import sys
+from contextlib import ExitStack
 from math import log10
 from typing import TYPE_CHECKING
 
 from rattr import error
-from rattr.analyser.file import RattrStats, parse_and_analyse_file
-from rattr.analyser.types import ImportIrs
 from rattr.cli import parse_arguments
 from rattr.cli.exit_codes import EXIT_SUCCESS
-from rattr.config import Config, Output, State
-from rattr.extra.functools import deferred_execute_once
-from rattr.models.ir import FileIr
-from rattr.models.results import FileResults
-from rattr.models.results.util import (
-    make_cacheable_results,
-    target_cache_file_is_up_to_date,
-)
-from rattr.models.util import serialise, serialise_irs
-from rattr.results import generate_results_from_ir
+from rattr.cli.parser import parse_serve_arguments
+from rattr.config import Config, Output, ResultsEngine, State
+from rattr.config.state import enter_target
+from rattr.error.diagnostics import diagnostics
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+    from concurrent.futures import Executor
     from pathlib import Path
-    from typing import NoReturn
+    from typing import Any, Final, NoReturn
+
+    from rattr.analyser.file import AnalysedImports, RattrStats
+    from rattr.analyser.instrumentation import VisitStats
+    from rattr.analyser.types import ImportIrs
+    from rattr.analyser.util import MemoryUsage
+    from rattr.models.ir import FileIr
+    from rattr.models.results import (
+        CacheableResults,
+        FileResults,
+        FunctionName,
+        FunctionResults,
+    )
+    from rattr.results import FunctionSummaries
+    from rattr.versioning.typing import TypeAlias
 
-    from rattr.models.results import CacheableResults
+    BatchOutputs: TypeAlias = dict[str, Any]
+    """The JSON output of each target in batch mode, keyed by target."""
 
 
 def _init_rattr_config() -> Config:
     return Config(arguments=parse_arguments(), state=State())
 
 
+def _init_rattr_serve_config() -> Config:
+    return Config(arguments=parse_serve_arguments(sys_args=sys.argv[2:]), state=State())
+
+
 def main(config: Config) -> int:
     """Rattr entry point."""
+    from rattr.extra.tracing import span
+
+    analysed_imports: AnalysedImports = {}
+
+    if config.arguments.is_in_batch_mode:
+        batch_outputs: BatchOutputs | None = {}
+    else:
+        batch_outputs = None
+
+    if config.arguments.memory_stats:
+        import tracemalloc
+
+        tracemalloc.start()
+
+    # NB: Only the SCC engine reads the summaries, see `generate_results_from_ir`
+    if config.arguments.results_engine == ResultsEngine.scc and (
+        config.arguments.is_in_batch_mode or config.arguments.cache_summaries
+    ):
+        from rattr.results import FunctionSummaries
+
+        summaries = FunctionSummaries(persist=config.arguments.cache_summaries)
+    else:
+        summaries = None
+
+    with ExitStack() as stack:
+        diagnostics.reset(buffered=True)
+        stack.callback(diagnostics.flush)
+
+        if batch_outputs is not None:
+            stack.callback(show_batch_outputs, batch_outputs)
+
+        if config.arguments.diagnostics is not None:
+            stack.callback(write_diagnostics_file, config.arguments.diagnostics)
+
+        if config.arguments.trace is not None:
+            from rattr.extra.tracing import tracer
+
+            tracer.start()
+            stack.callback(write_trace_file, config.arguments.trace)
+
+        if config.arguments.profile is not None:
+            from rattr.extra.profiling import profiler
+
+            profiler.start()
+            stack.callback(write_profile_files, config.arguments.profile)
+
+        if config.arguments.visitor_stats:
+            from rattr.analyser.instrumentation import instrumentation
+
+            instrumentation.start()
+            stack.callback(instrumentation.stop)
+
+        if config.arguments.jobs != 1:
+            from rattr.analyser.parallel import make_import_executor
+
+            executor = stack.enter_context(make_import_executor())
+        else:
+            executor = None
+
+        for target in config.arguments.targets:
+            with enter_target(target), span(str(target), "target"):
+                exit_code = main_for_target(
+                    config,
+                    analysed_imports=analysed_imports,
+                    executor=executor,
+                    summaries=summaries,
+                    batch_outputs=batch_outputs,
+                )
+
+            if exit_code != EXIT_SUCCESS:
+                return exit_code
+
+    return EXIT_SUCCESS
+
+
+def main_for_target(
+    config: Config,
+    *,
+    analysed_imports: AnalysedImports,
+    executor: Executor | None = None,
+    summaries: FunctionSummaries | None = None,
+    batch_outputs: BatchOutputs | None = None,
+) -> int:
+    """Rattr entry point for the current target.
+
+    In batch mode (i.e. multiple targets) the analysed imports are shared between the
+    targets and the outputs are given per target; the JSON outputs are added to
+    `batch_outputs`, to be shown as a single JSON object keyed by target.
+
+    When given, the executor is used to analyse the imports in parallel, and the
+    summaries of imported functions are used and updated by the results generation.
+    """
+    from rattr.extra.functools import deferred_execute_once
+    from rattr.models.results.util import (
+        make_cacheable_results,
+        target_cache_file_is_up_to_date,
+    )
+
     if (cached := config.arguments.cache_file) is not None:
         if config.arguments.force_refresh_cache:
             cached.unlink(missing_ok=True)
@@ -41,8 +159,21 @@ def main(config: Config) -> int:
             error.info("cache is up-to-date, doing nothing")
             return EXIT_SUCCESS
 
-    file_ir, import_irs, stats = parse_and_analyse_file()
-    results = generate_results_from_ir(target_ir=file_ir, import_irs=import_irs)
+    if config.arguments.stdout == Output.ndjson:
+        on_function_results = show_function_results
+    else:
+        on_function_results = None
+
+    file_ir, import_irs, stats, results = analyse_target(
+        analysed_imports=analysed_imports,
+        executor=executor,
+        summaries=summaries,
+        on_function_results=on_function_results,
+    )
+
+    # Show the errors, warnings, etc of the target before its outputs
+    diagnostics.flush()
+
     deferred_cacheable_results = deferred_execute_once(
         make_cacheable_results,
         results=results,
@@ -50,46 +181,149 @@ def main(config: Config) -> int:
         import_irs=import_irs,
     )
 
-    if not config.is_within_badness_threshold:
-        badness, threshold = config.state.badness, config.arguments.threshold
-        error.fatal(f"exceeded allowed badness ({badness} > {threshold})")
-
     if config.arguments.stdout == Output.ir:
-        show_ir(config.arguments.target, file_ir, import_irs)
+        show_ir(config.arguments.target, file_ir, import_irs, batch_outputs)
 
     if config.arguments.stdout == Output.results:
-        show_results(results)
+        show_results(results, batch_outputs)
 
     if config.arguments.stdout == Output.cacheable:
-        show_cacheable_results(deferred_cacheable_results())
+        show_cacheable_results(deferred_cacheable_results(), batch_outputs)
 
     if config.arguments.stdout == Output.stats:
         show_stats(stats)
 
+    if config.arguments.stdout == Output.stats_json:
+        show_stats_json(stats, batch_outputs)
+
     if config.arguments.cache_file is not None:
         write_cache_file(config.arguments.cache_file, deferred_cacheable_results())
 
     return EXIT_SUCCESS
 
 
-def show_ir(file: Path, file_ir: FileIr, import_irs: ImportIrs) -> None:
+def analyse_target(
+    *,
+    analysed_imports: AnalysedImports,
+    executor: Executor | None = None,
+    summaries: FunctionSummaries | None = None,
+    on_function_results: Callable[[FunctionName, FunctionResults], None] | None = None,
+) -> tuple[FileIr, ImportIrs, RattrStats, FileResults]:
+    """Return the IR, stats, and results of the current target, see `main_for_target`.
+
+    When given, `on_function_results` is called with the results of each function as
+    soon as they are ready.
+
+    NB: Exits if the badness threshold is exceeded.
+    """
+    from rattr.analyser.file import parse_and_analyse_file
+    from rattr.analyser.util import memory_usage
+    from rattr.extra.profiling import profile_phase
+    from rattr.extra.tracing import span
+    from rattr.models.results import FileResults
+    from rattr.results import iter_results_from_ir
+
+    config = Config()
+
+    file_ir, import_irs, stats = parse_and_analyse_file(
+        analysed_imports,
+        executor=executor,
+    )
+
+    results = FileResults()
+
+    with memory_usage() as results_memory, span("results", "target"):
+        with profile_phase("results"):
+            for function, function_results in iter_results_from_ir(
+                target_ir=file_ir,
+                import_irs=import_irs,
+                summaries=summaries,
+            ):
+                results[function] = function_results
+
+                if on_function_results is not None:
+                    on_function_results(function, function_results)
+
+            if summaries is not None:
+                summaries.flush()
+
+    if results_memory.usage is not None:
+        stats.memory["results"] = results_memory.usage
+
+    if not config.is_within_badness_threshold:
+        badness, threshold = config.state.badness, config.arguments.threshold
+        error.fatal(f"exceeded allowed badness ({badness} > {threshold})")
+
+    return file_ir, import_irs, stats, results
+
+
+def show_ir(
+    file: Path,
+    file_ir: FileIr,
+    import_irs: ImportIrs,
+    batch_outputs: BatchOutputs | None = None,
+) -> None:
     """Prettily print the given file and imports IR."""
-    serialised = serialise_irs(
-        target_name=str(file),
-        target_ir=file_ir,
+    from rattr.models.util import OutputIrs
+
+    output = OutputIrs(
         import_irs=import_irs,
+        target_ir={"filename": str(file), "ir": file_ir},
     )
-    print(serialised)
+    _show_json(output, batch_outputs)
 
 
-def show_cacheable_results(results: CacheableResults) -> None:
+def show_cacheable_results(
+    results: CacheableResults,
+    batch_outputs: BatchOutputs | None = None,
+) -> None:
     """Prettily print the given file results."""
-    print(serialise(results, indent=4))
+    _show_json(results, batch_outputs)
 
 
-def show_results(results: FileResults) -> None:
+def show_results(
+    results: FileResults,
+    batch_outputs: BatchOutputs | None = None,
+) -> None:
     """Prettily print the given file results."""
-    print(serialise(results, indent=4))
+    _show_json(results, batch_outputs)
+
+
+def show_function_results(function: FunctionName, results: FunctionResults) -> None:
+    """Print the given function's results as a single line of JSON (i.e. NDJSON)."""
+    from rattr.models.results import sort_function_results
+    from rattr.models.util import serialise
+
+    config = Config()
+    record = {
+        "target": str(config.arguments.target),
+        "function": function,
+        "results": sort_function_results(results),
+    }
+
+    print(serialise(record), flush=True)
+
+
+def show_batch_outputs(batch_outputs: BatchOutputs) -> None:
+    """Prettily print the JSON outputs of the targets, keyed by target."""
+    from rattr.models.util import serialise
+
+    if not batch_outputs:
+        return
+
+    print(serialise(batch_outputs, indent=4))
+
+
+def _show_json(output: Any, batch_outputs: BatchOutputs | None) -> None:
+    """Prettily print the output, or in batch mode add it to the batch outputs."""
+    from rattr.models.util import serialise
+
+    if batch_outputs is None:
+        print(serialise(output, indent=4))
+        return
+
+    config = Config()
+    batch_outputs[str(config.arguments.target)] = output
 
 
 def show_stats(stats: RattrStats) -> None:
@@ -97,6 +331,10 @@ def show_stats(stats: RattrStats) -> None:
     row = "{:26} | {:18}"
     config = Config()
 
+    if config.arguments.is_in_batch_mode:
+        print(end="\n\n")
+        print(f"Stats for {config.formatted_target_path}")
+
     # Collate time stats
     table_header = row.format("", "Time (Seconds)")
     table_width = len(table_header)
@@ -115,6 +353,12 @@ def show_stats(stats: RattrStats) -> None:
     for col_one, col_two in times.items():
         print(row.format(col_one, format(col_two, ".9f") + " s"))
 
+    if stats.memory:
+        show_memory_stats(stats)
+
+    if stats.visitors is not None:
+        show_visitor_stats(stats)
+
     # Collate imports stats
     table_header = row.format("", "# of Imports")
     table_width = len(table_header)
@@ -200,13 +444,195 @@ def show_stats(stats: RattrStats) -> None:
     print(end="\n\n")
 
 
+def show_memory_stats(stats: RattrStats) -> None:
+    """Prettily print the memory usage by phase, and of the largest imports."""
+    row = "{:26} | {:>12} | {:>14} | {:>14}"
+
+    table_header = row.format("", "Peak (MiB)", "Retained (MiB)", "Peak RSS (MiB)")
+    table_width = len(table_header)
+
+    print(end="\n\n")
+    print(table_header)
+    print("=" * table_width)
+    for phase, usage in stats.memory.items():
+        print(
+            row.format(
+                MEMORY_PHASES.get(phase, phase),
+                _format_mib(usage.peak),
+                _format_mib(usage.retained),
+                _format_mib(usage.peak_rss),
+            )
+        )
+
+    if not stats.memory_by_import:
+        return
+
+    row = "{:26} | {:>14}"
+
+    table_header = row.format("Largest imports", "Retained (MiB)")
+    table_width = len(table_header)
+
+    print(end="\n\n")
+    print(table_header)
+    print("=" * table_width)
+    for module, usage in _largest_imports(stats)[:LARGEST_IMPORTS]:
+        print(row.format(module, _format_mib(usage.retained)))
+
+
+MEMORY_PHASES: Final = {
+    "parse": "Parse <file>",
+    "root_context": "Build root context",
+    "assert": "Run assertor",
+    "analyse_imports": "Parse / analyse imports",
+    "analyse_file": "Analyse <file>",
+    "results": "Generate results",
+}
+
+
+LARGEST_IMPORTS: Final = 10
+
+
+def _largest_imports(stats: RattrStats) -> list[tuple[str, MemoryUsage]]:
+    return sorted(
+        stats.memory_by_import.items(),
+        key=lambda item: item[1].retained,
+        reverse=True,
+    )
+
+
+def _format_mib(size: int | None) -> str:
+    if size is None:
+        return "-"
+
+    # NB: Adding 0.0 avoids printing "-0.000" for a small negative size
+    return format(round(size / 2**20, 3) + 0.0, ".3f")
+
+
+def show_visitor_stats(stats: RattrStats) -> None:
+    """Prettily print the most expensive visits by node type and by method."""
+    from rattr.analyser.instrumentation import by_own_time
+
+    if stats.visitors is None:
+        return
+
+    row = "{:50} | {:>11} | {:>12} | {:>12}"
+
+    for description, visits in (
+        ("Node type", stats.visitors.by_node_type),
+        ("Method", stats.visitors.by_method),
+    ):
+        table_header = row.format(
+            description,
+            "# of Visits",
+            "Time (s)",
+            "Own Time (s)",
+        )
+        table_width = len(table_header)
+
+        print(end="\n\n")
+        print(table_header)
+        print("=" * table_width)
+        for key, visit_stats in by_own_time(visits)[:MOST_EXPENSIVE_VISITS]:
+            print(
+                row.format(
+                    key,
+                    visit_stats.count,
+                    format(visit_stats.time, ".6f"),
+                    format(visit_stats.own_time, ".6f"),
+                )
+            )
+
+
+MOST_EXPENSIVE_VISITS: Final = 20
+
+
+def show_stats_json(
+    stats: RattrStats,
+    batch_outputs: BatchOutputs | None = None,
+) -> None:
+    """Print the collected stats as JSON."""
+    config = Config()
+    record = {
+        "time": {
+            "parse": stats.parse_time,
+            "root_context": stats.root_context_time,
+            "assert": stats.assert_time,
+            "analyse_imports": stats.analyse_imports_time,
+            "analyse_file": stats.analyse_file_time,
+        },
+        "imports": {
+            "total": stats.number_of_imports,
+            "unique": stats.number_of_unique_imports,
+        },
+        "lines": {
+            "file": stats.file_lines,
+            "imports": stats.import_lines,
+        },
+        "badness": {
+            "total": config.state.full_badness,
+            "from_file": config.state.badness_from_target_file,
+            "from_imports": config.state.badness_from_imports,
+            "from_simplification": config.state.badness_from_simplification,
+            "true": config.state.badness,
+            "threshold": config.arguments.threshold,
+        },
+        "memory": stats.memory,
+        "memory_by_import": dict(_largest_imports(stats)),
+        "visitors": _visitors_by_own_time(stats),
+    }
+
+    _show_json(record, batch_outputs)
+
+
+def _visitors_by_own_time(
+    stats: RattrStats,
+) -> dict[str, dict[str, VisitStats]] | None:
+    from rattr.analyser.instrumentation import by_own_time
+
+    if stats.visitors is None:
+        return None
+
+    return {
+        "by_node_type": dict(by_own_time(stats.visitors.by_node_type)),
+        "by_method": dict(by_own_time(stats.visitors.by_method)),
+    }
+
+
 def write_cache_file(cache_file: Path, results: CacheableResults) -> None:
+    from rattr.models.results.util import serialise_for_cache
+
     cache_file.parent.mkdir(parents=True, exist_ok=True)
-    cache_file.write_text(serialise(results, indent=4))
+    cache_file.write_bytes(serialise_for_cache(results, indent=4))
+
+
+def write_trace_file(trace_file: Path) -> None:
+    """Write the spans recorded thus far to the given file, see `--trace`."""
+    from rattr.extra.tracing import tracer, write_trace
+
+    write_trace(trace_file, tracer.stop())
+
+
+def write_diagnostics_file(diagnostics_file: Path) -> None:
+    """Write the errors, warnings, etc to the given file, see `--diagnostics`."""
+    from rattr.error.diagnostics import write_diagnostics
+
+    write_diagnostics(diagnostics_file, diagnostics.records.values())
+
+
+def write_profile_files(profile_dir: Path) -> None:
+    """Write the profile of each phase to the given directory, see `--profile`."""
+    from rattr.extra.profiling import profiler, write_profiles
+
+    write_profiles(profile_dir, profiler.stop())
 
 
 def entry_point() -> NoReturn:
-    """Entry point for command line app."""
+    """Entry point for command line app, `rattr serve ...` runs the daemon."""
+    if sys.argv[1:2] == ["serve"]:
+        from rattr.server import serve
+
+        exit(serve(_init_rattr_serve_config()))
+
     exit(main(_init_rattr_config()))
 
 
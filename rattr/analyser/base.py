@@ -7,10 +7,13 @@ from ast import NodeVisitor
 from typing import TYPE_CHECKING
 
 from rattr import error
+from rattr.analyser.multiplex import is_multiplexable, multiplex
 from rattr.analyser.types import FunctionIr
 from rattr.models.context import Context
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from rattr.ast.types import Identifier
 
 
@@ -24,16 +27,27 @@ class Assertor(NodeVisitor):
         not is_strict:
             on condition failure, log warning
 
+    An assertor which gives `enter_<NodeType>`/`leave_<NodeType>` handlers, rather than
+    overriding `visit_<NodeType>`, is run in a single pass of the tree alongside the
+    other such assertors (see `rattr.analyser.multiplex` and `run_assertors`).
+
     """
 
     def __init__(self, is_strict: bool = True) -> None:
         self.is_strict: bool = is_strict
 
+    @property
+    def is_multiplexable(self) -> bool:
+        return is_multiplexable(self)
+
     def assert_holds(self, node: ast.AST, context: Context) -> None:
         """Entry point for an Assertor, visit the tree to assert properties."""
         self.context = context
 
-        super().visit(node)
+        if self.is_multiplexable:
+            multiplex(node, [self])
+        else:
+            super().visit(node)
 
     def failed(self, message: str, culprit: ast.AST | None = None) -> None:
         """Handle assertion failure."""
@@ -45,6 +59,30 @@ class Assertor(NodeVisitor):
         handler(message, culprit)
 
 
+def run_assertors(
+    assertors: Iterable[Assertor],
+    node: ast.AST,
+    context: Context,
+) -> None:
+    """Run the assertors, each with its own copy of the context.
+
+    The multiplexable assertors are run together in a single pass of the tree, followed
+    by the remaining assertors in turn.
+    """
+    multiplexed: list[Assertor] = []
+
+    for assertor in assertors:
+        if assertor.is_multiplexable:
+            assertor.context = context.copy_on_write()
+            multiplexed.append(assertor)
+
+    multiplex(node, multiplexed)
+
+    for assertor in assertors:
+        if not assertor.is_multiplexable:
+            assertor.assert_holds(node, context.copy_on_write())
+
+
 class CustomFunctionAnalyser(NodeVisitor, metaclass=ABCMeta):
     """Base class for a custom function visitor."""
 
@@ -2,20 +2,22 @@
 from __future__ import annotations
 
 import ast
-import copy
 from collections import deque
+from contextlib import ExitStack
 from typing import TYPE_CHECKING
 
 import attrs
 
 from rattr import error
-from rattr.analyser.base import NodeVisitor
+from rattr.analyser.base import NodeVisitor, run_assertors
 from rattr.analyser.cls import ClassAnalyser
 from rattr.analyser.function import FunctionAnalyser
+from rattr.analyser.instrumentation import instrumentation
 from rattr.analyser.types import ImportIrs
 from rattr.analyser.util import (
     has_annotation,
     is_excluded_name,
+    memory_usage,
     parse_rattr_results_from_annotation,
     read,
     timer,
@@ -26,18 +28,34 @@ from rattr.ast.util import (
     fullname_of,
     has_lambda_in_rhs,
     has_namedtuple_declaration_in_rhs,
+    names_of,
     walruses_in_rhs,
 )
-from rattr.config import Config
-from rattr.config.state import enter_file
+from rattr.config import Config, State
+from rattr.config.state import accrue_badness, enter_file, replay_badness
+from rattr.error.diagnostics import diagnostics
 from rattr.extra import DictChanges
+from rattr.extra.profiling import profile_phase
+from rattr.extra.tracing import span
 from rattr.models.context import Context, compile_root_context
 from rattr.models.ir import FileIr
+from rattr.models.results.util import (
+    load_cached_file_ir,
+    make_cacheable_file_ir,
+    write_cached_file_ir,
+)
 from rattr.models.symbol import Import
 from rattr.module_locator.util import is_in_import_blacklist, is_in_pip, is_in_stdlib
 from rattr.plugins import plugins
+from rattr.versioning.typing import TypeAlias
 
 if TYPE_CHECKING:
+    from concurrent.futures import Executor
+    from pathlib import Path
+
+    from rattr.analyser.instrumentation import VisitorStats
+    from rattr.analyser.util import MemoryUsage
+    from rattr.error.diagnostics import Diagnostic
     from rattr.models.symbol import Func
 
 
@@ -55,6 +73,15 @@ class RattrStats:
     number_of_imports: int
     number_of_unique_imports: int
 
+    memory: dict[str, MemoryUsage] = attrs.field(factory=dict)
+    """The memory usage by phase, when given `--memory-stats`."""
+
+    memory_by_import: dict[str, MemoryUsage] = attrs.field(factory=dict)
+    """The memory usage by imported module, when given `--memory-stats`."""
+
+    visitors: VisitorStats | None = None
+    """The visits of the analysers, when given `--visitor-stats`."""
+
 
 @attrs.mutable
 class RattrImportStats:
@@ -62,40 +89,93 @@ class RattrImportStats:
     number_of_imports: int
     number_of_unique_imports: int
 
+    memory_by_import: dict[str, MemoryUsage] = attrs.field(factory=dict)
+
+
+@attrs.frozen
+class AnalysedImport:
+    """A parsed and analysed import, which may be shared between targets."""
+
+    ir: FileIr
+    lines: int
+    imports: list[Import]
+
+    dependencies: list[Path] = attrs.field(factory=list)
+    """The other files which the IR depends upon, i.e. expanded starred imports."""
+
+    diagnostics: list[Diagnostic] = attrs.field(factory=list)
+    """The errors, warnings, etc emitted when the module was analysed."""
+
+    badness: State = attrs.field(factory=State)
+    """The badness accrued when the module was analysed."""
+
+
+AnalysedImports: TypeAlias = dict[str, AnalysedImport]
+"""Map from the module origin to the analysed module."""
 
-def parse_and_analyse_file() -> tuple[FileIr, ImportIrs, RattrStats]:
-    """Parse and analyse the target file from the config."""
+
+def parse_and_analyse_file(
+    analysed_imports: AnalysedImports | None = None,
+    *,
+    executor: Executor | None = None,
+) -> tuple[FileIr, ImportIrs, RattrStats]:
+    """Parse and analyse the target file from the config.
+
+    When given, `analysed_imports` is used to re-use the analysis of imports shared
+    with previous targets, and is updated with the newly analysed imports.
+
+    When given, `executor` is used to analyse the imports in parallel.
+    """
     config = Config()
 
-    with enter_file(config.arguments.target):
-        file_ir, import_irs, stats = __parse_and_analyse_file_impl()
+    with enter_file(config.arguments.target), span("analyse", "target"):
+        file_ir, import_irs, stats = __parse_and_analyse_file_impl(
+            analysed_imports,
+            executor,
+        )
+
+    stats.visitors = instrumentation.collect()
 
     return file_ir, import_irs, stats
 
 
-def __parse_and_analyse_file_impl() -> tuple[FileIr, ImportIrs, RattrStats]:
+def __parse_and_analyse_file_impl(
+    analysed_imports: AnalysedImports | None,
+    executor: Executor | None,
+) -> tuple[FileIr, ImportIrs, RattrStats]:
     """Parse and analyse the given file contents."""
     config = Config()
 
-    with timer() as parse_timer, read(config.arguments.target) as (file_lines, source):
-        ast_module = ast.parse(source)
-
-    with timer() as root_context_timer:
-        context = compile_root_context(ast_module).expand_starred_imports()
-
-    with timer() as assert_timer:
-        for assertor in plugins.assertors:
-            assertor.assert_holds(ast_module, copy.deepcopy(context))
+    with timer() as parse_timer, memory_usage() as parse_memory:
+        with span("parse", "target"), profile_phase("parse"):
+            with read(config.arguments.target) as (file_lines, source):
+                ast_module = ast.parse(source)
+
+    with timer() as root_context_timer, memory_usage() as root_context_memory:
+        with span("root context", "target"), profile_phase("root_context"):
+            context = compile_root_context(ast_module).expand_starred_imports()
+
+    with timer() as assert_timer, memory_usage() as assert_memory:
+        with span("assert", "target"), profile_phase("assert"):
+            run_assertors(plugins.assertors, ast_module, context)
+
+    with timer() as analyse_imports_timer, memory_usage() as analyse_imports_memory:
+        with span("analyse imports", "target"), profile_phase("analyse_imports"):
+            if config.arguments.follow_imports:
+                import_irs, import_stats = parse_and_analyse_imports(
+                    _imports_in_context(context),
+                    analysed_imports=analysed_imports,
+                    executor=executor,
+                )
+            else:
+                import_irs, import_stats = {}, RattrImportStats(0, 0, 0)
 
-    with timer() as analyse_imports_timer:
-        if config.arguments.follow_imports:
-            imports = [s for s in context.symbol_table.symbols if isinstance(s, Import)]
-            import_irs, import_stats = parse_and_analyse_imports(imports)
-        else:
-            import_irs, import_stats = {}, RattrImportStats(0, 0, 0)
+    with timer() as analyse_file_timer, memory_usage() as analyse_file_memory:
+        with span("analyse file", "target"), profile_phase("analyse_file"):
+            file_ir = FileAnalyser(ast_module, context).analyse()
 
-    with timer() as analyse_file_timer:
-        file_ir = FileAnalyser(ast_module, context).analyse()
+        if config.arguments.low_memory:
+            release_ast(file_ir)
 
     stats = RattrStats(
         parse_time=parse_timer.time,
@@ -107,22 +187,67 @@ def __parse_and_analyse_file_impl() -> tuple[FileIr, ImportIrs, RattrStats]:
         import_lines=import_stats.import_lines,
         number_of_imports=import_stats.number_of_imports,
         number_of_unique_imports=import_stats.number_of_unique_imports,
+        memory={
+            phase: memory.usage
+            for phase, memory in (
+                ("parse", parse_memory),
+                ("root_context", root_context_memory),
+                ("assert", assert_memory),
+                ("analyse_imports", analyse_imports_memory),
+                ("analyse_file", analyse_file_memory),
+            )
+            if memory.usage is not None
+        },
+        memory_by_import=import_stats.memory_by_import,
     )
     return file_ir, import_irs, stats
 
 
 def parse_and_analyse_imports(
     imports: list[Import],
+    *,
+    analysed_imports: AnalysedImports | None = None,
+    executor: Executor | None = None,
 ) -> tuple[ImportIrs, RattrImportStats]:
     """Return the mapping from file name to IR for each import.
 
     Imports are a directed cyclic graph, however, previously analysed files can
     just be ignored (analysing is deterministic and context-free). Thus, the
     graph of imports becomes a DAG which we BFS.
+
+    For the same reason the analysis of a module can be shared between targets, when
+    `analysed_imports` is given it is used to look-up (and store) the analysis of a
+    module by its origin. As the IR of a shared module is extended in-place during
+    results generation, each target is given its own copy of the function IRs. The
+    errors, warnings, etc and badness of a shared module are replayed for each target,
+    s.t. they are the same as were the targets analysed separately.
+
+    When given `--jobs N` (or an `executor`) the modules are analysed in parallel,
+    see `rattr.analyser.parallel`.
     """
+    # HACK Circular import as the parallel analysis uses `parse_and_analyse_import`
+    from rattr.analyser.parallel import PrefetchedImports, make_import_executor
+
     config = Config()
     queue = deque(imports)
 
+    is_shared = analysed_imports is not None
+    if analysed_imports is None:
+        analysed_imports = {}
+
+    with ExitStack() as stack:
+        if executor is None and config.arguments.jobs != 1:
+            executor = stack.enter_context(make_import_executor())
+
+        if executor is not None:
+            prefetched = PrefetchedImports(
+                executor,
+                imports,
+                analysed_imports=analysed_imports,
+            )
+        else:
+            prefetched = None
+
     import_irs: ImportIrs = {}
     import_stats = RattrImportStats(
         import_lines=0,
@@ -136,8 +261,9 @@ def parse_and_analyse_imports(
         import_ = queue.popleft()
         import_stats.number_of_imports += 1
 
-        name = import_.module_name
-        spec = import_.module_spec
+        with span("locate", "import", qualified_name=import_.qualified_name):
+            name = import_.module_name
+            spec = import_.module_spec
 
         if name is None:
             error.error(f"unable to resolve import {import_.qualified_name!r}")
@@ -168,24 +294,35 @@ def parse_and_analyse_imports(
         if not config.arguments.follow_stdlib_imports and is_in_stdlib(name):
             continue
 
-        with read(spec.origin) as (import_file_lines, import_file_source):
-            import_ast = ast.parse(import_file_source)
-
-        with enter_file(spec.origin):
-            import_context = compile_root_context(import_ast).expand_starred_imports()
-            import_ir = FileAnalyser(import_ast, import_context).analyse()
+        if (analysed := analysed_imports.get(spec.origin)) is None:
+            with diagnostics.capture() as captured, accrue_badness() as badness:
+                if prefetched is not None and spec.origin in prefetched:
+                    with span(name, "import", origin=spec.origin, prefetched=True):
+                        analysed = prefetched.pop(spec.origin)
+                else:
+                    with memory_usage() as memory:
+                        with span(name, "import", origin=spec.origin):
+                            analysed = parse_and_analyse_import(spec.origin)
+
+                    if memory.usage is not None:
+                        import_stats.memory_by_import[name] = memory.usage
+
+            analysed = attrs.evolve(analysed, diagnostics=captured, badness=badness)
+            analysed_imports[spec.origin] = analysed
+        else:
+            # Analysed for a previous target, replay as though it were analysed anew
+            diagnostics.replay(analysed.diagnostics)
+            replay_badness(analysed.badness)
 
-        import_irs[name] = import_ir
+        if is_shared:
+            import_irs[name] = analysed.ir.copy_function_irs()
+        else:
+            import_irs[name] = analysed.ir
 
-        imports_in_the_current_import = [
-            symbol
-            for symbol in import_context.symbol_table.symbols
-            if isinstance(symbol, Import)
-        ]
-        for next_import in imports_in_the_current_import:
+        for next_import in analysed.imports:
             queue.append(next_import)
 
-        import_stats.import_lines += import_file_lines
+        import_stats.import_lines += analysed.lines
 
         seen_module_origins.add(spec.origin)
 
@@ -193,6 +330,95 @@ def parse_and_analyse_imports(
     return import_irs, import_stats
 
 
+def parse_and_analyse_import(origin: str) -> AnalysedImport:
+    """Parse and analyse the module at the given origin.
+
+    When `--cache-imports` is given the analysis is loaded from (and written to) the
+    import cache, unless the module, or the modules it depends upon, have changed.
+    """
+    config = Config()
+
+    use_cache = config.arguments.cache_imports
+    read_cache = use_cache and not config.arguments.force_refresh_cache
+
+    cached = None
+
+    if read_cache:
+        with span("load cache", "import"):
+            cached = load_cached_file_ir(origin)
+
+    if cached is not None:
+        # Replayed as though the module were analysed anew, see `PrefetchedImports.pop`
+        diagnostics.replay(cached.diagnostics)
+        replay_badness(cached.badness.to_state())
+
+        return AnalysedImport(
+            ir=cached.ir,
+            lines=cached.lines,
+            imports=_imports_in_context(cached.ir.context),
+            dependencies=[dependency.filepath for dependency in cached.dependencies],
+        )
+
+    # NB: The file is read on entering the context
+    with span("read", "import"), read(origin) as (import_file_lines, source):
+        pass
+
+    with span("parse", "import"):
+        import_ast = ast.parse(source)
+
+    expanded_starred_imports: set[Path] = set()
+
+    # The diagnostics and badness are cached, s.t. they are replayed upon a cache hit
+    with diagnostics.capture() as captured, accrue_badness() as badness:
+        with enter_file(origin):
+            with span("root context", "import"):
+                root_context = compile_root_context(import_ast)
+                import_context = root_context.expand_starred_imports(
+                    seen=expanded_starred_imports
+                )
+
+            with span("analyse", "import"):
+                import_ir = FileAnalyser(import_ast, import_context).analyse()
+
+    if config.arguments.low_memory:
+        release_ast(import_ir)
+
+    if use_cache:
+        with span("write cache", "import"):
+            write_cached_file_ir(
+                origin,
+                make_cacheable_file_ir(
+                    origin,
+                    import_ir,
+                    lines=import_file_lines,
+                    dependencies=expanded_starred_imports,
+                    diagnostics=captured,
+                    badness=badness,
+                ),
+            )
+
+    return AnalysedImport(
+        ir=import_ir,
+        lines=import_file_lines,
+        imports=_imports_in_context(import_context),
+        dependencies=sorted(expanded_starred_imports),
+    )
+
+
+def release_ast(file_ir: FileIr) -> None:
+    """Release the references to the AST of the analysed file, see `--low-memory`."""
+    file_ir.release_tokens()
+
+    # The cache is keyed by the AST nodes, thus would otherwise keep them alive
+    names_of.cache_clear()
+
+
+def _imports_in_context(context: Context) -> list[Import]:
+    return [
+        symbol for symbol in context.symbol_table.symbols if isinstance(symbol, Import)
+    ]
+
+
 class FileAnalyser(NodeVisitor):
     """Walk a file's AST and analyse the contained functions and classes."""
 
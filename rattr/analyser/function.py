@@ -32,6 +32,7 @@ from rattr.models.symbol import (
     Class,
     Func,
     Name,
+    interned_name,
 )
 from rattr.models.symbol.util import without_call_brackets
 from rattr.plugins import plugins
@@ -101,7 +102,7 @@ class FunctionAnalyser(NodeVisitor):
         is_literal = base.startswith(config.LITERAL_VALUE_PREFIX)
 
         if is_undeclared and not is_assignment and not is_literal:
-            error.warning(f"{base!r} potentially undefined", node)
+            error.warning(lambda: f"{base!r} potentially undefined", node)
 
         return base, full
 
@@ -123,7 +124,7 @@ class FunctionAnalyser(NodeVisitor):
     def visit_Name(self, node: ast.Name) -> None:
         """Visit ast.Name(id: str, ctx: ast.expr_context)."""
         basename, fullname = self.get_and_verify_name(node, node.ctx)
-        self.update_results(Name(fullname, basename, token=node), node.ctx)
+        self.update_results(interned_name(fullname, basename, token=node), node.ctx)
 
     def visit_compound_name(
         self,
@@ -142,7 +143,7 @@ class FunctionAnalyser(NodeVisitor):
         if not isinstance(node.value, AstNodeWithName):
             self.visit(node.value)
 
-        self.update_results(Name(fullname, basename, token=node), node.ctx)
+        self.update_results(interned_name(fullname, basename, token=node), node.ctx)
 
     def visit_Starred(self, node: ast.Starred) -> None:
         self.visit_compound_name(node)
@@ -168,7 +169,7 @@ class FunctionAnalyser(NodeVisitor):
         # as it will register an incorrect "gets"
 
         if isinstance(target, Class):
-            error.warning(f"{target.name!r} initialised but not stored", node)
+            error.warning(lambda: f"{target.name!r} initialised but not stored", node)
             self_name = config.LITERAL_VALUE_PREFIX + target.name
         else:
             self_name = None
@@ -177,7 +178,7 @@ class FunctionAnalyser(NodeVisitor):
         # On a call to `cls.member.method()` then it must get `class.member`
         parts = without_call_brackets(fullname).split(".")[:-1]
         for attr in list(accumulate(parts, lambda a, b: f"{a}.{b}"))[1:]:
-            self.func_ir["gets"].add(Name(attr, parts[0], token=node))
+            self.func_ir["gets"].add(interned_name(attr, parts[0], token=node))
 
         call = Call.from_call(fullname, call=node, target=target, self=self_name)
         self.func_ir["calls"].add(call)
@@ -282,7 +283,7 @@ class FunctionAnalyser(NodeVisitor):
         self.func_ir["calls"].add(call)
 
         # Create set to LHS
-        self.func_ir["sets"].add(Name(lhs_name, lhs_basename, token=node))
+        self.func_ir["sets"].add(interned_name(lhs_name, lhs_basename, token=node))
 
         # Register assignments
         for target in targets:
@@ -332,7 +333,7 @@ class FunctionAnalyser(NodeVisitor):
         self.visit_AnyAssign(node)
 
     def visit_NamedExpr(self, node: ast.NamedExpr) -> None:
-        self.func_ir["sets"].add(Name(*names_of(node.target), token=node))
+        self.func_ir["sets"].add(interned_name(*names_of(node.target), token=node))
 
         if lambda_in_rhs(node):
             self.visit(node.value)
@@ -0,0 +1,236 @@
+"""Count and time the visits of the analysers, see `--visitor-stats`.
+
+While instrumenting, the methods of the analysers (i.e. `FileAnalyser`, `ClassAnalyser`,
+`FunctionAnalyser`, the assertors, and the custom function analysers) are replaced by
+instrumented wrappers, and are restored once stopped, thus the instrumentation costs
+nothing when not instrumenting. The visits are recorded:
+
+    by node type    - each call to `visit`, by the type of the visited node
+    by method       - each call to the `visit_*`, `generic_visit`, `enter_*`, `leave_*`,
+                      `on_def`, and `on_call` methods, by the class defining the method
+
+For each, the count, the total time (i.e. including nested visits), and the own time
+(i.e. excluding nested visits) are recorded. NB: The nested visits of the node types
+and of the methods are tracked separately, s.t. the own time of `visit` for a node
+includes the time of the `visit_*` method which it dispatches to.
+"""
+from __future__ import annotations
+
+import ast
+import functools
+import inspect
+from time import perf_counter_ns
+from typing import TYPE_CHECKING
+
+import attrs
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import Any, Final
+
+
+INSTRUMENTED_PREFIXES: Final = ("visit_", "enter_", "leave_")
+INSTRUMENTED_METHODS: Final = frozenset({"generic_visit", "on_def", "on_call"})
+
+_ABSENT: Final = object()
+
+
+@attrs.mutable
+class VisitStats:
+    count: int = 0
+
+    time: float = 0.0
+    """The total time of the visits, in seconds."""
+
+    own_time: float = 0.0
+    """The time of the visits excluding that of nested visits, in seconds."""
+
+    def update(self, other: VisitStats) -> None:
+        self.count += other.count
+        self.time += other.time
+        self.own_time += other.own_time
+
+
+@attrs.mutable
+class VisitorStats:
+    by_node_type: dict[str, VisitStats] = attrs.field(factory=dict)
+    by_method: dict[str, VisitStats] = attrs.field(factory=dict)
+
+    def update(self, other: VisitorStats) -> None:
+        """Add the visits of the other stats, i.e. from a `--jobs` worker."""
+        for mine, theirs in (
+            (self.by_node_type, other.by_node_type),
+            (self.by_method, other.by_method),
+        ):
+            for key, stats in theirs.items():
+                mine.setdefault(key, VisitStats()).update(stats)
+
+
+def by_own_time(visits: dict[str, VisitStats]) -> list[tuple[str, VisitStats]]:
+    """Return the visits, the most expensive first."""
+    return sorted(visits.items(), key=lambda item: item[1].own_time, reverse=True)
+
+
+class VisitorInstrumentation:
+    """Instrument the analysers of the current process, see the module docstring."""
+
+    def __init__(self) -> None:
+        self.stats: VisitorStats | None = None
+
+        self._patched: list[tuple[type, str, Any]] = []
+
+        # The time of the nested visits of each visit in progress, in nanoseconds
+        self._node_type_frames: list[int] = []
+        self._method_frames: list[int] = []
+
+    @property
+    def is_instrumenting(self) -> bool:
+        return self.stats is not None
+
+    def start(self) -> None:
+        """Start instrumenting the analysers, discarding any previous stats."""
+        if self.is_instrumenting:
+            self.stop()
+
+        self.stats = VisitorStats()
+
+        for cls in _analyser_classes():
+            self._instrument_class(cls)
+
+    def stop(self) -> VisitorStats | None:
+        """Stop instrumenting the analysers, and return the stats thus far."""
+        for cls, name, original in reversed(self._patched):
+            if original is _ABSENT:
+                delattr(cls, name)
+            else:
+                setattr(cls, name, original)
+
+        self._patched = []
+        self._node_type_frames = []
+        self._method_frames = []
+
+        stats, self.stats = self.stats, None
+        return stats
+
+    def collect(self) -> VisitorStats | None:
+        """Return the stats thus far and reset them, continuing to instrument."""
+        if self.stats is None:
+            return None
+
+        stats, self.stats = self.stats, VisitorStats()
+        return stats
+
+    def extend(self, stats: VisitorStats | None) -> None:
+        """Add the given stats (i.e. from a `--jobs` worker), if instrumenting."""
+        if self.stats is not None and stats is not None:
+            self.stats.update(stats)
+
+    def _instrument_class(self, cls: type) -> None:
+        # The roots give the inherited `visit` and `generic_visit` of `ast.NodeVisitor`
+        is_root = ast.NodeVisitor in cls.__bases__
+
+        if is_root or "visit" in vars(cls):
+            self._patch(cls, "visit", self._instrument_visit(cls.visit))  # type: ignore
+
+        for name, function in list(vars(cls).items()):
+            if not inspect.isfunction(function):
+                continue
+
+            if name.startswith(INSTRUMENTED_PREFIXES) or name in INSTRUMENTED_METHODS:
+                key = function.__qualname__
+                self._patch(cls, name, self._instrument_method(function, key))
+
+        if is_root and "generic_visit" not in vars(cls):
+            key = f"{cls.__qualname__}.generic_visit"
+            function = ast.NodeVisitor.generic_visit
+            self._patch(cls, "generic_visit", self._instrument_method(function, key))
+
+    def _patch(self, cls: type, name: str, function: Callable[..., Any]) -> None:
+        self._patched.append((cls, name, vars(cls).get(name, _ABSENT)))
+        setattr(cls, name, function)
+
+    def _instrument_visit(self, visit: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(visit)
+        def instrumented_visit(visitor: ast.NodeVisitor, node: ast.AST) -> Any:
+            self._node_type_frames.append(0)
+            start = perf_counter_ns()
+
+            try:
+                return visit(visitor, node)
+            finally:
+                self._record("by_node_type", type(node).__name__, start)
+
+        return instrumented_visit
+
+    def _instrument_method(
+        self,
+        function: Callable[..., Any],
+        key: str,
+    ) -> Callable[..., Any]:
+        @functools.wraps(function)
+        def instrumented_method(*args: Any, **kwargs: Any) -> Any:
+            self._method_frames.append(0)
+            start = perf_counter_ns()
+
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self._record("by_method", key, start)
+
+        return instrumented_method
+
+    def _record(self, table: str, key: str, start: int) -> None:
+        elapsed = perf_counter_ns() - start
+
+        frames = (
+            self._node_type_frames if table == "by_node_type" else self._method_frames
+        )
+        nested = frames.pop()
+
+        if frames:
+            frames[-1] += elapsed
+
+        if self.stats is None:
+            return
+
+        visits: dict[str, VisitStats] = getattr(self.stats, table)
+
+        if (stats := visits.get(key)) is None:
+            stats = visits[key] = VisitStats()
+
+        stats.count += 1
+        stats.time += elapsed / 1e9
+        stats.own_time += (elapsed - nested) / 1e9
+
+
+def _analyser_classes() -> list[type]:
+    """Return the analyser classes, including the subclasses given by plugins."""
+    # NB: Imported here as the analysers themselves depend upon this module
+    from rattr.analyser.base import Assertor, CustomFunctionAnalyser
+    from rattr.analyser.cls import ClassAnalyser
+    from rattr.analyser.file import FileAnalyser
+    from rattr.analyser.function import FunctionAnalyser
+
+    classes: dict[type, None] = {}
+    unvisited: list[type] = [
+        Assertor,
+        CustomFunctionAnalyser,
+        FileAnalyser,
+        ClassAnalyser,
+        FunctionAnalyser,
+    ]
+
+    while unvisited:
+        cls = unvisited.pop(0)
+
+        if cls in classes:
+            continue
+
+        classes[cls] = None
+        unvisited.extend(cls.__subclasses__())
+
+    return list(classes)
+
+
+instrumentation: Final = VisitorInstrumentation()
+"""The visitor instrumentation of the current process."""
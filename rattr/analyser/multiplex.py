@@ -0,0 +1,111 @@
+"""Visit a tree once on behalf of several visitors, see `multiplex`.
+
+Rather than overriding `visit_<NodeType>` (and recursing via `generic_visit`), a
+multiplexed visitor gives handlers by node type which do not recurse:
+
+    enter_<NodeType>(node)  - called before the children of the node are visited, if it
+                              returns `SKIP_CHILDREN` then the children (and the leave
+                              handler) are skipped for this visitor only
+    leave_<NodeType>(node)  - called after the children of the node are visited
+
+The handlers of each visitor are called in the same order, and with the same effect,
+as when the tree is visited separately for each visitor. However, the handlers of the
+visitors are interleaved node-by-node (in the order in which the visitors are given).
+"""
+from __future__ import annotations
+
+import ast
+from functools import cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+    from typing import Any, Final
+
+    Handler = Callable[[ast.AST], Any]
+    HandlersByType = dict[type[ast.AST], list[tuple[int, Handler]]]
+
+
+class SkipChildren:
+    def __repr__(self) -> str:
+        return "SKIP_CHILDREN"
+
+
+SKIP_CHILDREN: Final = SkipChildren()
+
+
+def is_multiplexable(visitor: object) -> bool:
+    """Return `True` if the visitor gives handlers and does not override `visit_*`."""
+    enter, leave, overrides_visit = _handler_names(type(visitor))
+    return bool(enter or leave) and not overrides_visit
+
+
+def multiplex(node: ast.AST, visitors: Sequence[object]) -> None:
+    """Visit the tree once, calling the handlers of each of the given visitors."""
+    if not visitors:
+        return
+
+    enter: HandlersByType = {}
+    leave: HandlersByType = {}
+
+    for index, visitor in enumerate(visitors):
+        enter_names, leave_names, _ = _handler_names(type(visitor))
+
+        for node_type, name in enter_names:
+            enter.setdefault(node_type, []).append((index, getattr(visitor, name)))
+
+        for node_type, name in leave_names:
+            leave.setdefault(node_type, []).append((index, getattr(visitor, name)))
+
+    _walk(node, (1 << len(visitors)) - 1, enter, leave)
+
+
+def _walk(
+    node: ast.AST,
+    active: int,
+    enter: HandlersByType,
+    leave: HandlersByType,
+) -> None:
+    # `active` is a bit-mask of the visitors which have not skipped an ancestor
+    node_type = type(node)
+
+    for index, handler in enter.get(node_type, ()):
+        if active & (1 << index) and handler(node) is SKIP_CHILDREN:
+            active &= ~(1 << index)
+
+    if not active:
+        return
+
+    for child in ast.iter_child_nodes(node):
+        _walk(child, active, enter, leave)
+
+    for index, handler in leave.get(node_type, ()):
+        if active & (1 << index):
+            handler(node)
+
+
+@cache
+def _handler_names(
+    cls: type,
+) -> tuple[list[tuple[type[ast.AST], str]], list[tuple[type[ast.AST], str]], bool]:
+    """Return the enter and leave handlers of the class, and if it overrides visit."""
+    enter: list[tuple[type[ast.AST], str]] = []
+    leave: list[tuple[type[ast.AST], str]] = []
+    overrides_visit = False
+
+    for name in dir(cls):
+        prefix, _, node_type_name = name.partition("_")
+        node_type = getattr(ast, node_type_name, None)
+
+        if not isinstance(node_type, type) or not issubclass(node_type, ast.AST):
+            continue
+
+        if prefix == "enter":
+            enter.append((node_type, name))
+        elif prefix == "leave":
+            leave.append((node_type, name))
+        elif prefix == "visit":
+            inherited = getattr(ast.NodeVisitor, name, None)
+            overrides_visit |= getattr(cls, name) is not inherited
+
+    return enter, leave, overrides_visit
@@ -0,0 +1,273 @@
+"""Parallel import analysis.
+
+The analysis of a module does not depend upon the IR of any other module, thus the
+modules reachable from the target can be analysed in a process pool. To keep the
+output deterministic this is split in two:
+
+1.  The import graph is discovered in the pool, where the imports of each analysed
+    module are fed back to the scheduler and, if they are new, submitted to the pool;
+    this emits no errors, warnings, etc and does not affect the badness.
+2.  The usual breadth-first search in `parse_and_analyse_imports` is performed, except
+    that when a module is reached its analysis is taken from the pool, and the errors,
+    warnings, etc and badness produced by the worker are then replayed as though the
+    module had been analysed in the main process.
+"""
+from __future__ import annotations
+
+import io
+import os
+import sys
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from contextlib import redirect_stderr
+from typing import TYPE_CHECKING
+
+import attrs
+
+from rattr.analyser.file import AnalysedImport, parse_and_analyse_import
+from rattr.analyser.instrumentation import instrumentation
+from rattr.config import Config, State
+from rattr.error.diagnostics import diagnostics
+from rattr.extra.tracing import span, tracer
+from rattr.module_locator.util import (
+    caches_generation,
+    invalidate_caches,
+    is_in_import_blacklist,
+    is_in_pip,
+    is_in_stdlib,
+)
+from rattr.plugins import plugins
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from concurrent.futures import Executor, Future
+    from pathlib import Path
+
+    from rattr.analyser.file import AnalysedImports
+    from rattr.analyser.instrumentation import VisitorStats
+    from rattr.config import Arguments
+    from rattr.error.diagnostics import Diagnostic
+    from rattr.extra.tracing import TraceEvent
+    from rattr.models.symbol import Import
+    from rattr.plugins import Plugins
+
+
+@attrs.frozen
+class WorkerResult:
+    analysed: AnalysedImport | None
+    """The analysed import, or `None` if the analysis exited (i.e. `error.fatal`)."""
+
+    stderr: str
+    """The output of the worker to stderr, other than the errors, warnings, etc."""
+
+    diagnostics: list[Diagnostic]
+    """The errors, warnings, etc emitted by the worker, to be replayed."""
+
+    state: State
+    """The badness accrued by the worker."""
+
+    exit_code: int | str | None = None
+
+    trace_events: list[TraceEvent] = attrs.field(factory=list)
+    """The spans recorded by the worker, when given `--trace`."""
+
+    visitor_stats: VisitorStats | None = None
+    """The visits of the worker's analysers, when given `--visitor-stats`."""
+
+
+def make_import_executor(jobs: int | None = None) -> ProcessPoolExecutor:
+    """Return a process pool for analysing imports, using `--jobs` by default."""
+    config = Config()
+
+    if jobs is None:
+        jobs = config.arguments.jobs
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+
+    return ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=_initialise_worker,
+        initargs=(
+            config.arguments,
+            config.PLUGINS_BLACKLIST_PATTERNS,
+            plugins,
+        ),
+    )
+
+
+def start_workers(executor: Executor) -> None:
+    """Start the workers of the pool now, rather than upon the first submission.
+
+    Where the workers are forked they inherit the open files of the main process, thus
+    a server must start them before accepting any connection, lest they keep it open.
+    """
+    executor.submit(os.getpid).result()
+
+
+def _initialise_worker(
+    arguments: Arguments,
+    plugins_blacklist_patterns: set[str],
+    worker_plugins: Plugins,
+) -> None:
+    # NOTE
+    # The arguments were validated in the main process, do not re-emit the warnings
+    with redirect_stderr(io.StringIO()):
+        config = Config(arguments=arguments, state=State())
+
+    config.arguments = arguments
+    config.PLUGINS_BLACKLIST_PATTERNS = set(plugins_blacklist_patterns)
+
+    plugins.register_assertors(worker_plugins.assertors)
+    plugins.register_analysers(worker_plugins.analysers)
+
+
+def _analyse_import_in_worker(
+    origin: str,
+    name: str,
+    target: Path,
+    current_file: Path | None,
+    locator_generation: int,
+) -> WorkerResult:
+    # NB: The pool is shared between targets in batch mode, thus the target and current
+    # file are those of the main process when submitted, not when initialised
+    config = Config()
+    config.arguments.target = target
+    config.state = State(current_file=current_file)
+
+    # The pool outlives the requests to `rattr serve`, which may invalidate the caches
+    if locator_generation != caches_generation():
+        invalidate_caches(generation=locator_generation)
+
+    stderr = io.StringIO()
+    diagnostics.reset(deferred_stream=stderr)
+
+    if config.arguments.trace is not None:
+        tracer.start()
+
+    if config.arguments.visitor_stats:
+        instrumentation.start()
+
+    try:
+        with redirect_stderr(stderr), span(name, "import", origin=origin):
+            analysed = parse_and_analyse_import(origin)
+    except SystemExit as exc:
+        return WorkerResult(
+            analysed=None,
+            stderr=stderr.getvalue(),
+            diagnostics=diagnostics.deferred,
+            state=config.state,
+            exit_code=exc.code,
+            trace_events=tracer.stop(),
+            visitor_stats=instrumentation.stop(),
+        )
+
+    return WorkerResult(
+        analysed=analysed,
+        stderr=stderr.getvalue(),
+        diagnostics=diagnostics.deferred,
+        state=config.state,
+        trace_events=tracer.stop(),
+        visitor_stats=instrumentation.stop(),
+    )
+
+
+class PrefetchedImports:
+    """The imports reachable from the given imports, analysed in the given executor."""
+
+    def __init__(
+        self,
+        executor: Executor,
+        imports: Iterable[Import],
+        *,
+        analysed_imports: AnalysedImports,
+    ) -> None:
+        self._executor = executor
+        self._analysed_imports = analysed_imports
+        self._futures: dict[str, Future[WorkerResult]] = {}
+
+        self._prefetch(imports)
+
+    def __contains__(self, origin: str) -> bool:
+        return origin in self._futures
+
+    def pop(self, origin: str) -> AnalysedImport:
+        """Return the analysed import, replaying the worker's errors and badness."""
+        result = self._futures.pop(origin).result()
+
+        diagnostics.write(result.stderr)
+        diagnostics.replay(result.diagnostics)
+        tracer.extend(result.trace_events)
+        instrumentation.extend(result.visitor_stats)
+
+        config = Config()
+        config.state.badness_from_target_file += result.state.badness_from_target_file
+        config.state.badness_from_imports += result.state.badness_from_imports
+        config.state.badness_from_simplification += (
+            result.state.badness_from_simplification
+        )
+
+        if result.analysed is None:
+            sys.exit(result.exit_code)
+
+        return result.analysed
+
+    def _prefetch(self, imports: Iterable[Import]) -> None:
+        self._submit_all(imports)
+
+        expanded: set[str] = set()
+
+        while unexpanded := [
+            future for origin, future in self._futures.items() if origin not in expanded
+        ]:
+            done, _ = wait(unexpanded, return_when=FIRST_COMPLETED)
+
+            for origin, future in list(self._futures.items()):
+                if future not in done:
+                    continue
+
+                expanded.add(origin)
+
+                if (analysed := future.result().analysed) is not None:
+                    self._submit_all(analysed.imports)
+
+    def _submit_all(self, imports: Iterable[Import]) -> None:
+        config = Config()
+
+        for import_ in imports:
+            origin = _origin_to_analyse(import_)
+
+            if origin is None or import_.module_name is None:
+                continue
+
+            if origin in self._futures or origin in self._analysed_imports:
+                continue
+
+            self._futures[origin] = self._executor.submit(
+                _analyse_import_in_worker,
+                origin,
+                import_.module_name,
+                config.arguments.target,
+                config.state.current_file,
+                caches_generation(),
+            )
+
+
+def _origin_to_analyse(import_: Import) -> str | None:
+    """Return the origin of the import if it would be analysed, silently."""
+    config = Config()
+
+    name = import_.module_name
+    spec = import_.module_spec
+
+    if name is None or spec is None or spec.origin is None:
+        return None
+
+    if is_in_import_blacklist(name):
+        return None
+
+    if not config.arguments.follow_pip_imports and is_in_pip(name):
+        return None
+
+    if not config.arguments.follow_stdlib_imports and is_in_stdlib(name):
+        return None
+
+    return spec.origin
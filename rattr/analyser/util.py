@@ -6,6 +6,7 @@ import builtins
 import io
 import re
 import sys
+import tracemalloc
 from contextlib import redirect_stderr
 from itertools import accumulate, chain, filterfalse
 from pathlib import Path
@@ -13,7 +14,7 @@ from string import ascii_lowercase
 from time import perf_counter
 from typing import TYPE_CHECKING
 
-from isort.api import place_module
+import attrs
 
 from rattr import error
 from rattr.analyser.exc import RattrResultsError
@@ -30,11 +31,11 @@ from rattr.models.symbol import (
     Import,
     Name,
 )
-from rattr.module_locator.util import find_module_spec_fast
+from rattr.module_locator.util import find_module_spec_fast, is_in_stdlib
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Iterable
-    from typing import Any, Final, Type
+    from typing import Any, ClassVar, Final, Type
 
     from rattr.analyser.types import RattrResults
     from rattr.ast.types import Identifier
@@ -630,7 +631,7 @@ def is_stdlib_module(module: str) -> bool:
 
     NOTE Deprecated, see rattr.ast.place
     """
-    return place_module(module) == "STDLIB"
+    return is_in_stdlib(module)
 
 
 def is_in_builtins(name_or_qualified_name: str) -> bool:
@@ -653,6 +654,82 @@ class timer:
         return self.end - self.start
 
 
+@attrs.frozen
+class MemoryUsage:
+    peak: int
+    """The peak traced memory during the context, in bytes."""
+
+    retained: int
+    """The traced memory allocated (and not freed) during the context, in bytes."""
+
+    peak_rss: int | None
+    """The peak RSS of the process at the end of the context, in bytes."""
+
+
+class memory_usage:
+    """Context manager to measure the context's memory usage, see `--memory-stats`.
+
+    The memory is measured only while `tracemalloc` is tracing, otherwise `usage` is
+    `None`. The contexts may be nested, s.t. the peak of the outer context includes the
+    peak of the inner context.
+    """
+
+    _active: ClassVar[list[memory_usage]] = []
+
+    def __init__(self) -> None:
+        self.usage: MemoryUsage | None = None
+
+    def __enter__(self):
+        self.is_tracing = tracemalloc.is_tracing()
+
+        if not self.is_tracing:
+            return self
+
+        current, peak = tracemalloc.get_traced_memory()
+
+        # The peak is reset below, thus the outer context must keep its peak thus far
+        if self._active:
+            outer = self._active[-1]
+            outer.peak = max(outer.peak, peak)
+
+        tracemalloc.reset_peak()
+
+        self.start = self.peak = current
+        self._active.append(self)
+
+        return self
+
+    def __exit__(self, *_):
+        if not self.is_tracing:
+            return
+
+        self._active.remove(self)
+
+        current, peak = tracemalloc.get_traced_memory()
+
+        self.usage = MemoryUsage(
+            peak=max(self.peak, peak),
+            retained=current - self.start,
+            peak_rss=peak_rss(),
+        )
+
+
+def peak_rss() -> int | None:
+    """Return the peak RSS of the process in bytes, or `None` if unavailable."""
+    try:
+        import resource
+    except ImportError:  # i.e. on Windows
+        return None
+
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # NB: On macOS the RSS is given in bytes, but elsewhere it is given in KiB
+    if sys.platform == "darwin":
+        return maxrss
+
+    return maxrss * 1024
+
+
 class read:
     """Context manager to return file contents and the number of lines."""
 
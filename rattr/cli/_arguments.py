@@ -5,7 +5,7 @@ from typing import TYPE_CHECKING
 
 from rattr import _version
 from rattr.cli._util import multi_paragraph_wrap
-from rattr.config import Output
+from rattr.config import CacheFormat, Output, ResultsEngine
 
 if TYPE_CHECKING:
     from rattr.cli._argparse import ArgumentParser
@@ -20,6 +20,14 @@ def add_common_arguments(parser: ArgumentParser) -> ArgumentParser:
     parser = add_format_path_arguments(parser)
     parser = add_permissiveness_arguments(parser)
     parser = add_force_cache_refresh_argument(parser)
+    parser = add_cache_imports_argument(parser)
+    parser = add_jobs_argument(parser)
+    parser = add_results_engine_argument(parser)
+    parser = add_cache_summaries_argument(parser)
+    parser = add_cache_format_argument(parser)
+    parser = add_low_memory_argument(parser)
+    parser = add_memory_stats_argument(parser)
+    parser = add_visitor_stats_argument(parser)
     parser = add_stdout_arguments(parser)
 
     return parser
@@ -253,6 +261,186 @@ def add_force_cache_refresh_argument(parser: ArgumentParser) -> ArgumentParser:
     return parser
 
 
+def add_cache_imports_argument(parser: ArgumentParser) -> ArgumentParser:
+    cache_imports_group = parser.add_argument_group()
+    cache_imports_group.add_argument(
+        "--cache-imports",
+        action="store_true",
+        help=multi_paragraph_wrap(
+            """\
+            >cache the analysis of each imported module in the project's cache dir, and
+            >re-use it while the module (and the arguments and plugins) are unchanged
+
+            >TOML example: cache-imports=true
+            """
+        ),
+        dest="cache_imports",
+    )
+
+    return parser
+
+
+def add_jobs_argument(parser: ArgumentParser) -> ArgumentParser:
+    jobs_group = parser.add_argument_group()
+    jobs_group.add_argument(
+        "-j",
+        "--jobs",
+        default=1,
+        type=int,
+        help=multi_paragraph_wrap(
+            """\
+            >analyse imports, and generate the results of targets with many functions,
+            >in parallel using N processes, where 0 is the number of cpus
+            >\033[1m(default: --jobs 1)\033[0m
+
+            >NB: the results, errors, and badness are the same as for --jobs 1
+
+            >TOML example: jobs=4
+            """
+        ),
+        metavar="N",
+        dest="jobs",
+    )
+
+    return parser
+
+
+def add_results_engine_argument(parser: ArgumentParser) -> ArgumentParser:
+    results_engine_group = parser.add_argument_group()
+    results_engine_group.add_argument(
+        "--results-engine",
+        default=ResultsEngine.tree,
+        type=ResultsEngine,
+        choices=list(ResultsEngine),
+        help=multi_paragraph_wrap(
+            """\
+            >results generation:
+            >    tree - simplify a call tree per function \033[1m(default)\033[0m
+            >    scc  - simplify each function once, bottom-up over the call graph
+
+            >TOML example: results-engine='scc'
+            """
+        ),
+        dest="results_engine",
+    )
+
+    return parser
+
+
+def add_cache_summaries_argument(parser: ArgumentParser) -> ArgumentParser:
+    cache_summaries_group = parser.add_argument_group()
+    cache_summaries_group.add_argument(
+        "--cache-summaries",
+        action="store_true",
+        help=multi_paragraph_wrap(
+            """\
+            >cache the simplified IR of each imported function in the project's
+            >cache dir, and re-use it while the modules it depends upon are unchanged;
+            >in batch mode the summaries are always shared between the targets
+
+            >NB: requires --results-engine scc, and the errors and warnings of a cached
+            >function are not shown again
+
+            >TOML example: cache-summaries=true
+            """
+        ),
+        dest="cache_summaries",
+    )
+
+    return parser
+
+
+def add_cache_format_argument(parser: ArgumentParser) -> ArgumentParser:
+    cache_format_group = parser.add_argument_group()
+    cache_format_group.add_argument(
+        "--cache-format",
+        default=CacheFormat.json,
+        type=CacheFormat,
+        choices=list(CacheFormat),
+        help=multi_paragraph_wrap(
+            """\
+            >the format of the files written to the cache:
+            >    json       - human readable JSON \033[1m(default)\033[0m
+            >    compact    - a binary encoding, smaller and faster to load
+            >    compressed - the compact encoding, compressed by zlib
+
+            >NB: a cache file in any format is read regardless of --cache-format
+
+            >TOML example: cache-format='compact'
+            """
+        ),
+        dest="cache_format",
+    )
+
+    return parser
+
+
+def add_low_memory_argument(parser: ArgumentParser) -> ArgumentParser:
+    low_memory_group = parser.add_argument_group()
+    low_memory_group.add_argument(
+        "--low-memory",
+        action="store_true",
+        help=multi_paragraph_wrap(
+            """\
+            >release the AST of each module once it has been analysed, keeping only
+            >what is needed to generate the results, s.t. the peak memory depends upon
+            >the largest module rather than upon all of the imported modules
+
+            >TOML example: low-memory=true
+            """
+        ),
+        dest="low_memory",
+    )
+
+    return parser
+
+
+def add_memory_stats_argument(parser: ArgumentParser) -> ArgumentParser:
+    memory_stats_group = parser.add_argument_group()
+    memory_stats_group.add_argument(
+        "--memory-stats",
+        action="store_true",
+        help=multi_paragraph_wrap(
+            """\
+            >measure the peak and retained memory of each phase, and the modules which
+            >allocate the most memory while analysing the imports, shown by --stdout
+            >stats and --stdout stats-json
+
+            >NB: the memory is traced by tracemalloc, which slows rattr considerably,
+            >and the imports analysed, and the results generated, by --jobs are not
+            >measured
+
+            >TOML example: memory-stats=true
+            """
+        ),
+        dest="memory_stats",
+    )
+
+    return parser
+
+
+def add_visitor_stats_argument(parser: ArgumentParser) -> ArgumentParser:
+    visitor_stats_group = parser.add_argument_group()
+    visitor_stats_group.add_argument(
+        "--visitor-stats",
+        action="store_true",
+        help=multi_paragraph_wrap(
+            """\
+            >count and time the visits of the analysers by node type and by method
+            >(i.e. visit_*, generic_visit, enter_*, leave_*, on_def, and on_call), shown
+            >by --stdout stats and --stdout stats-json
+
+            >NB: each visit is timed, which slows rattr considerably
+
+            >TOML example: visitor-stats=true
+            """
+        ),
+        dest="visitor_stats",
+    )
+
+    return parser
+
+
 def add_stdout_arguments(parser: ArgumentParser) -> ArgumentParser:
     stdout_group = parser.add_argument_group()
     stdout_group.add_argument(
@@ -264,9 +452,12 @@ def add_stdout_arguments(parser: ArgumentParser) -> ArgumentParser:
         help=multi_paragraph_wrap(
             """\
             >output selection:
-            >    silent  - do not print to stdout
-            >    ir      - print the intermediate representation to stdout
-            >    results - print the results to stdout \033[1m(default)\033[0m
+            >    silent     - do not print to stdout
+            >    ir         - print the intermediate representation to stdout
+            >    results    - print the results to stdout \033[1m(default)\033[0m
+            >    ndjson     - print each function's results as a JSON line when ready
+            >    stats      - print the stats to stdout
+            >    stats-json - print the stats to stdout as JSON
 
             >TOML example: stdout='results'
             """
@@ -296,14 +487,103 @@ def add_cache_file_argument(parser: ArgumentParser) -> ArgumentParser:
     return parser
 
 
+def add_trace_argument(parser: ArgumentParser) -> ArgumentParser:
+    trace_group = parser.add_argument_group()
+    trace_group.add_argument(
+        "--trace",
+        default=None,
+        type=Path,
+        help=multi_paragraph_wrap(
+            """\
+            >write a timeline of the run to the given file as Chrome trace events, with
+            >a span for each phase of the target, for locating, reading, parsing, and
+            >analysing each imported module, and for the results of each function
+
+            >NB: the trace can be opened in chrome://tracing, Perfetto, or Speedscope
+            """
+        ),
+        metavar="<file>",
+        dest="trace",
+    )
+
+    return parser
+
+
+def add_profile_argument(parser: ArgumentParser) -> ArgumentParser:
+    profile_group = parser.add_argument_group()
+    profile_group.add_argument(
+        "--profile",
+        default=None,
+        type=Path,
+        help=multi_paragraph_wrap(
+            """\
+            >profile each phase (parse, root context, assert, analyse imports, analyse
+            >file, and results) separately, writing <phase>.pstats and a summary of the
+            >top functions of each phase (summary.txt) to the given directory
+
+            >NB: the imports analysed, and the results generated, by --jobs are not
+            >profiled
+            """
+        ),
+        metavar="<dir>",
+        dest="profile",
+    )
+
+    return parser
+
+
+def add_diagnostics_argument(parser: ArgumentParser) -> ArgumentParser:
+    diagnostics_group = parser.add_argument_group()
+    diagnostics_group.add_argument(
+        "--diagnostics",
+        default=None,
+        type=Path,
+        help=multi_paragraph_wrap(
+            """\
+            >write the errors, warnings, etc to the given file as JSON, or as SARIF if
+            >the file ends with .sarif, with the number of times each was emitted
+
+            >NB: identical errors, warnings, etc are only shown once per target
+            """
+        ),
+        metavar="<file>",
+        dest="diagnostics",
+    )
+
+    return parser
+
+
+def add_socket_argument(parser: ArgumentParser) -> ArgumentParser:
+    socket_group = parser.add_argument_group()
+    socket_group.add_argument(
+        "--socket",
+        default=None,
+        type=Path,
+        help=multi_paragraph_wrap(
+            """\
+            >the Unix socket to listen on \033[1m(default: .rattr/rattr.sock in the
+            >project root)\033[0m
+            """
+        ),
+        metavar="PATH",
+        dest="socket",
+    )
+
+    return parser
+
+
 def add_target_file_argument(parser: ArgumentParser) -> ArgumentParser:
     target_file_group = parser.add_argument_group()
     target_file_group.add_argument(
-        "target",
+        "_targets",
+        nargs="+",
         type=Path,
         help=multi_paragraph_wrap(
             """\
-            >the target source file
+            >the target source file(s), when given multiple targets the imports are
+            >analysed once and shared between the targets
+
+            >when given "-" the newline separated targets are read from stdin
             """
         ),
         metavar="<file>",
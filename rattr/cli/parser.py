@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import argparse
+import sys
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -11,7 +12,7 @@ from rattr.cli._types import TomlArgumentType
 from rattr.cli._util import get_type_name, multi_paragraph_wrap
 from rattr.cli.toml import TOMLDecodeError, parse_project_toml
 from rattr.config import Arguments
-from rattr.config.util import find_pyproject_toml
+from rattr.config.util import find_project_root, find_pyproject_toml
 
 if TYPE_CHECKING:
     from typing import Any, NoReturn
@@ -43,6 +44,14 @@ TOML_ARGUMENT_TYPE_MAP: dict[str, TomlArgumentType] = {
     "truncate-deep-paths": TomlArgumentType.flag,
     "strict": TomlArgumentType.flag,
     "threshold": TomlArgumentType.int,
+    "cache-imports": TomlArgumentType.flag,
+    "jobs": TomlArgumentType.int,
+    "results-engine": TomlArgumentType.string,
+    "cache-summaries": TomlArgumentType.flag,
+    "cache-format": TomlArgumentType.string,
+    "low-memory": TomlArgumentType.flag,
+    "memory-stats": TomlArgumentType.flag,
+    "visitor-stats": TomlArgumentType.flag,
     "stdout": TomlArgumentType.string,
 }
 """The expected type of the arguments in the toml config file.
@@ -59,7 +68,41 @@ def parse_arguments(
     project_toml_conf: dict[str, Any] | None = None,
     exit_on_error: bool = True,
 ) -> Arguments:
-    cli_parser = make_cli_parser(exit_on_error=exit_on_error)
+    return _parse_arguments(
+        make_cli_parser(exit_on_error=exit_on_error),
+        sys_args=sys_args,
+        project_toml_conf=project_toml_conf,
+        exit_on_error=exit_on_error,
+    )
+
+
+def parse_serve_arguments(
+    *,
+    sys_args: list[str] | None = None,
+    project_toml_conf: dict[str, Any] | None = None,
+    exit_on_error: bool = True,
+) -> Arguments:
+    """Return the arguments of `rattr serve`, the targets are given per request."""
+    arguments = _parse_arguments(
+        make_serve_parser(exit_on_error=exit_on_error),
+        sys_args=sys_args,
+        project_toml_conf=project_toml_conf,
+        exit_on_error=exit_on_error,
+    )
+
+    if arguments.socket is None:
+        arguments.socket = find_project_root() / ".rattr" / "rattr.sock"
+
+    return arguments
+
+
+def _parse_arguments(
+    cli_parser: ArgumentParser,
+    *,
+    sys_args: list[str] | None = None,
+    project_toml_conf: dict[str, Any] | None = None,
+    exit_on_error: bool = True,
+) -> Arguments:
     toml_parser = make_toml_parser()
 
     project_toml_conf = _parse_project_config(
@@ -78,6 +121,9 @@ def parse_arguments(
         _toml_error(argument_error, exit_on_error=exit_on_error)
     cli_parser.parse_args(args=sys_args, namespace=arguments)
 
+    arguments._targets = _expand_targets(getattr(arguments, "_targets", []))
+    arguments.target = arguments._targets[0] if arguments._targets else Path("-")
+
     return arguments
 
 
@@ -104,11 +150,40 @@ def make_cli_parser(exit_on_error: bool = True) -> ArgumentParser:
     parser = _arguments.add_toml_config_override_argument(parser)
     parser = _arguments.add_common_arguments(parser)
     parser = _arguments.add_cache_file_argument(parser)
+    parser = _arguments.add_trace_argument(parser)
+    parser = _arguments.add_profile_argument(parser)
+    parser = _arguments.add_diagnostics_argument(parser)
     parser = _arguments.add_target_file_argument(parser)
 
     return parser
 
 
+def make_serve_parser(exit_on_error: bool = True) -> ArgumentParser:
+    parser = ArgumentParser(
+        prog="rattr serve",
+        description=multi_paragraph_wrap(
+            """\
+            Run rattr as a daemon, answering requests to analyse a given Python 3 file
+            over a Unix socket.
+
+            Each request and response is a newline delimited JSON object, see
+            `rattr.server` for the protocol.
+            """
+        ),
+        formatter_class=argparse.RawTextHelpFormatter,
+        exit_on_error=exit_on_error,
+    )
+
+    parser = _arguments.add_version_argument(parser)
+    parser = _arguments.add_toml_config_override_argument(parser)
+    parser = _arguments.add_common_arguments(parser)
+    parser = _arguments.add_socket_argument(parser)
+
+    parser.set_defaults(cache_file=None, trace=None, profile=None, diagnostics=None)
+
+    return parser
+
+
 def make_toml_parser() -> ArgumentParser:
     parser = ArgumentParser(exit_on_error=False)
     parser = _arguments.add_common_arguments(parser)
@@ -131,6 +206,27 @@ def _get_toml_override(
     return None
 
 
+def _expand_targets(targets: list[Path]) -> list[Path]:
+    """Return the given targets, where "-" is replaced by the targets from stdin.
+
+    >>> # stdin is "a.py\\nb.py\\n"
+    >>> _expand_targets([Path("-"), Path("c.py")])
+    [Path("a.py"), Path("b.py"), Path("c.py")]
+    """
+    expanded: list[Path] = []
+
+    for target in targets:
+        if str(target) != "-":
+            expanded.append(target)
+            continue
+
+        expanded += [
+            Path(line.strip()) for line in sys.stdin.readlines() if line.strip()
+        ]
+
+    return expanded
+
+
 def _toml_error(exc: Exception, *, exit_on_error: bool) -> NoReturn:
     if exit_on_error:
         error.fatal(f"error parsing project toml: {error}")
@@ -7,7 +7,7 @@ if TYPE_CHECKING:
 
 
 def gen_import_from_stmt(module: Identifier, target: Identifier) -> str:
-    if not module.isidentifier():
+    if not all(part.isidentifier() for part in module.split(".")):
         raise ValueError(f"{module!r} is not a valid identifier")
 
     if target != "*" and not target.isidentifier():
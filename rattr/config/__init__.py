@@ -3,9 +3,11 @@ from __future__ import annotations
 # isort: off
 from ._types import (
     Arguments,
+    CacheFormat,
     Config,
     FollowImports,
     Output,
+    ResultsEngine,
     FormatPath,
     ShowWarnings,
     State,
@@ -13,9 +15,11 @@ from ._types import (
 
 __all__ = [
     "Arguments",
+    "CacheFormat",
     "Config",
     "FollowImports",
     "Output",
+    "ResultsEngine",
     "FormatPath",
     "ShowWarnings",
     "State",
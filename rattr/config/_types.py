@@ -47,6 +47,25 @@ class Output(Enum):
     results = "results"
     cacheable = "cacheable"
     silent = "silent"
+    ndjson = "ndjson"
+    stats_json = "stats-json"
+
+    def __str__(self) -> str:
+        return self.value
+
+
+class ResultsEngine(Enum):
+    tree = "tree"
+    scc = "scc"
+
+    def __str__(self) -> str:
+        return self.name
+
+
+class CacheFormat(Enum):
+    json = "json"
+    compact = "compact"
+    compressed = "compressed"
 
     def __str__(self) -> str:
         return self.name
@@ -73,9 +92,51 @@ class Arguments(argparse.Namespace):
 
     force_refresh_cache: bool
     cache_file: Path | None
+    cache_imports: bool
+
+    jobs: int
+
+    results_engine: ResultsEngine
+    cache_summaries: bool
+    cache_format: CacheFormat
+
+    low_memory: bool
+    memory_stats: bool
+    visitor_stats: bool
 
+    trace: Path | None
+    """From `[--trace <file>]`, the file to write the Chrome trace events to."""
+
+    profile: Path | None
+    """From `[--profile <dir>]`, the directory to write the profile of each phase to."""
+
+    diagnostics: Path | None
+    """From `[--diagnostics <file>]`, the file to write the errors, warnings, etc to."""
+
+    _targets: list[Path]
     target: Path
 
+    socket: Path | None
+    """From `rattr serve [--socket PATH]`, the targets are then given per request."""
+
+    @property
+    def targets(self) -> list[Path]:
+        """Return the targets, the current `target` is always the first target."""
+        targets: list[Path] | None = getattr(self, "_targets", None)
+
+        if not targets:
+            return [self.target]
+
+        return targets
+
+    @property
+    def is_in_batch_mode(self) -> bool:
+        return len(self.targets) > 1
+
+    @property
+    def is_serving(self) -> bool:
+        return getattr(self, "socket", None) is not None
+
     @property
     def follow_imports(self) -> FollowImports:
         if self._follow_imports_level == 0:
@@ -47,6 +47,7 @@ def find_pyproject_toml() -> Path | None:
 def validate_arguments(arguments: Arguments) -> Arguments:
     """Validate and return the given arguments."""
     from rattr import error  # circular import as error.info(...) etc use config
+    from rattr.config._types import ResultsEngine
 
     if arguments._follow_imports_level == 0:  # type: ignore[reportPrivateUsage]
         error.rattr("follow imports not set, results likely to be incomplete")
@@ -57,13 +58,26 @@ def validate_arguments(arguments: Arguments) -> Arguments:
     if arguments.threshold < 0:
         error.fatal("threshold must be a positive integer")
 
-    if not arguments.target.is_file():
-        error.fatal(f"file {str(arguments.target)!r} does not exist")
+    if arguments.jobs < 0:
+        error.fatal("jobs must be a positive integer")
 
-    if arguments.target.suffix != ".py":
-        error.rattr(
-            f"rattr target expects '*.py', got {str(arguments.target)!r}; "
-            f"did you specify the right target?"
-        )
+    if arguments.cache_summaries and arguments.results_engine != ResultsEngine.scc:
+        error.rattr("--cache-summaries has no effect without --results-engine scc")
+
+    if arguments.is_in_batch_mode and arguments.cache_file is not None:
+        error.fatal("a cache file can not be given when given multiple targets")
+
+    if arguments.is_serving:
+        return arguments
+
+    for target in arguments.targets:
+        if not target.is_file():
+            error.fatal(f"file {str(target)!r} does not exist")
+
+        if target.suffix != ".py":
+            error.rattr(
+                f"rattr target expects '*.py', got {str(target)!r}; "
+                f"did you specify the right target?"
+            )
 
     return arguments
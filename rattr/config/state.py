@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 from contextlib import contextmanager
+from dataclasses import replace
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from rattr.config._types import Config
+from rattr.config._types import Config, State
 
 if TYPE_CHECKING:
     from collections.abc import Generator
@@ -35,3 +36,69 @@ def enter_file(new_file: Path | str | None) -> Generator[None, None, None]:
     yield
 
     config.state.current_file = old_file
+
+
+@contextmanager
+def enter_target(new_target: Path) -> Generator[None, None, None]:
+    """Set the target and give it a fresh state while in scope.
+
+    This is used in batch mode s.t. the badness, etc, of each target is independent of
+    the other targets.
+
+    >>> config = Config()
+    >>> with enter_target(Path("a.py")):
+    ...     config.increment_badness(1)
+    ...     print(config.arguments.target, config.state.badness)
+    a.py 1
+    >>> with enter_target(Path("b.py")):
+    ...     print(config.arguments.target, config.state.badness)
+    b.py 0
+    """
+    config = Config()
+
+    old_target, old_state = config.arguments.target, config.state
+    config.arguments.target, config.state = new_target, State()
+
+    try:
+        yield
+    finally:
+        config.arguments.target, config.state = old_target, old_state
+
+
+@contextmanager
+def accrue_badness() -> Generator[State, None, None]:
+    """Give the badness accrued while in scope, which is set on leaving the scope.
+
+    >>> config = Config()
+    >>> with accrue_badness() as accrued:
+    ...     config.increment_badness(1)
+    >>> print(accrued.full_badness)
+    1
+    """
+    config = Config()
+
+    before = replace(config.state)
+    accrued = State()
+
+    try:
+        yield accrued
+    finally:
+        accrued.badness_from_target_file = (
+            config.state.badness_from_target_file - before.badness_from_target_file
+        )
+        accrued.badness_from_imports = (
+            config.state.badness_from_imports - before.badness_from_imports
+        )
+        accrued.badness_from_simplification = (
+            config.state.badness_from_simplification
+            - before.badness_from_simplification
+        )
+
+
+def replay_badness(accrued: State) -> None:
+    """Add the badness accrued elsewhere to the state, see `accrue_badness`."""
+    config = Config()
+
+    config.state.badness_from_target_file += accrued.badness_from_target_file
+    config.state.badness_from_imports += accrued.badness_from_imports
+    config.state.badness_from_simplification += accrued.badness_from_simplification
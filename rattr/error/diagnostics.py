@@ -0,0 +1,340 @@
+"""Collect the errors, warnings, etc emitted by rattr, see `Diagnostics`.
+
+Each diagnostic is keyed by its level, file, line, and message; a diagnostic identical
+to one already emitted for the current target (i.e. the same unresolvable call reached
+from many callers) is counted but not shown again. The badness of every diagnostic is
+still incremented by `rattr.error`, thus deduplication does not change the badness.
+
+When buffered the shown diagnostics are written to stderr in batches of
+`FLUSH_EVERY`, rather than line-by-line, and otherwise on `flush` (i.e. on a fatal
+error, before the outputs of each target, and at exit). The stream is that which was
+`sys.stderr` when the diagnostic was emitted, s.t. `redirect_stderr` works as expected.
+
+A `--jobs` worker defers the diagnostics written to its stderr, which are then replayed
+by the main process (see `replay`), s.t. they are deduplicated as though the module had
+been analysed in the main process. Likewise, in batch mode, the diagnostics of an import
+are captured when it is analysed (see `capture`) and replayed for each later target
+which shares the import.
+
+The diagnostics can be written to a file as JSON or as SARIF, see `write_diagnostics`
+and `--diagnostics`.
+"""
+from __future__ import annotations
+
+import json
+import sys
+from contextlib import contextmanager
+from enum import Enum
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import attrs
+
+from rattr.config import Config
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+    from typing import Final, TextIO, Union
+
+    from rattr.config import State
+    from rattr.versioning.typing import TypeAlias
+
+    Message: TypeAlias = Union[str, Callable[[], str]]
+    """The message, or a callable returning the message if it is to be shown."""
+
+    DiagnosticKey: TypeAlias = tuple["Level", Union[str, None], Union[int, None], str]
+
+
+FLUSH_EVERY: Final = 256
+"""The number of diagnostics buffered before they are written to stderr."""
+
+ERROR_TEMPLATE: Final = "{prefix}: {optional_file_info}{optional_line_info}: {message}"
+FILE_INFO_TEMPLATE: Final = "\033[1m{}\033[0m"
+LINE_INFO_TEMPLATE: Final = "\033[1m:{}:{}\033[0m"
+
+SARIF_SCHEMA: Final = "https://json.schemastore.org/sarif-2.1.0.json"
+SARIF_VERSION: Final = "2.1.0"
+
+
+class Level(Enum):
+    rattr = "\033[34;1mrattr\033[0m"  # Blue
+    info = "\033[33;1minfo\033[0m"  # Yellow / Orange
+    warning = "\033[33;1mwarning\033[0m"  # Yellow / Orange
+    error = "\033[31;1merror\033[0m"  # Red
+    fatal = "\033[31;1mfatal\033[0m"  # Red
+
+
+SARIF_LEVELS: Final = {
+    Level.rattr: "note",
+    Level.info: "note",
+    Level.warning: "warning",
+    Level.error: "error",
+    Level.fatal: "error",
+}
+
+
+@attrs.mutable
+class Diagnostic:
+    level: Level
+    message: str
+
+    file: str | None
+    """The file of the culprit, or the current file or target if there is no culprit."""
+
+    line: int | None
+    column: int | None
+
+    count: int = 1
+    """The number of times the diagnostic was emitted."""
+
+    @property
+    def key(self) -> DiagnosticKey:
+        return (self.level, self.file, self.line, self.message)
+
+    def render(self) -> str:
+        """Return the diagnostic as shown on stderr."""
+        config = Config()
+
+        file = config.get_formatted_path(self.file) or ""
+        file_info = FILE_INFO_TEMPLATE.format(file)
+
+        if self.line is not None:
+            line_info = LINE_INFO_TEMPLATE.format(self.line, self.column)
+        else:
+            line_info = ""
+
+        return ERROR_TEMPLATE.format(
+            prefix=self.level.value,
+            optional_file_info=file_info,
+            optional_line_info=line_info,
+            message=self.message,
+        )
+
+
+class Diagnostics:
+    """The diagnostics of the current process, see the module docstring."""
+
+    def __init__(self) -> None:
+        self.is_buffered: bool = False
+
+        self.records: dict[DiagnosticKey, Diagnostic] = {}
+        """The unique diagnostics, in the order in which they were first emitted."""
+
+        self.repeated: int = 0
+        """The number of diagnostics not shown as they were identical to another."""
+
+        # The diagnostics shown for the current target, i.e. the current state
+        self._seen: set[DiagnosticKey] = set()
+        self._scope: State | None = None
+
+        self.deferred: list[Diagnostic] = []
+        """The diagnostics which were to be shown on the deferred stream."""
+
+        self._captures: list[list[Diagnostic]] = []
+
+        self._pending: list[str] = []
+        self._stream: TextIO | None = None
+        self._deferred_stream: TextIO | None = None
+
+    def reset(
+        self,
+        *,
+        buffered: bool = False,
+        deferred_stream: TextIO | None = None,
+    ) -> None:
+        """Forget the diagnostics thus far, including those not yet flushed.
+
+        When given, the diagnostics to be shown on `deferred_stream` are instead kept in
+        `deferred`, to be replayed by the main process (i.e. when in a `--jobs` worker).
+
+        NB: A `--jobs` worker inherits the diagnostics of the main process when forked,
+        thus they must be forgotten rather than flushed.
+        """
+        self.is_buffered = buffered
+        self.records = {}
+        self.repeated = 0
+        self.deferred = []
+
+        self._seen = set()
+        self._scope = None
+
+        self._captures = []
+
+        self._pending = []
+        self._stream = None
+        self._deferred_stream = deferred_stream
+
+    def emit(
+        self,
+        level: Level,
+        message: Message,
+        file: str | None,
+        line: int | None,
+        column: int | None,
+    ) -> None:
+        """Show the diagnostic, unless it is identical to one already emitted."""
+        if not isinstance(message, str):
+            message = message()
+
+        diagnostic = Diagnostic(level, message, file, line, column)
+
+        if not self._record(diagnostic):
+            return
+
+        if sys.stderr is self._deferred_stream:
+            self.deferred.append(diagnostic)
+        else:
+            self.write(diagnostic.render() + "\n")
+
+    def replay(self, diagnostics: Iterable[Diagnostic]) -> None:
+        """Show the diagnostics deferred by a `--jobs` worker, as if emitted here.
+
+        Likewise the diagnostics of an import analysed for a previous target, or cached,
+        which are themselves deferred when replayed in a `--jobs` worker.
+        """
+        for diagnostic in diagnostics:
+            diagnostic = attrs.evolve(diagnostic)
+
+            if not self._record(diagnostic):
+                continue
+
+            if sys.stderr is self._deferred_stream:
+                self.deferred.append(diagnostic)
+            else:
+                self.write(diagnostic.render() + "\n")
+
+    @contextmanager
+    def capture(self) -> Iterator[list[Diagnostic]]:
+        """Give a copy of each diagnostic emitted, or replayed, while in scope.
+
+        The captured diagnostics include those identical to one already emitted, s.t.
+        when replayed for another target they are counted, and shown, as if emitted.
+        """
+        captured: list[Diagnostic] = []
+        self._captures.append(captured)
+
+        try:
+            yield captured
+        finally:
+            self._captures = [c for c in self._captures if c is not captured]
+
+    def _record(self, diagnostic: Diagnostic) -> bool:
+        """Record the diagnostic, returning `True` if it is to be shown."""
+        config = Config()
+
+        for captured in self._captures:
+            captured.append(attrs.evolve(diagnostic))
+
+        if config.state is not self._scope:
+            self._seen = set()
+            self._scope = config.state
+
+        key = diagnostic.key
+        is_shown = key not in self._seen
+
+        self._seen.add(key)
+        self.repeated += diagnostic.count - is_shown
+
+        if (existing := self.records.get(key)) is not None:
+            existing.count += diagnostic.count
+        else:
+            self.records[key] = diagnostic
+
+        return is_shown
+
+    def flush(self) -> None:
+        """Write the buffered diagnostics to their stream."""
+        if not self._pending or self._stream is None:
+            return
+
+        pending, self._pending = "".join(self._pending), []
+
+        self._stream.write(pending)
+        self._stream.flush()
+
+    def write(self, text: str) -> None:
+        """Write the text to stderr, in order with (and buffered as) the diagnostics."""
+        if not text:
+            return
+
+        if sys.stderr is not self._stream:
+            self.flush()
+            self._stream = sys.stderr
+
+        self._pending.append(text)
+
+        if not self.is_buffered or len(self._pending) >= FLUSH_EVERY:
+            self.flush()
+
+
+diagnostics: Final = Diagnostics()
+"""The diagnostics of the current process."""
+
+
+def write_diagnostics(file: Path, records: Iterable[Diagnostic]) -> None:
+    """Write the diagnostics to the given file, as SARIF if it is a `.sarif` file."""
+    if file.suffix == ".sarif":
+        report = _sarif_report(records)
+    else:
+        report = {"diagnostics": [_json_record(d) for d in records]}
+
+    file.parent.mkdir(parents=True, exist_ok=True)
+    file.write_text(json.dumps(report, indent=4) + "\n")
+
+
+def _json_record(diagnostic: Diagnostic) -> dict[str, object]:
+    return {
+        "level": diagnostic.level.name,
+        "message": diagnostic.message,
+        "file": diagnostic.file,
+        "line": diagnostic.line,
+        "column": diagnostic.column,
+        "count": diagnostic.count,
+    }
+
+
+def _sarif_report(records: Iterable[Diagnostic]) -> dict[str, object]:
+    from rattr import _version
+
+    return {
+        "$schema": SARIF_SCHEMA,
+        "version": SARIF_VERSION,
+        "runs": [
+            {
+                "tool": {
+                    "driver": {
+                        "name": "rattr",
+                        "version": _version.version,
+                        "informationUri": "https://github.com/SuadeLabs/rattr",
+                    }
+                },
+                "results": [_sarif_result(d) for d in records],
+            }
+        ],
+    }
+
+
+def _sarif_result(diagnostic: Diagnostic) -> dict[str, object]:
+    result: dict[str, object] = {
+        "level": SARIF_LEVELS[diagnostic.level],
+        "message": {"text": diagnostic.message},
+        "occurrenceCount": diagnostic.count,
+    }
+
+    if diagnostic.file is None:
+        return result
+
+    location: dict[str, object] = {
+        "artifactLocation": {"uri": Path(diagnostic.file).as_posix()},
+    }
+
+    # NB: SARIF lines and columns are 1-based, the column of an AST node is 0-based
+    if diagnostic.line is not None:
+        location["region"] = {
+            "startLine": diagnostic.line,
+            "startColumn": (diagnostic.column or 0) + 1,
+        }
+
+    result["locations"] = [{"physicalLocation": location}]
+
+    return result
@@ -1,37 +1,35 @@
-"""Rattr error/logging functions."""
+"""Rattr error/logging functions.
+
+The message may be given as a callable returning the message, s.t. it is only built if
+the diagnostic is to be shown (see `rattr.error.diagnostics`).
+"""
 
 from __future__ import annotations
 
 import ast
 import sys
-from enum import Enum
 from typing import TYPE_CHECKING, NoReturn
 
 from rattr.config import Config, ShowWarnings
+from rattr.error.diagnostics import (
+    FILE_INFO_TEMPLATE,
+    LINE_INFO_TEMPLATE,
+    Level,
+    diagnostics,
+)
 
 if TYPE_CHECKING:
+    from rattr.error.diagnostics import Message
     from rattr.models.symbol import Symbol
 
-__ERROR = "{prefix}: {optional_file_info}{optional_line_info}: {message}"
-__FILE_INFO = "\033[1m{}\033[0m"
-__LINE_INFO = "\033[1m:{}:{}\033[0m"
-
 
 # --------------------------------------------------------------------------- #
 # Rattr errors
 # --------------------------------------------------------------------------- #
 
 
-class Level(Enum):
-    rattr = "\033[34;1mrattr\033[0m"  # Blue
-    info = "\033[33;1minfo\033[0m"  # Yellow / Orange
-    warning = "\033[33;1mwarning\033[0m"  # Yellow / Orange
-    error = "\033[31;1merror\033[0m"  # Red
-    fatal = "\033[31;1mfatal\033[0m"  # Red
-
-
 def rattr(
-    message: str,
+    message: Message,
     culprit: ast.AST | Symbol | None = None,
     badness: int = 0,
 ) -> None:
@@ -40,7 +38,7 @@ def rattr(
 
 
 def info(
-    message: str,
+    message: Message,
     culprit: ast.AST | Symbol | None = None,
     badness: int = 0,
 ) -> None:
@@ -48,9 +46,6 @@ def info(
     config = Config()
     config.increment_badness(badness)
 
-    if config.do_not_show_warnings:
-        return
-
     if config.is_in_target_file:
         warning_level = ShowWarnings.target_low_priority
     else:
@@ -63,7 +58,7 @@ def info(
 
 
 def warning(
-    message: str,
+    message: Message,
     culprit: ast.AST | Symbol | None = None,
     badness: int = 1,
 ) -> None:
@@ -71,9 +66,6 @@ def warning(
     config = Config()
     config.increment_badness(badness)
 
-    if config.do_not_show_warnings:
-        return
-
     if config.is_in_target_file:
         warning_level = ShowWarnings.target
     else:
@@ -86,7 +78,7 @@ def warning(
 
 
 def error(
-    message: str,
+    message: Message,
     culprit: ast.AST | Symbol | None = None,
     badness: int = 5,
 ) -> None:
@@ -101,7 +93,7 @@ def error(
 
 
 def fatal(
-    message: str,
+    message: Message,
     culprit: ast.AST | Symbol | None = None,
     badness: int = 0,  # noqa
 ) -> NoReturn:
@@ -119,63 +111,53 @@ def fatal(
     config.increment_badness(badness)
 
     __log(Level.fatal, message, culprit)
+    diagnostics.flush()
 
     sys.exit(1)
 
 
 def get_file_and_line_info(culprit: ast.AST | Symbol | None) -> tuple[str, str]:
     """Return the formatted line and line and file info as strings."""
-    return __file_info(culprit), __line_info(culprit)
+    config = Config()
 
+    file, line, column = __location(culprit)
 
-def __file_info(culprit: ast.AST | Symbol | None) -> str:
+    file_info = FILE_INFO_TEMPLATE.format(config.get_formatted_path(file) or "")
+
+    if line is not None:
+        line_info = LINE_INFO_TEMPLATE.format(line, column)
+    else:
+        line_info = ""
+
+    return file_info, line_info
+
+
+def __location(
+    culprit: ast.AST | Symbol | None,
+) -> tuple[str | None, int | None, int | None]:
+    """Return the file, line, and column of the culprit."""
     from rattr.models.symbol import Symbol
 
     config = Config()
-    current_file = config.formatted_current_file_path
 
     if isinstance(culprit, Symbol) and (location := culprit.location) is not None:
-        file = config.get_formatted_path(location.file)
-    elif current_file:
-        file = current_file
-    else:
-        file = config.formatted_target_path
+        return str(location.file), location.lineno, location.col_offset
 
-    if file is None:
-        file = ""  # never
+    if (file := config.state.current_file) is None:
+        file = config.arguments.target
 
-    return __FILE_INFO.format(file)
+    if file is not None:
+        file = str(file)
 
+    if culprit is None or isinstance(culprit, Symbol):
+        return file, None, None
 
-def __line_info(culprit: ast.AST | Symbol | None) -> str:
-    from rattr.models.symbol import Symbol
-
-    if isinstance(culprit, Symbol):
-        if (location := culprit.location) is not None:
-            line_info = __LINE_INFO.format(location.lineno, location.col_offset)
-        else:
-            line_info = ""
-    elif culprit is None:
-        line_info = ""
-    else:
-        line_info = __LINE_INFO.format(culprit.lineno, culprit.col_offset)
-
-    return line_info
+    return file, culprit.lineno, culprit.col_offset
 
 
 def __log(
     level: Level,
-    message: str,
+    message: Message,
     culprit: ast.AST | Symbol | None = None,
 ) -> None:
-    file_info, line_info = get_file_and_line_info(culprit)
-
-    print(
-        __ERROR.format(
-            prefix=level.value,
-            optional_file_info=file_info,
-            optional_line_info=line_info,
-            message=message,
-        ),
-        file=sys.stderr,
-    )
+    diagnostics.emit(level, message, *__location(culprit))
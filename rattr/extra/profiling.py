@@ -0,0 +1,137 @@
+"""Profile each phase of an analysis run separately, see `--profile`.
+
+Each phase is profiled by its own `cProfile.Profile`, s.t. the cost of, for example,
+locating modules is not mixed with the cost of simplifying the results:
+
+    with profile_phase("parse"):
+        ...
+
+Phases are only profiled while the profiler is profiling, otherwise `profile_phase`
+does nothing. A phase entered again (i.e. for each target in batch mode) adds to the
+same profile, and a phase entered within another phase is profiled as part of the outer
+phase, as only one profiler may be active at a time.
+
+The profile of each phase is written to `<phase>.pstats`, along with a summary of the
+top functions of each phase in `summary.txt` (see `write_profiles`).
+"""
+from __future__ import annotations
+
+import io
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from cProfile import Profile
+    from pathlib import Path
+    from typing import Final
+
+
+TOP_FUNCTIONS: Final = 25
+"""The number of functions of each phase given in the summary."""
+
+
+class PhaseProfiler:
+    """Profile the phases of the current process, see the module docstring."""
+
+    def __init__(self) -> None:
+        self.profiles: dict[str, Profile] | None = None
+        self.active: str | None = None
+
+    @property
+    def is_profiling(self) -> bool:
+        return self.profiles is not None
+
+    def start(self) -> None:
+        """Start profiling phases, discarding any previous profiles."""
+        self.profiles = {}
+        self.active = None
+
+    def stop(self) -> dict[str, Profile]:
+        """Stop profiling phases, and return the profile of each phase."""
+        profiles, self.profiles = self.profiles or {}, None
+        return profiles
+
+    def phase(self, name: str) -> _Phase | _NoPhase:
+        """Return a context manager to profile the context as the phase, if any."""
+        if self.profiles is None or self.active is not None:
+            return _NO_PHASE
+
+        return _Phase(self, name)
+
+
+class _Phase:
+    __slots__ = ("profiler", "name", "profile")
+
+    def __init__(self, profiler: PhaseProfiler, name: str) -> None:
+        from cProfile import Profile
+
+        if profiler.profiles is None:
+            raise RuntimeError("not profiling")  # never
+
+        self.profiler = profiler
+        self.name = name
+        self.profile = profiler.profiles.setdefault(name, Profile())
+
+    def __enter__(self) -> None:
+        self.profiler.active = self.name
+        self.profile.enable()
+
+    def __exit__(self, *_) -> None:
+        self.profile.disable()
+        self.profiler.active = None
+
+
+class _NoPhase:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *_) -> None:
+        return None
+
+
+_NO_PHASE: Final = _NoPhase()
+
+
+profiler: Final = PhaseProfiler()
+"""The phase profiler of the current process."""
+
+
+def profile_phase(name: str) -> _Phase | _NoPhase:
+    """Return a context manager to profile the context as the phase, if profiling."""
+    return profiler.phase(name)
+
+
+def write_profiles(
+    directory: Path,
+    profiles: dict[str, Profile],
+    *,
+    top: int = TOP_FUNCTIONS,
+) -> None:
+    """Write the profile of each phase, and the summary, to the given directory.
+
+    The `.pstats` files can be read by `pstats.Stats`, snakeviz, gprof2dot, etc.
+    """
+    from pstats import SortKey, Stats
+
+    directory.mkdir(parents=True, exist_ok=True)
+
+    summary = io.StringIO()
+
+    for name, profile in profiles.items():
+        profile.dump_stats(directory / f"{name}.pstats")
+
+        stats = Stats(profile, stream=summary)
+
+        summary.write(f"{'=' * 88}\n")
+        summary.write(f"{name}: {stats.total_tt:.6f} s\n")
+        summary.write(f"{'=' * 88}\n")
+
+        for sort_key, description in (
+            (SortKey.TIME, "own time"),
+            (SortKey.CUMULATIVE, "cumulative time"),
+        ):
+            summary.write(f"\nTop {top} functions by {description}\n")
+            stats.sort_stats(sort_key).print_stats(top)
+
+    (directory / "summary.txt").write_text(summary.getvalue())
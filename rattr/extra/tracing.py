@@ -0,0 +1,150 @@
+"""A timeline of the spans of an analysis run, see `--trace`.
+
+The spans are recorded as Chrome trace events (i.e. complete events, "ph": "X"), thus
+the written trace can be opened in `chrome://tracing`, Perfetto, or Speedscope:
+
+    with span("parse", "import", origin=origin):
+        ...
+
+Spans are only recorded while the tracer is tracing, otherwise `span` does nothing, s.t.
+the spans can be left in place at (almost) no cost.
+
+The timestamps are given by the monotonic `perf_counter_ns`, which is shared between
+processes, thus the events recorded by the `--jobs` workers can be merged into the
+trace of the main process (see `Tracer.extend`).
+"""
+from __future__ import annotations
+
+import os
+import threading
+from time import perf_counter_ns
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from typing import Any, Final
+
+    from rattr.versioning.typing import TypeAlias
+
+    TraceEvent: TypeAlias = dict[str, Any]
+
+
+class Tracer:
+    """Record the spans of the current process, see the module docstring."""
+
+    def __init__(self) -> None:
+        self.events: list[TraceEvent] | None = None
+
+    @property
+    def is_tracing(self) -> bool:
+        return self.events is not None
+
+    def start(self) -> None:
+        """Start recording spans, discarding any previously recorded."""
+        self.events = []
+
+    def stop(self) -> list[TraceEvent]:
+        """Stop recording spans, and return the recorded events."""
+        events, self.events = self.events or [], None
+        return events
+
+    def extend(self, events: list[TraceEvent]) -> None:
+        """Add the events recorded by another process (i.e. a worker), if tracing."""
+        if self.events is not None:
+            self.events.extend(events)
+
+    def span(self, name: str, category: str, **args: Any) -> _Span | _NoSpan:
+        """Return a context manager to record the context as a span, if tracing."""
+        if self.events is None:
+            return _NO_SPAN
+
+        return _Span(self.events, name, category, args)
+
+
+class _Span:
+    __slots__ = ("events", "name", "category", "args", "start")
+
+    def __init__(
+        self,
+        events: list[TraceEvent],
+        name: str,
+        category: str,
+        args: dict[str, Any],
+    ) -> None:
+        self.events = events
+        self.name = name
+        self.category = category
+        self.args = args
+
+    def __enter__(self) -> None:
+        self.start = perf_counter_ns()
+
+    def __exit__(self, *_) -> None:
+        end = perf_counter_ns()
+
+        self.events.append(
+            {
+                "name": self.name,
+                "cat": self.category,
+                "ph": "X",
+                "ts": self.start / 1000,
+                "dur": (end - self.start) / 1000,
+                "pid": os.getpid(),
+                "tid": threading.get_native_id(),
+                "args": self.args,
+            }
+        )
+
+
+class _NoSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *_) -> None:
+        return None
+
+
+_NO_SPAN: Final = _NoSpan()
+
+
+tracer: Final = Tracer()
+"""The tracer of the current process."""
+
+
+def span(name: str, category: str, **args: Any) -> _Span | _NoSpan:
+    """Return a context manager to record the context as a span, if tracing."""
+    return tracer.span(name, category, **args)
+
+
+def write_trace(file: Path, events: list[TraceEvent]) -> None:
+    """Write the events to the given file as a Chrome trace (i.e. JSON object format).
+
+    Each process is named in the trace, s.t. the main process and the `--jobs` workers
+    are distinguished in the viewer.
+    """
+    import json
+
+    main_pid = os.getpid()
+    pids = sorted({event["pid"] for event in events} | {main_pid})
+
+    process_names = [
+        {
+            "name": "process_name",
+            "ph": "M",
+            "pid": pid,
+            "args": {"name": "rattr" if pid == main_pid else "rattr worker"},
+        }
+        for pid in pids
+    ]
+
+    file.parent.mkdir(parents=True, exist_ok=True)
+    file.write_text(
+        json.dumps(
+            {
+                "traceEvents": [*process_names, *events],
+                "displayTimeUnit": "ms",
+            }
+        )
+    )
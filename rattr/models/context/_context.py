@@ -173,16 +173,13 @@ class Context(MutableMapping[Identifier, Symbol]):
         Returns:
             CallableSymbol | None: The callable symbol.
         """
-        canonical = with_call_brackets(callee)
-        _error = f"unable to resolve call to {canonical!r}, {{reason}}"
-
         name = without_call_brackets(callee).replace("*", "")
         (lhs_name, *_) = name.split(".")
 
         if is_call_to_literal(name):
             if warn:
                 error.info(
-                    _error.format(reason="target lhs is a literal"),
+                    lambda: _unresolved_call(callee, "target lhs is a literal"),
                     culprit=culprit,
                 )
             return None
@@ -191,12 +188,14 @@ class Context(MutableMapping[Identifier, Symbol]):
             if warn:
                 if "." in name:
                     error.info(
-                        _error.format(reason="target lhs is run-time dependent"),
+                        lambda: _unresolved_call(
+                            callee, "target lhs is run-time dependent"
+                        ),
                         culprit=culprit,
                     )
                 else:
                     error.error(
-                        _error.format(reason="target is run-time dependent"),
+                        _unresolved_call(callee, "target is run-time dependent"),
                         culprit=culprit,
                     )
             return None
@@ -207,7 +206,7 @@ class Context(MutableMapping[Identifier, Symbol]):
         if is_call_to_method(target, name, lhs_target, lhs_name):
             if warn and not is_call_to_method_on_py_type(name):
                 error.info(
-                    _error.format(reason="target is a method"),
+                    lambda: _unresolved_call(callee, "target is a method"),
                     culprit=culprit,
                 )
             return target
@@ -226,7 +225,7 @@ class Context(MutableMapping[Identifier, Symbol]):
                 return None
             if warn:
                 error.warning(
-                    _error.format(reason="target is undefined"),
+                    lambda: _unresolved_call(callee, "target is undefined"),
                     culprit=culprit,
                 )
             return None
@@ -234,7 +233,7 @@ class Context(MutableMapping[Identifier, Symbol]):
         if is_call_to_call_result(culprit):
             if warn:
                 error.error(
-                    _error.format(reason="target is a call on a call"),
+                    _unresolved_call(callee, "target is a call on a call"),
                     culprit=culprit,
                 )
             return target
@@ -246,30 +245,43 @@ class Context(MutableMapping[Identifier, Symbol]):
                 if target is not None:
                     if "." not in name and self.declares(target.name):
                         error.error(
-                            _error.format(
-                                reason="target is likely a procedural parameter",
+                            _unresolved_call(
+                                callee, "target is likely a procedural parameter"
                             ),
                             culprit=culprit,
                         )
                     elif "." in target.name:
                         error.info(
-                            _error.format(reason="target is a method"),
+                            lambda: _unresolved_call(callee, "target is a method"),
                             culprit=culprit,
                         )
                     else:
                         error.error(
-                            _error.format(reason="target is not callable"),
+                            _unresolved_call(callee, "target is not callable"),
                             culprit=culprit,
                         )
                 else:
                     error.error(
-                        _error.format(reason="target is not callable"),
+                        _unresolved_call(callee, "target is not callable"),
                         culprit=culprit,
                     )
             return target
 
         return target
 
+    def copy_on_write(self) -> Context:
+        """Return a copy of the context, and its ancestors, which is copied on write.
+
+        Unlike `copy.deepcopy` the symbols (and their tokens) are shared, and the symbol
+        table of each context is copied only when it is first modified, see
+        `SymbolTable.copy_on_write`.
+        """
+        return Context(
+            self.parent.copy_on_write() if self.parent is not None else None,
+            symbol_table=self.symbol_table.copy_on_write(),
+            file=self.file,
+        )
+
     # TODO Note to self: I don't like this method name, change it!
     def declares(self, id: Identifier) -> bool:
         """Return `True` if the id was defined in this context, not a parent."""
@@ -322,14 +334,16 @@ class Context(MutableMapping[Identifier, Symbol]):
     # Syntactic sugar methods
     # ================================================================================ #
 
-    def expand_starred_imports(self) -> Context:
+    def expand_starred_imports(self, *, seen: set[Path] | None = None) -> Context:
         """Recursively follow starred imports and add the discovered names to the scope.
 
-        This is an in-place operation which returns self.
+        This is an in-place operation which returns self. When given, `seen` is updated
+        with the origin of each module that was expanded.
         """
         from rattr.models.context._root_context import compile_root_context
 
-        seen: set[Path] = set()
+        if seen is None:
+            seen = set()
         queue = self.get_starred_imports(seen_by_origin=seen)
 
         # BFS the unseen starred imports
@@ -412,22 +426,44 @@ class Context(MutableMapping[Identifier, Symbol]):
     # ================================================================================ #
 
     def __getitem__(self, __key: Identifier) -> Symbol:
-        if __key in self.symbol_table:
-            return self.symbol_table.__getitem__(__key)
-
-        if self.parent is None:
+        if (symbol := self.get(__key)) is None:
             raise KeyError(__key)
 
-        return self.parent.__getitem__(__key)
+        return symbol
 
-    def __setitem__(self, __key: Identifier, __value: Symbol) -> None:
-        _error = f"symbol key and id do not match: {__key!r} != {__value.id!r}"
+    def __contains__(self, __key: object) -> bool:
+        # Faster than Mapping's default, which catches the KeyError of a missing key
+        context = self
+
+        while context is not None:
+            if __key in context.symbol_table:
+                return True
 
-        if __key == "*" and not __value.id.endswith(".*"):
-            raise ValueError(_error)
+            context = context.parent
 
-        if __key != "*" and __key != __value.id:
-            raise ValueError(_error)
+        return False
+
+    def get(self, __key: Identifier, default: Symbol | None = None) -> Symbol | None:
+        context = self
+
+        while context is not None:
+            if (symbol := context.symbol_table.get(__key)) is not None:
+                return symbol
+
+            context = context.parent
+
+        return default
+
+    def __setitem__(self, __key: Identifier, __value: Symbol) -> None:
+        if __key == "*":
+            is_valid_key = __value.id.endswith(".*")
+        else:
+            is_valid_key = __key == __value.id
+
+        if not is_valid_key:
+            raise ValueError(
+                f"symbol key and id do not match: {__key!r} != {__value.id!r}"
+            )
 
         return self.symbol_table.add(__value)
 
@@ -455,10 +491,28 @@ class Context(MutableMapping[Identifier, Symbol]):
             yield from context.symbol_table.__iter__()
 
     def __len__(self) -> int:
-        return self.all_symbols.__len__()
+        # Count each name once, in the innermost context to declare it (i.e. a name
+        # shadowed in a descendant context is not counted again)
+        length = 0
+        descendants: list[Context] = []
+        context = self
+
+        while context is not None:
+            length += sum(
+                not any(name in d.symbol_table for d in descendants)
+                for name in context.symbol_table.names
+            )
+            descendants.append(context)
+            context = context.parent
+
+        return length
 
     def clear(self) -> None:
         raise TypeError("a context is mutable but not re-usable")
 
     def update(self) -> None:
         raise TypeError("a context is mutable but not re-usable")
+
+
+def _unresolved_call(callee: Identifier, reason: str) -> str:
+    return f"unable to resolve call to {with_call_brackets(callee)!r}, {reason}"
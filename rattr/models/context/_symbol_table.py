@@ -10,13 +10,16 @@ from rattr.ast.types import Identifier
 from rattr.models.symbol import Symbol
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Iterator, KeysView, ValuesView
+    from collections.abc import ItemsView, Iterable, Iterator, KeysView, ValuesView
 
 
 @attrs.mutable
 class SymbolTable(MutableMapping[Identifier, Symbol]):
     _symbols: dict[Identifier, Symbol] = field(init=False, factory=dict)
 
+    _is_shared: bool = field(init=False, default=False, eq=False, repr=False)
+    """`True` if `_symbols` may be shared with another table, see `copy_on_write`."""
+
     @property
     def names(self) -> KeysView[Identifier]:
         return self._symbols.keys()
@@ -59,6 +62,22 @@ class SymbolTable(MutableMapping[Identifier, Symbol]):
         del self[id]
         return symbol
 
+    def copy_on_write(self) -> SymbolTable:
+        """Return a copy of the symbol table which shares the symbols until modified.
+
+        As symbols are immutable only the underlying dict need be copied, and only once
+        either this table or the copy is first modified.
+        """
+        copy = SymbolTable()
+        copy._symbols = self._symbols
+        copy._is_shared = self._is_shared = True
+        return copy
+
+    def _before_modification(self) -> None:
+        if self._is_shared:
+            self._symbols = dict(self._symbols)
+            self._is_shared = False
+
     # ================================================================================ #
     # Mutable mapping abstract methods and mixin-overrides
     # ================================================================================ #
@@ -67,9 +86,11 @@ class SymbolTable(MutableMapping[Identifier, Symbol]):
         return self._symbols.__getitem__(__key)
 
     def __setitem__(self, __key: Identifier, __value: Symbol) -> None:
+        self._before_modification()
         return self._symbols.__setitem__(__key, __value)
 
     def __delitem__(self, __key: Identifier) -> None:
+        self._before_modification()
         return self._symbols.__delitem__(__key)
 
     def __iter__(self) -> Iterator[Identifier]:
@@ -78,6 +99,26 @@ class SymbolTable(MutableMapping[Identifier, Symbol]):
     def __len__(self) -> int:
         return self._symbols.__len__()
 
+    def __contains__(self, __key: object) -> bool:
+        # Faster than Mapping's default, which catches the KeyError of a missing key
+        return self._symbols.__contains__(__key)
+
+    def get(self, __key: Identifier, default: Symbol | None = None) -> Symbol | None:
+        return self._symbols.get(__key, default)
+
+    def keys(self) -> KeysView[Identifier]:
+        return self._symbols.keys()
+
+    def values(self) -> ValuesView[Symbol]:
+        return self._symbols.values()
+
+    def items(self) -> ItemsView[Identifier, Symbol]:
+        return self._symbols.items()
+
     def clear(self) -> None:
         # Faster than MutableMapping's default clear implementation
+        if self._is_shared:
+            self._symbols = {}
+            self._is_shared = False
+
         return self._symbols.clear()
@@ -25,6 +25,40 @@ class FileIr(MutableMapping[UserDefinedCallableSymbol, FunctionIr]):
         alias="file_ir",
     )
 
+    def copy_function_irs(self) -> FileIr:
+        """Return a copy with new function IRs, sharing the context and symbols.
+
+        Results generation extends the function IRs in-place, thus a file IR which is
+        shared between multiple targets must be copied before each use.
+        """
+        return FileIr(
+            context=self.context,
+            file_ir={
+                foc: FunctionIr.new(**foc_ir)  # type: ignore[reportGeneralTypeIssues]
+                for foc, foc_ir in self._file_ir.items()
+            },
+        )
+
+    def release_tokens(self) -> None:
+        """Release the tokens of the symbols in the IR and context, see `--low-memory`.
+
+        The results are generated from the IR, context, and locations alone, thus the
+        AST of the file need not outlive its analysis.
+        """
+        context: Context | None = self.context
+
+        while context is not None:
+            for symbol in context.symbol_table.symbols:
+                symbol.release_token()
+            context = context.parent
+
+        for foc, foc_ir in self._file_ir.items():
+            foc.release_token()
+
+            for symbols in foc_ir.values():
+                for symbol in symbols:
+                    symbol.release_token()
+
     def ir_as_dict(self) -> dict[UserDefinedCallableSymbol, FunctionIr]:
         """Return a copy of the underlying IR dictionary."""
         return copy.deepcopy(self._file_ir)
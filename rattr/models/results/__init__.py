@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 # isort: off
-from .function import FunctionResults
+from .function import FunctionResults, sort_function_results
 from .file import FileResults, FunctionName
 from .cacheable import CacheableResults
 
 __all__ = [
     "FunctionResults",
+    "sort_function_results",
     "FileResults",
     "FunctionName",
     "CacheableResults",
@@ -6,8 +6,12 @@ from typing import NamedTuple
 import attrs
 from attrs import field
 
+from rattr.config import State
+from rattr.error.diagnostics import Diagnostic
+from rattr.models.ir import FileIr
 from rattr.models.results import FileResults
-from rattr.models.util.hash import hash_file_content
+from rattr.models.symbol import Name
+from rattr.models.util.hash import hash_file_content, stat_file_content
 
 
 @attrs.frozen
@@ -15,13 +19,34 @@ class CacheableImportInfo:
     filepath: Path = field(converter=Path, factory=Path)
     filehash: str = field(default="")
 
+    filesize: int = field(default=-1)
+    filemtime_ns: int = field(default=-1)
+    """The size and modification time of the file when hashed, `-1` when unknown."""
+
     @classmethod
     def from_file(cls, filepath: str | Path) -> CacheableImportInfo:
+        # NB: Stat before hashing, s.t. a change while hashing is caught by the stat
+        filesize, filemtime_ns = stat_file_content(filepath)
+
         return CacheableImportInfo(
             filepath=filepath,
             filehash=hash_file_content(filepath),
+            filesize=filesize,
+            filemtime_ns=filemtime_ns,
         )
 
+    def is_unchanged_by_stat(self, *, recorded_at_ns: int) -> bool:
+        """Return `True` if the size and modification time of the file are unchanged.
+
+        The file must have been last modified before the info was recorded (i.e. before
+        `recorded_at_ns`), otherwise a later change within the resolution of the
+        filesystem's timestamps could go unnoticed.
+        """
+        if self.filesize < 0 or self.filemtime_ns >= recorded_at_ns:
+            return False
+
+        return stat_file_content(self.filepath) == (self.filesize, self.filemtime_ns)
+
 
 @attrs.frozen
 class CacheableResults:
@@ -32,10 +57,105 @@ class CacheableResults:
 
     filepath: Path = field(converter=Path, factory=Path)
     filehash: str = field(default="")
+    filesize: int = field(default=-1)
+    filemtime_ns: int = field(default=-1)
 
     imports: list[CacheableImportInfo] = field(factory=list)
     results: FileResults = field(factory=FileResults)
 
+    @property
+    def file_info(self) -> CacheableImportInfo:
+        return CacheableImportInfo(
+            filepath=self.filepath,
+            filehash=self.filehash,
+            filesize=self.filesize,
+            filemtime_ns=self.filemtime_ns,
+        )
+
+
+@attrs.frozen
+class CacheableBadness:
+    badness_from_target_file: int = field(default=0)
+    badness_from_imports: int = field(default=0)
+    badness_from_simplification: int = field(default=0)
+
+    @classmethod
+    def from_state(cls, state: State) -> CacheableBadness:
+        return CacheableBadness(
+            badness_from_target_file=state.badness_from_target_file,
+            badness_from_imports=state.badness_from_imports,
+            badness_from_simplification=state.badness_from_simplification,
+        )
+
+    def to_state(self) -> State:
+        return State(
+            badness_from_target_file=self.badness_from_target_file,
+            badness_from_imports=self.badness_from_imports,
+            badness_from_simplification=self.badness_from_simplification,
+        )
+
+
+@attrs.frozen
+class CacheableFileIr:
+    version: str = field(default="")
+
+    arguments_hash: str = field(default="")
+    plugins_hash: str = field(default="")
+
+    filepath: Path = field(converter=Path, factory=Path)
+    filehash: str = field(default="")
+    filesize: int = field(default=-1)
+    filemtime_ns: int = field(default=-1)
+
+    dependencies: list[CacheableImportInfo] = field(factory=list)
+    """The other files which the IR depends upon, i.e. expanded starred imports."""
+
+    lines: int = field(default=0)
+    ir: FileIr = field(kw_only=True)
+
+    # NB: Required, s.t. a cache file written without them is not up-to-date
+    diagnostics: list[Diagnostic] = field(kw_only=True)
+    """The errors, warnings, etc emitted when the module was analysed."""
+
+    badness: CacheableBadness = field(kw_only=True)
+    """The badness accrued when the module was analysed."""
+
+    @property
+    def file_info(self) -> CacheableImportInfo:
+        return CacheableImportInfo(
+            filepath=self.filepath,
+            filehash=self.filehash,
+            filesize=self.filesize,
+            filemtime_ns=self.filemtime_ns,
+        )
+
+
+@attrs.frozen
+class CacheableFunctionSummary:
+    gets: list[Name] = field(factory=list)
+    sets: list[Name] = field(factory=list)
+    dels: list[Name] = field(factory=list)
+
+    dependencies: list[CacheableImportInfo] = field(factory=list)
+    """The files whose IR the summary depends upon, including its own."""
+
+    classes: dict[str, str] = field(factory=dict)
+    """The module of the class each called class resolved to by name, `""` if none."""
+
+
+@attrs.frozen
+class CacheableFunctionSummaries:
+    version: str = field(default="")
+
+    arguments_hash: str = field(default="")
+    plugins_hash: str = field(default="")
+
+    filepath: Path = field(converter=Path, factory=Path)
+    filehash: str = field(default="")
+
+    summaries: dict[str, CacheableFunctionSummary] = field(factory=dict)
+    """The simplified IR of the module's functions, by function name."""
+
 
 class HashableArguments(NamedTuple):
     literal_value_prefix: str
@@ -33,3 +33,13 @@ class FunctionResults(TypedDict):
             "dels": set(dels),
             "calls": set(calls),
         }
+
+
+def sort_function_results(results: FunctionResults) -> dict[str, list[Identifier]]:
+    """Return the results with each of gets, sets, etc sorted, as they are serialised."""
+    return {
+        "gets": sorted(results["gets"]),
+        "sets": sorted(results["sets"]),
+        "dels": sorted(results["dels"]),
+        "calls": sorted(results["calls"]),
+    }
@@ -1,15 +1,21 @@
 from __future__ import annotations
 
-import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from os.path import isfile
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from cattrs.errors import BaseValidationError
+
 from rattr import error
 from rattr._version import version
-from rattr.config import Config
+from rattr.config import CacheFormat, Config
 from rattr.models.results import FileResults
 from rattr.models.results.cacheable import (
+    CacheableBadness,
+    CacheableFileIr,
+    CacheableFunctionSummaries,
     CacheableImportInfo,
     CacheableResults,
     HashableArguments,
@@ -22,14 +28,23 @@ from rattr.models.util.hash import (
     hash_python_objects_type_and_source_files,
     hash_string,
 )
-from rattr.models.util.serialise import deserialise
+from rattr.models.util.serialise import (
+    deserialise,
+    deserialise_unstructured,
+    get_json_converter,
+    serialise,
+    serialise_compact,
+)
 from rattr.module_locator.util import is_in_import_blacklist
 from rattr.plugins import plugins
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
     from typing import TypeVar
 
     from rattr.analyser.types import ImportIrs
+    from rattr.config import State
+    from rattr.error.diagnostics import Diagnostic
     from rattr.models.ir import FileIr
 
     T = TypeVar("T")
@@ -40,12 +55,16 @@ def make_cacheable_results(
     target_ir: FileIr,
     import_irs: ImportIrs,
 ) -> CacheableResults:
+    target = CacheableImportInfo.from_file(target_ir.context.file)
+
     return CacheableResults(
         version=version,
         arguments_hash=make_arguments_hash(),  # config.__hash__ is salted
         plugins_hash=make_plugins_hash(),  # plugins.__hash__ is salted
-        filepath=target_ir.context.file,
-        filehash=hash_file_content(target_ir.context.file),
+        filepath=target.filepath,
+        filehash=target.filehash,
+        filesize=target.filesize,
+        filemtime_ns=target.filemtime_ns,
         imports=make_cacheable_import_info(target_ir, import_irs),
         results=results,
     )
@@ -117,8 +136,20 @@ def target_cache_file_is_up_to_date(
         return False
 
     try:
-        cache = deserialise(Path(cache_filepath).read_text(), type=CacheableResults)
-    except json.decoder.JSONDecodeError:
+        raw = deserialise_unstructured(Path(cache_filepath).read_bytes())
+    except ValueError:
+        raw = None
+
+    if not isinstance(raw, dict):
+        error.info(f"cache file {str(cache_filepath)} is malformed")
+        return False
+
+    # The results are the bulk of the cache and are not needed to check it
+    raw.pop("results", None)
+
+    try:
+        cache = get_json_converter().structure(raw, CacheableResults)
+    except (BaseValidationError, ValueError, KeyError):
         error.info(f"cache file {str(cache_filepath)} is malformed")
         return False
 
@@ -127,9 +158,200 @@ def target_cache_file_is_up_to_date(
         and cache.arguments_hash == make_arguments_hash()
         and cache.plugins_hash == make_plugins_hash()
         and cache.filepath == target
-        and cache.filehash == hash_file_content(target)
-        and all(
-            import_info.filehash == hash_file_content(import_info.filepath)
-            for import_info in cache.imports
+        and files_are_unchanged(
+            [cache.file_info, *cache.imports],
+            recorded_at_ns=os.stat(cache_filepath).st_mtime_ns,
+        )
+    )
+
+
+def files_are_unchanged(
+    files: Sequence[CacheableImportInfo],
+    *,
+    recorded_at_ns: int,
+) -> bool:
+    """Return `True` if the content of each file matches its recorded hash.
+
+    A file whose size and modification time are unchanged is assumed to be unchanged
+    (see `CacheableImportInfo.is_unchanged_by_stat`), the remaining files are hashed,
+    in parallel when there are several.
+    """
+    to_hash = [
+        info
+        for info in files
+        if not info.is_unchanged_by_stat(recorded_at_ns=recorded_at_ns)
+    ]
+
+    if len(to_hash) <= 1:
+        return all(
+            info.filehash == hash_file_content(info.filepath) for info in to_hash
+        )
+
+    executor = ThreadPoolExecutor(thread_name_prefix="rattr-hash")
+
+    try:
+        filehashes = executor.map(hash_file_content, (i.filepath for i in to_hash))
+        return all(
+            info.filehash == filehash for info, filehash in zip(to_hash, filehashes)
         )
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+def serialise_for_cache(model: object, *, indent: int | None = None) -> bytes:
+    """Return the model in the cache format given by `--cache-format`.
+
+    The cache is read in any format (see `deserialise`), thus the format may be changed
+    without invalidating the existing cache files.
+    """
+    cache_format = Config().arguments.cache_format
+
+    if cache_format == CacheFormat.json:
+        return serialise(model, indent=indent).encode("utf-8")
+
+    return serialise_compact(model, compress=cache_format == CacheFormat.compressed)
+
+
+def get_import_cache_file(origin: str | Path) -> Path:
+    """Return the cache file for the import at the given origin."""
+    config = Config()
+    return config.root_cache_dir / "imports" / f"{hash_string(str(origin))}.json"
+
+
+def make_cacheable_file_ir(
+    origin: str | Path,
+    ir: FileIr,
+    *,
+    lines: int,
+    dependencies: Iterable[str | Path] = (),
+    diagnostics: Iterable[Diagnostic] = (),
+    badness: State | None = None,
+) -> CacheableFileIr:
+    file = CacheableImportInfo.from_file(origin)
+
+    return CacheableFileIr(
+        version=version,
+        arguments_hash=make_arguments_hash(),
+        plugins_hash=make_plugins_hash(),
+        filepath=file.filepath,
+        filehash=file.filehash,
+        filesize=file.filesize,
+        filemtime_ns=file.filemtime_ns,
+        dependencies=sorted(
+            (CacheableImportInfo.from_file(dependency) for dependency in dependencies),
+            key=lambda info: info.filepath,
+        ),
+        lines=lines,
+        ir=ir,
+        diagnostics=list(diagnostics),
+        badness=(
+            CacheableBadness.from_state(badness)
+            if badness is not None
+            else CacheableBadness()
+        ),
     )
+
+
+def load_cached_file_ir(origin: str | Path) -> CacheableFileIr | None:
+    """Return the cached IR for the import at the given origin, if it is up-to-date."""
+    cache_filepath = get_import_cache_file(origin)
+
+    if not isfile(cache_filepath):
+        return None
+
+    try:
+        cache = deserialise(cache_filepath.read_bytes(), type=CacheableFileIr)
+    except (BaseValidationError, ValueError, KeyError):
+        error.info(f"import cache file {str(cache_filepath)} is malformed")
+        return None
+
+    is_up_to_date = (
+        cache.version == version
+        and cache.arguments_hash == make_arguments_hash()
+        and cache.plugins_hash == make_plugins_hash()
+        and cache.filepath == Path(origin)
+        and files_are_unchanged(
+            [cache.file_info, *cache.dependencies],
+            recorded_at_ns=cache_filepath.stat().st_mtime_ns,
+        )
+    )
+
+    if not is_up_to_date:
+        return None
+
+    return cache
+
+
+def write_cached_file_ir(origin: str | Path, cache: CacheableFileIr) -> None:
+    cache_filepath = get_import_cache_file(origin)
+    cache_filepath.parent.mkdir(parents=True, exist_ok=True)
+    cache_filepath.write_bytes(serialise_for_cache(cache))
+
+
+def get_summaries_cache_file(origin: str | Path) -> Path:
+    """Return the function summaries cache file for the import at the given origin."""
+    config = Config()
+    return config.root_cache_dir / "summaries" / f"{hash_string(str(origin))}.json"
+
+
+def make_cacheable_function_summaries(
+    origin: str | Path,
+    *,
+    filehash: str | None = None,
+) -> CacheableFunctionSummaries:
+    return CacheableFunctionSummaries(
+        version=version,
+        arguments_hash=make_arguments_hash(),
+        plugins_hash=make_plugins_hash(),
+        filepath=origin,
+        filehash=filehash if filehash is not None else hash_file_content(origin),
+    )
+
+
+def load_cached_function_summaries(
+    origin: str | Path,
+    *,
+    filehash: str | None = None,
+) -> CacheableFunctionSummaries | None:
+    """Return the cached summaries for the import at the given origin, if up-to-date.
+
+    NB: The dependencies of each summary are not checked here.
+    """
+    cache_filepath = get_summaries_cache_file(origin)
+
+    if not isfile(cache_filepath):
+        return None
+
+    try:
+        cache = deserialise(
+            cache_filepath.read_bytes(),
+            type=CacheableFunctionSummaries,
+        )
+    except (BaseValidationError, ValueError, KeyError):
+        error.info(f"summaries cache file {str(cache_filepath)} is malformed")
+        return None
+
+    if filehash is None:
+        filehash = hash_file_content(origin)
+
+    is_up_to_date = (
+        cache.version == version
+        and cache.arguments_hash == make_arguments_hash()
+        and cache.plugins_hash == make_plugins_hash()
+        and cache.filepath == Path(origin)
+        and cache.filehash == filehash
+    )
+
+    if not is_up_to_date:
+        return None
+
+    return cache
+
+
+def write_cached_function_summaries(
+    origin: str | Path,
+    cache: CacheableFunctionSummaries,
+) -> None:
+    cache_filepath = get_summaries_cache_file(origin)
+    cache_filepath.parent.mkdir(parents=True, exist_ok=True)
+    cache_filepath.write_bytes(serialise_for_cache(cache))
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from rattr.models.symbol._intern import intern_name, interned_name
 from rattr.models.symbol._symbol import (
     AnyCallInterface,
     CallArguments,
@@ -36,6 +37,8 @@ __all__ = [
     "Func",
     "Import",
     "Name",
+    "intern_name",
+    "interned_name",
     "UserDefinedCallableSymbol",
     "without_call_brackets",
 ]
@@ -0,0 +1,93 @@
+"""Interning of equal names, see `interned_name` and `intern_name`.
+
+A name is interned by its file and position as well as its name and basename, s.t. every
+name keeps its own token and location. Thus, the equal names re-bound by `unbind_name`
+each time a callee is simplified into a caller share an instance, but equal names at
+different positions do not.
+
+The interned names are held weakly, s.t. a name is forgotten once it is no longer used.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from weakref import WeakValueDictionary
+
+from rattr.config.util import get_current_file
+from rattr.models.symbol._symbols import Name
+from rattr.models.symbol.util import get_basename_from_name
+
+if TYPE_CHECKING:
+    import ast
+    from pathlib import Path
+    from typing import Final, Optional, Union
+
+    from rattr.models.symbol._symbol import Location
+    from rattr.versioning.typing import TypeAlias
+
+    Position: TypeAlias = Union[tuple[int, int, Optional[int], Optional[int]], None]
+    """The line and column span of a name, or `None` when it has no token."""
+
+
+_interned_names: Final[
+    WeakValueDictionary[tuple[Path, str, str, Position], Name]
+] = WeakValueDictionary()
+
+
+def interned_name(
+    name: str,
+    basename: str | None = None,
+    *,
+    token: ast.AST | None = None,
+) -> Name:
+    """Return the interned name of the token, creating it in the current file if new."""
+    if basename is None:
+        basename = get_basename_from_name(name)
+
+    key = (get_current_file(), name, basename, _position_of(token, None))
+
+    if (interned := _interned_names.get(key)) is None:
+        interned = _interned_names[key] = Name(name, basename, token=token, file=key[0])
+
+    return interned
+
+
+def intern_name(symbol: Name) -> Name:
+    """Return the interned name equal to the given name at the same position."""
+    if symbol.interface is not None:
+        return symbol
+
+    key = (
+        _file_of(symbol),
+        symbol.name,
+        symbol.basename,
+        _position_of(symbol.token, symbol._location),
+    )
+
+    if (interned := _interned_names.get(key)) is None:
+        interned = _interned_names[key] = symbol
+
+    return interned
+
+
+def _file_of(symbol: Name) -> Path:
+    if symbol._location is not None:
+        return symbol._location.file
+    return symbol._file
+
+
+def _position_of(token: ast.AST | None, location: Location | None) -> Position:
+    if location is not None:
+        return (
+            location.lineno,
+            location.col_offset,
+            location.end_lineno,
+            location.end_col_offset,
+        )
+    if token is not None:
+        return (
+            token.lineno,
+            token.col_offset,
+            token.end_lineno,
+            token.end_col_offset,
+        )
+    return None
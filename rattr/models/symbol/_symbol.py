@@ -18,8 +18,14 @@ if TYPE_CHECKING:
     from rattr.ast.types import Identifier
 
 
-@attrs.frozen
+@attrs.frozen(cache_hash=True)
 class Symbol(abc.ABC):
+    """The base symbol.
+
+    The location of a symbol is created from its token when first accessed (most are
+    never accessed), thus the symbol instead holds the file in which it was created.
+    """
+
     name: str = field()
 
     token: Union[ast.AST, None] = field(
@@ -28,11 +34,21 @@ class Symbol(abc.ABC):
         hash=False,
         eq=False,
     )
-    location: Union[Location, None] = field(
+    _location: Union[Location, None] = field(
+        default=None,
+        alias="location",
+        kw_only=True,
+        hash=False,
+        eq=False,
+        repr=False,
+    )
+    _file: Union[Path, None] = field(
         default=None,
+        alias="file",
         kw_only=True,
         hash=False,
         eq=False,
+        repr=False,
     )
 
     interface: Union[CallInterface, None] = field(default=None, kw_only=True)
@@ -41,6 +57,31 @@ class Symbol(abc.ABC):
         if type(self) == Symbol:
             raise NotImplementedError("symbol should be sub-classed")
 
+    def __attrs_post_init__(self) -> None:
+        if self._location is None and self._file is None:
+            object.__setattr__(self, "_file", get_current_file())
+
+    @property
+    def location(self) -> Location:
+        if self._location is None:
+            object.__setattr__(self, "_location", self._location_default())
+        return self._location
+
+    def _location_default(self) -> Location:
+        if self.token is None:
+            return Location(lineno=1, col_offset=0, file=self._file)
+        return Location.from_ast_token(self.token, file=self._file)
+
+    def release_token(self) -> None:
+        """Drop the reference to the token (and thus the AST), keeping the location."""
+        if self.token is None:
+            return
+
+        if self._location is None:
+            object.__setattr__(self, "_location", self._location_default())
+
+        object.__setattr__(self, "token", None)
+
     @property
     def id(self) -> str:
         # For most symbols the name is already the identifier, but for starred-imports
@@ -59,8 +59,10 @@ PYTHON_NON_PRIMITIVE_RETURNING_BUILTINS: Final = frozenset(
 )
 """Python's builtins may-or-will return a non-primitive."""
 
+_PYTHON_BUILTINS_FILE: Final = Path(PYTHON_BUILTINS_LOCATION)
 
-@attrs.frozen
+
+@attrs.frozen(cache_hash=True)
 class Name(Symbol):
     name: str = field()
     basename: str = field()
@@ -71,7 +73,14 @@ class Name(Symbol):
         hash=False,
         eq=False,
     )
-    location: Location = field(kw_only=True, hash=False, eq=False)
+    _location: Union[Location, None] = field(
+        default=None,
+        alias="location",
+        kw_only=True,
+        hash=False,
+        eq=False,
+        repr=False,
+    )
 
     interface: Union[CallInterface, None] = field(default=None, kw_only=True)
 
@@ -79,14 +88,8 @@ class Name(Symbol):
     def _basename_default(self) -> str:
         return get_basename_from_name(self.name)
 
-    @location.default
-    def _location_default(self) -> Location:
-        if self.token is None:
-            return Location(lineno=1, col_offset=0)
-        return Location.from_ast_token(self.token)
 
-
-@attrs.frozen
+@attrs.frozen(cache_hash=True)
 class Builtin(Symbol):
     name: str = field()
 
@@ -96,25 +99,31 @@ class Builtin(Symbol):
         hash=False,
         eq=False,
     )
-    location: Location = field(kw_only=True, hash=False, eq=False)
+    _location: Union[Location, None] = field(
+        default=None,
+        alias="location",
+        kw_only=True,
+        hash=False,
+        eq=False,
+        repr=False,
+    )
+    _file: Path = field(
+        default=_PYTHON_BUILTINS_FILE,
+        alias="file",
+        kw_only=True,
+        hash=False,
+        eq=False,
+        repr=False,
+    )
 
     interface: AnyCallInterface = field(factory=AnyCallInterface, kw_only=True)
 
-    @location.default
-    def _location_default(self) -> Location:
-        file = Path(PYTHON_BUILTINS_LOCATION)
-
-        if self.token is None:
-            return Location(lineno=1, col_offset=0, file=file)
-
-        return Location.from_ast_token(self.token, file=file)
-
     @property
     def has_affect(self) -> bool:
         return self.name in PYTHON_ATTR_ACCESS_BUILTINS
 
 
-@attrs.frozen
+@attrs.frozen(cache_hash=True)
 class Import(Symbol):
     name: str = field()
     qualified_name: str = field()
@@ -125,7 +134,14 @@ class Import(Symbol):
         hash=False,
         eq=False,
     )
-    location: Location = field(kw_only=True, hash=False, eq=False)
+    _location: Union[Location, None] = field(
+        default=None,
+        alias="location",
+        kw_only=True,
+        hash=False,
+        eq=False,
+        repr=False,
+    )
 
     interface: AnyCallInterface = field(factory=AnyCallInterface, kw_only=True)
 
@@ -133,12 +149,6 @@ class Import(Symbol):
     def _qualified_name_default(self) -> str:
         return self.name
 
-    @location.default
-    def _location_default(self) -> Location:
-        if self.token is None:
-            return Location(lineno=1, col_offset=0)
-        return Location.from_ast_token(self.token)
-
     @property
     def id(self) -> str:
         # We must prepend the qualified name to starred-imports or else they'd all have
@@ -181,7 +191,7 @@ class Import(Symbol):
         return gen_import_from_stmt(module, self.name)
 
 
-@attrs.frozen
+@attrs.frozen(cache_hash=True)
 class Func(Symbol):
     name: str = field(converter=without_call_brackets)
 
@@ -191,18 +201,19 @@ class Func(Symbol):
         hash=False,
         eq=False,
     )
-    location: Location = field(kw_only=True, hash=False, eq=False)
+    _location: Union[Location, None] = field(
+        default=None,
+        alias="location",
+        kw_only=True,
+        hash=False,
+        eq=False,
+        repr=False,
+    )
 
     interface: CallInterface = field(kw_only=True)
 
     is_async: bool = field(default=False, kw_only=True)
 
-    @location.default
-    def _location_default(self) -> Location:
-        if self.token is None:
-            return Location(lineno=1, col_offset=0)
-        return Location.from_ast_token(self.token)
-
     @classmethod
     def from_fn_def(
         cls: type[Func],
@@ -217,7 +228,7 @@ class Func(Symbol):
         )
 
 
-@attrs.frozen
+@attrs.frozen(cache_hash=True)
 class Class(Symbol):
     name: str = field(converter=without_call_brackets)
 
@@ -227,16 +238,17 @@ class Class(Symbol):
         hash=False,
         eq=False,
     )
-    location: Location = field(kw_only=True, hash=False, eq=False)
+    _location: Union[Location, None] = field(
+        default=None,
+        alias="location",
+        kw_only=True,
+        hash=False,
+        eq=False,
+        repr=False,
+    )
 
     interface: CallInterface = field(factory=AnyCallInterface, kw_only=True)
 
-    @location.default
-    def _location_default(self) -> Location:
-        if self.token is None:
-            return Location(lineno=1, col_offset=0)
-        return Location.from_ast_token(self.token)
-
     def with_init(self, init: ast.FunctionDef) -> Class:
         """Return a copy of the class with the initialiser set to the given function."""
         return attrs.evolve(self, interface=CallInterface.from_fn_def(init))
@@ -281,7 +293,7 @@ class Class(Symbol):
         return Class(name=ast_class.name, token=ast_class, interface=init_interface)
 
 
-@attrs.frozen
+@attrs.frozen(cache_hash=True)
 class Call(Symbol):
     name: str = field(converter=without_call_brackets)
 
@@ -294,7 +306,14 @@ class Call(Symbol):
         hash=False,
         eq=False,
     )
-    location: Location = field(kw_only=True, hash=False, eq=False)
+    _location: Union[Location, None] = field(
+        default=None,
+        alias="location",
+        kw_only=True,
+        hash=False,
+        eq=False,
+        repr=False,
+    )
 
     interface: Union[CallInterface, None] = field(
         init=False,
@@ -302,12 +321,6 @@ class Call(Symbol):
         kw_only=True,
     )
 
-    @location.default
-    def _location_default(self) -> Location:
-        if self.token is None:
-            return Location(lineno=1, col_offset=0)
-        return Location.from_ast_token(self.token)
-
     @classmethod
     def from_call(
         cls: type[Call],
@@ -327,3 +340,9 @@ class Call(Symbol):
     @property
     def name_of_call(self) -> str:
         return f"{self.name}()"
+
+    def release_token(self) -> None:
+        super().release_token()
+
+        if self.target is not None:
+            self.target.release_token()
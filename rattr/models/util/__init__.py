@@ -5,10 +5,13 @@ from rattr.models.util.hash import (
     hash_file_content,
     hash_python_objects_type_and_source_files,
     hash_string,
+    stat_file_content,
 )
 from rattr.models.util.serialise import (
     deserialise,
+    deserialise_unstructured,
     serialise,
+    serialise_compact,
     serialise_irs,
 )
 
@@ -17,7 +20,10 @@ __all__ = [
     "hash_file_content",
     "hash_python_objects_type_and_source_files",
     "hash_string",
+    "stat_file_content",
     "deserialise",
+    "deserialise_unstructured",
     "serialise",
+    "serialise_compact",
     "serialise_irs",
 ]
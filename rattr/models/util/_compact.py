@@ -0,0 +1,103 @@
+"""A compact binary encoding of the unstructured models, see `--cache-format`.
+
+    | magic (6 bytes) | format version | marshal version | compression | payload ... |
+
+The payload is the unstructured model (i.e. the JSON compatible primitives given by the
+JSON converter) encoded by `marshal`, and optionally compressed by `zlib`.
+
+The strings in the model (symbol names, file paths, etc) are interned before encoding,
+thus `marshal` writes each distinct string once to its table of references and refers
+to it by index thereafter; i.e. the results and the IR are given as arrays of indices
+into the string table.
+
+NB: As with `pickle`, the encoding is not secure against maliciously constructed data,
+thus it should only be used for files written by rattr (i.e. the cache).
+"""
+from __future__ import annotations
+
+import marshal
+import zlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any, Final
+
+
+COMPACT_MAGIC: Final = b"\x89RATTR"
+COMPACT_FORMAT_VERSION: Final = 1
+
+COMPRESSION_NONE: Final = 0
+COMPRESSION_ZLIB: Final = 1
+
+_HEADER_LENGTH: Final = len(COMPACT_MAGIC) + 3
+
+
+class CompactFormatError(ValueError):
+    ...
+
+
+def is_compact(serialised: str | bytes) -> bool:
+    """Return `True` if the given data is in the compact format."""
+    return isinstance(serialised, bytes) and serialised.startswith(COMPACT_MAGIC)
+
+
+def encode_compact(unstructured: Any, *, compress: bool = False) -> bytes:
+    """Return the compact encoding of the given unstructured model."""
+    payload = marshal.dumps(_intern(unstructured, {}))
+    compression = COMPRESSION_NONE
+
+    if compress:
+        payload = zlib.compress(payload)
+        compression = COMPRESSION_ZLIB
+
+    header = COMPACT_MAGIC + bytes(
+        (COMPACT_FORMAT_VERSION, marshal.version, compression),
+    )
+
+    return header + payload
+
+
+def decode_compact(serialised: bytes) -> Any:
+    """Return the unstructured model from the given compact encoding.
+
+    Raises:
+        CompactFormatError: The data is not in (this version of) the compact format.
+    """
+    if not is_compact(serialised) or len(serialised) < _HEADER_LENGTH:
+        raise CompactFormatError("not in the compact format")
+
+    format_version, marshal_version, compression = serialised[
+        len(COMPACT_MAGIC) : _HEADER_LENGTH
+    ]
+
+    if format_version != COMPACT_FORMAT_VERSION or marshal_version != marshal.version:
+        raise CompactFormatError(
+            f"unsupported compact format version ({format_version}, {marshal_version})"
+        )
+
+    if compression not in (COMPRESSION_NONE, COMPRESSION_ZLIB):
+        raise CompactFormatError(f"unsupported compression ({compression})")
+
+    payload = serialised[_HEADER_LENGTH:]
+
+    try:
+        if compression == COMPRESSION_ZLIB:
+            payload = zlib.decompress(payload)
+
+        return marshal.loads(payload)
+    except (EOFError, TypeError, ValueError, zlib.error) as exc:
+        raise CompactFormatError("malformed compact data") from exc
+
+
+def _intern(obj: Any, strings: dict[str, str]) -> Any:
+    """Return the object with each distinct string replaced by a single instance."""
+    if isinstance(obj, str):
+        return strings.setdefault(obj, obj)
+
+    if isinstance(obj, dict):
+        return {_intern(k, strings): _intern(v, strings) for k, v in obj.items()}
+
+    if isinstance(obj, (list, tuple)):
+        return [_intern(item, strings) for item in obj]
+
+    return obj
@@ -9,7 +9,12 @@ from cattrs.preconf.json import make_converter
 
 from rattr.models.context import Context, SymbolTable
 from rattr.models.ir import FileIr, FunctionIr
-from rattr.models.results import FileResults, FunctionName, FunctionResults
+from rattr.models.results import (
+    FileResults,
+    FunctionName,
+    FunctionResults,
+    sort_function_results,
+)
 from rattr.models.symbol import (
     AnyCallInterface,
     Builtin,
@@ -171,6 +176,27 @@ def make_symbol_json_converter() -> Converter:
     converter.register_structure_hook(ast.AST, lambda _, __: None)
     converter.register_unstructure_hook(ast.AST, lambda _: None)
 
+    # The file is only held until the (lazy) location is created, see `Symbol`
+    for symbol in __symbols:
+        converter.register_structure_hook(
+            symbol,
+            make_dict_structure_fn(
+                symbol,
+                converter,
+                _cattrs_use_alias=True,
+                _file=override(omit=True),
+            ),
+        )
+        converter.register_unstructure_hook(
+            symbol,
+            make_dict_unstructure_fn(
+                symbol,
+                converter,
+                _cattrs_use_alias=True,
+                _file=override(omit=True),
+            ),
+        )
+
     return converter
 
 
@@ -178,6 +204,7 @@ def make_symbol_serialiser(converter: Converter):
     def serialise_symbol(symbol: Symbol) -> dict[str, Any]:
         data: dict[str, Any] = converter.unstructure(symbol)
         data.pop("token", None)  # not serialisable, should be None form raw converter
+        data["location"] = converter.unstructure(symbol.location)
         data = {"type": symbol.__class__.__name__, **data}
 
         if isinstance(symbol, Call) and data["target"] is not None:
@@ -265,12 +292,7 @@ def make_symbol_table_deserialiser(converter: Converter):
 def make_file_results_serialiser(_: Converter):
     def serialise_file_results(file_results: FileResults) -> dict[str, FunctionResults]:
         return {
-            name: {
-                "gets": sorted(file_results._function_results[name]["gets"]),
-                "sets": sorted(file_results._function_results[name]["sets"]),
-                "dels": sorted(file_results._function_results[name]["dels"]),
-                "calls": sorted(file_results._function_results[name]["calls"]),
-            }
+            name: sort_function_results(file_results._function_results[name])
             for name in sorted(file_results._function_results.keys())
         }
 
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import hashlib
 import inspect
+import os
 from os.path import isfile
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -70,6 +71,16 @@ def hash_file_content(
     return hash.hexdigest()
 
 
+def stat_file_content(filepath: str | Path) -> tuple[int, int]:
+    """Return the size and modification time (ns) of the given file, or `(-1, -1)`."""
+    try:
+        stat = os.stat(filepath)
+    except OSError:
+        return -1, -1
+
+    return stat.st_size, stat.st_mtime_ns
+
+
 def hash_string(s: str, /) -> str:
     """Return the hash of the given string."""
     hash = hashlib.md5()
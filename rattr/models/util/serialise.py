@@ -1,26 +1,58 @@
 from __future__ import annotations
 
+import json
 from typing import TYPE_CHECKING
 
 from rattr.models.ir import FileIr
-from rattr.models.util._serialisation_helpers import make_json_converter
+from rattr.models.util._compact import decode_compact, encode_compact, is_compact
 from rattr.models.util._types import FileName, ImportIrs, OutputIrs
 
 if TYPE_CHECKING:
     from typing import Any, TypeVar
 
+    from cattrs.converters import Converter
+
     T = TypeVar("T")
 
 
-__json_converter = make_json_converter()
+__json_converter: Converter | None = None
+
+
+def get_json_converter() -> Converter:
+    """Return the JSON converter, which is made (and cattrs imported) on first use."""
+    global __json_converter
+
+    if __json_converter is None:
+        from rattr.models.util._serialisation_helpers import make_json_converter
+
+        __json_converter = make_json_converter()
+
+    return __json_converter
 
 
 def serialise(model: Any, **kwargs: Any) -> str:
-    return __json_converter.dumps(model, **kwargs)  # type: ignore[reportUnknownMemberType]
+    return get_json_converter().dumps(model, **kwargs)  # type: ignore[reportUnknownMemberType]
+
+
+def serialise_compact(model: Any, *, compress: bool = False) -> bytes:
+    """Return the model in the compact binary format, see `models.util._compact`."""
+    return encode_compact(get_json_converter().unstructure(model), compress=compress)
+
+
+def deserialise(serialised: str | bytes, *, type: type[T], **kwargs: Any) -> T:
+    """Return the model from JSON or the compact format, detected by its header."""
+    if is_compact(serialised):
+        return get_json_converter().structure(decode_compact(serialised), type)
+
+    return get_json_converter().loads(serialised, cl=type, **kwargs)  # type: ignore[reportUnknownMemberType]
+
 
+def deserialise_unstructured(serialised: str | bytes) -> Any:
+    """Return the unstructured model (i.e. the JSON primitives), see `deserialise`."""
+    if is_compact(serialised):
+        return decode_compact(serialised)
 
-def deserialise(json: str, *, type: type[T], **kwargs: Any) -> T:
-    return __json_converter.loads(json, cl=type, **kwargs)  # type: ignore[reportUnknownMemberType]
+    return json.loads(serialised)
 
 
 def serialise_irs(
@@ -2,10 +2,13 @@ from __future__ import annotations
 
 import os
 import sys
+import time
 from functools import cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+import attrs
+
 from rattr.module_locator.exc import RattrSysPathNotPopulated
 
 if TYPE_CHECKING:
@@ -39,21 +42,143 @@ def find_module_in_path(
     if modulename == "":
         return None
 
-    module_parts = modulename.split(".")
-    install_location = python_path.resolve()
+    *package_parts, module = modulename.split(".")
+    directory = resolve_python_path_dir(python_path)
+
+    for part in package_parts:
+        if part not in scan_directory(directory).dirs:
+            return None
+
+        directory /= part
 
-    for part in module_parts:
-        install_location /= part
+    listing = scan_directory(directory)
 
-    if install_location.is_dir():
-        install_location /= "__init__.py"
-    else:
-        install_location = install_location.with_suffix(".py")
+    if module in listing.dirs:
+        if "__init__.py" not in scan_directory(directory / module):
+            return None
 
-    if not install_location.exists():
+        return directory / module / "__init__.py"
+
+    if f"{module}.py" not in listing:
         return None
 
-    return install_location
+    return directory / f"{module}.py"
+
+
+RACY_LISTING_NS: Final = 2_000_000_000
+"""The age below which the mtime of a scanned directory is not trusted.
+
+The mtime is coarse (up to 2s on some filesystems), thus an entry created shortly after
+a directory is scanned may not change its mtime, and so the listing of a directory so
+recently modified is always rescanned (see `rescan_changed_directories`).
+"""
+
+
+@attrs.frozen
+class DirectoryListing:
+    dirs: frozenset[str]
+    files: frozenset[str]
+
+    mtime_ns: int | None = attrs.field(default=None, eq=False)
+    """The mtime of the directory when it was scanned, `None` if it did not exist."""
+
+    is_racy: bool = attrs.field(default=False, eq=False)
+    """`True` if the directory was modified too recently to trust its mtime."""
+
+    @property
+    def exists(self) -> bool:
+        return self.mtime_ns is not None
+
+    def is_up_to_date(self, directory: Path) -> bool:
+        return not self.is_racy and _mtime_ns(directory) == self.mtime_ns
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.dirs or name in self.files
+
+
+_directory_listings: Final[dict[Path, DirectoryListing]] = {}
+"""The listing of each directory scanned thus far, see `scan_directory`."""
+
+
+def scan_directory(directory: Path) -> DirectoryListing:
+    """Return the entries of the given directory, which is listed only once.
+
+    Thus the module locator makes no further filesystem calls for a directory which it
+    has already seen, and files created after the first scan are not found until the
+    directory is rescanned (see `rescan_changed_directories`).
+    """
+    if (listing := _directory_listings.get(directory)) is None:
+        listing = _directory_listings[directory] = _scan_directory(directory)
+
+    return listing
+
+
+def rescan_changed_directories() -> bool:
+    """Rescan the directories changed since scanned, `True` if any entries changed.
+
+    The mtime of a directory changes when an entry is created, removed, or renamed, but
+    not when a file in it is modified, thus the listing of a directory is unchanged (and
+    it is not rescanned) when its files are only modified.
+    """
+    has_changed = False
+
+    for directory, listing in _directory_listings.items():
+        if listing.is_up_to_date(directory):
+            continue
+
+        rescanned = _directory_listings[directory] = _scan_directory(directory)
+        has_changed = has_changed or rescanned != listing
+
+    return has_changed
+
+
+def forget_directory_listings() -> None:
+    """Forget the listing of each directory scanned thus far."""
+    _directory_listings.clear()
+
+
+def _scan_directory(directory: Path) -> DirectoryListing:
+    dirs: set[str] = set()
+    files: set[str] = set()
+
+    # NB: The mtime is taken before the entries, s.t. an entry created in between causes
+    # a (spurious) rescan rather than being missed
+    scanned_at_ns = time.time_ns()
+
+    if (mtime_ns := _mtime_ns(directory)) is None:
+        return DirectoryListing(dirs=frozenset(), files=frozenset())
+
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir():
+                        dirs.add(entry.name)
+                    elif entry.is_file():
+                        files.add(entry.name)
+                except OSError:
+                    continue
+    except OSError:
+        pass
+
+    return DirectoryListing(
+        dirs=frozenset(dirs),
+        files=frozenset(files),
+        mtime_ns=mtime_ns,
+        is_racy=scanned_at_ns - mtime_ns < RACY_LISTING_NS,
+    )
+
+
+def _mtime_ns(directory: Path) -> int | None:
+    try:
+        return os.stat(directory).st_mtime_ns
+    except OSError:
+        return None
+
+
+@cache
+def resolve_python_path_dir(python_path: Path) -> Path:
+    return python_path.resolve()
 
 
 def iter_python_path_dirs() -> Iterator[Path]:
@@ -78,10 +203,15 @@ def iter_python_path_dirs() -> Iterator[Path]:
         python_path_dir
         for python_path_dirname in (derive_working_dir(), rattr_root, *sys.path[1:])
         if (python_path_dir := Path(python_path_dirname))
-        if python_path_dir.exists()
+        if python_path_dir_exists(python_path_dir)
     )
 
 
+def python_path_dir_exists(python_path: Path) -> bool:
+    # NB: Scanned, s.t. a directory created later is found once rescanned
+    return scan_directory(python_path).exists
+
+
 def derive_working_dir() -> str:
     # When the sys.paths[0] is the empty string then the interpreter uses the current
     # directory (see `sys.path` docs)
@@ -7,14 +7,15 @@ from importlib.util import find_spec as stdlib_find_spec
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from isort import sections
-from isort.api import place_module
-
 from rattr.config import Config
 from rattr.module_locator._locate import (  # noqa: F401
     find_module_in_path,
+    forget_directory_listings,
     iter_python_path_dirs,
     locate_module_in_python_path,
+    python_path_dir_exists,
+    rescan_changed_directories,
+    scan_directory,
 )
 from rattr.module_locator.models import ModuleSpec
 
@@ -30,6 +31,97 @@ if TYPE_CHECKING:
 
 RE_PIP_INSTALL_LOCATIONS: Final = (re.compile(r".+/site-packages.*"),)
 
+# The stdlib modules not in `sys.stdlib_module_names`, i.e. the test suite and those
+# removed in a later Python version (the target may be written for an earlier version)
+EXTRA_STDLIB_MODULE_NAMES: Final = frozenset(
+    {
+        # Excluded from `sys.stdlib_module_names`
+        "test",
+        # Removed in Python 3.10
+        "formatter",
+        "parser",
+        "symbol",
+        # Removed in Python 3.11
+        "binhex",
+        # Removed in Python 3.12
+        "asynchat",
+        "asyncore",
+        "distutils",
+        "imp",
+        "smtpd",
+        # Removed in Python 3.13
+        "aifc",
+        "audioop",
+        "cgi",
+        "cgitb",
+        "chunk",
+        "crypt",
+        "imghdr",
+        "lib2to3",
+        "mailcap",
+        "msilib",
+        "nis",
+        "nntplib",
+        "ossaudiodev",
+        "pipes",
+        "sndhdr",
+        "spwd",
+        "sunau",
+        "telnetlib",
+        "uu",
+        "xdrlib",
+    }
+)
+
+
+_caches_generation = 0
+
+
+def caches_generation() -> int:
+    """Return the number of times the caches have been invalidated."""
+    return _caches_generation
+
+
+def invalidate_caches(*, generation: int | None = None) -> None:
+    """Forget the modules found (and not found) so far, as the files may have changed.
+
+    The stdlib modules are kept. If the generation is given (i.e. that of the main
+    process, in a worker) then it is adopted, otherwise it is incremented.
+    """
+    forget_directory_listings()
+    __invalidate_derived_caches(generation=generation)
+
+
+def invalidate_changed_caches() -> None:
+    """Forget the modules found (and not found) so far, if a module may have moved.
+
+    A module is found by the entries of the directories in the Python path, thus when
+    files are only modified the caches are kept. Otherwise, only the directories which
+    have changed are rescanned (see `rescan_changed_directories`).
+    """
+    if rescan_changed_directories():
+        __invalidate_derived_caches()
+
+
+def __invalidate_derived_caches(*, generation: int | None = None) -> None:
+    global _caches_generation
+
+    if generation is None:
+        generation = _caches_generation + 1
+
+    _caches_generation = generation
+
+    for fn in (
+        locate_module_in_python_path,
+        find_module_spec_fast,
+        find_module_name_and_spec,
+        derive_module_name_from_path,
+        is_in_pip,
+        is_in_import_blacklist,
+        __safe_origin,
+    ):
+        fn.cache_clear()
+
 
 def module_exists(modulename: ModuleName) -> bool:
     return find_module_spec_fast(modulename) is not None
@@ -216,7 +308,20 @@ def is_in_stdlib(name: ModuleName) -> bool:
     >>> is_stdlib_module("pytest.fixture")
     False
     """
-    return place_module(name) == sections.STDLIB
+    toplevel, _, _ = name.partition(".")
+    return toplevel in stdlib_module_names()
+
+
+@cache
+def stdlib_module_names() -> frozenset[ModuleName]:
+    """Return the names of the top-level modules in the stdlib."""
+    if sys.version_info >= (3, 10):
+        return frozenset(sys.stdlib_module_names) | EXTRA_STDLIB_MODULE_NAMES
+
+    # HACK Python 3.9 does not have `sys.stdlib_module_names`, fallback to isort's list
+    from isort.stdlibs import py3
+
+    return frozenset(py3.stdlib)
 
 
 @cache
@@ -2,18 +2,19 @@
 from __future__ import annotations
 
 import ast
-from contextlib import contextmanager
 from typing import TYPE_CHECKING
 
 from rattr.analyser.base import Assertor
+from rattr.analyser.multiplex import SKIP_CHILDREN
 from rattr.analyser.util import has_annotation
 from rattr.ast.util import fullname_of, unravel_names
 from rattr.models.context import Context
 from rattr.models.symbol import CallInterface, Import
 
 if TYPE_CHECKING:
-    from collections.abc import Generator, Iterable
+    from collections.abc import Iterable
 
+    from rattr.analyser.multiplex import SkipChildren
     from rattr.ast.types import Identifier
 
 
@@ -59,64 +60,51 @@ class ImportClobberingAssertor(Assertor):
         super().__init__(is_strict=is_strict)
         self.class_stack: list[str] = []
 
-    @contextmanager
-    def enter_class_name(self, name: str) -> Generator[None, None, None]:
-        self.class_stack.append(name)
-        yield
-        self.class_stack.pop()
-
     def __clobbered(self, name: str, node: ast.AST) -> None:
         self.failed(f"redefinition of imported name {name!r}", culprit=node)
 
     def __deleted(self, name: str, node: ast.AST) -> None:
         self.failed(f"attempt to delete imported name {name!r}", culprit=node)
 
-    def visit_Assign(self, node: ast.Assign) -> None:
+    def enter_Assign(self, node: ast.Assign) -> None:
         for import_ in imports_in_node_lhs_names(node, context=self.context):
             self.__clobbered(import_.name, node)
 
-        return super().generic_visit(node)
-
-    def visit_AnnAssign(self, node: ast.AnnAssign) -> None:
+    def enter_AnnAssign(self, node: ast.AnnAssign) -> None:
         for import_ in imports_in_node_lhs_names(node, context=self.context):
             self.__clobbered(import_.name, node)
 
-        return super().generic_visit(node)
-
-    def visit_AugAssign(self, node: ast.AugAssign) -> None:
+    def enter_AugAssign(self, node: ast.AugAssign) -> None:
         for import_ in imports_in_node_lhs_names(node, context=self.context):
             self.__clobbered(import_.name, node)
 
-        return super().generic_visit(node)
-
-    def visit_Delete(self, node: ast.Delete) -> None:
+    def enter_Delete(self, node: ast.Delete) -> None:
         for import_ in imports_in_node_lhs_names(node, context=self.context):
             self.__deleted(import_.name, node)
 
-        return super().generic_visit(node)
-
-    def visit_FunctionDef(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> None:
+    def enter_FunctionDef(
+        self,
+        node: ast.FunctionDef | ast.AsyncFunctionDef,
+    ) -> SkipChildren | None:
         if has_annotation("rattr_ignore", node):
-            return
+            return SKIP_CHILDREN
 
         if has_annotation("rattr_results", node):
-            return
+            return SKIP_CHILDREN
 
         is_in_method = self.class_stack != []
 
         if not is_in_method and isinstance(self.context.get(node.name), Import):
-            return self.__clobbered(node.name, node)
+            self.__clobbered(node.name, node)
+            return SKIP_CHILDREN
 
         self.check_arguments(node)
 
-        return super().generic_visit(node)
-
-    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:
-        return self.visit_FunctionDef(node)
+    def enter_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> SkipChildren | None:
+        return self.enter_FunctionDef(node)
 
-    def visit_Lambda(self, node: ast.Lambda) -> None:
+    def enter_Lambda(self, node: ast.Lambda) -> None:
         self.check_arguments(node)
-        return super().generic_visit(node)
 
     def check_arguments(
         self,
@@ -128,32 +116,32 @@ class ImportClobberingAssertor(Assertor):
         for import_ in imports_in_names(names, context=self.context):
             self.__clobbered(import_.name, node)
 
-    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+    def enter_ClassDef(self, node: ast.ClassDef) -> SkipChildren | None:
         if has_annotation("rattr_ignore", node):
-            return
+            return SKIP_CHILDREN
 
         if has_annotation("rattr_results", node):
-            return
+            return SKIP_CHILDREN
 
         if isinstance(self.context.get(node.name), Import):
             self.__clobbered(node.name, node)
-            return
+            return SKIP_CHILDREN
 
-        with self.enter_class_name(fullname_of(node, safe=True)):
-            super().generic_visit(node)
+        self.class_stack.append(fullname_of(node, safe=True))
+
+    def leave_ClassDef(self, node: ast.ClassDef) -> None:
+        self.class_stack.pop()
 
-    def visit_For(self, node: ast.For | ast.AsyncFor) -> None:
+    def enter_For(self, node: ast.For | ast.AsyncFor) -> None:
         names = [n for n in unravel_names(node.target)]
 
         for import_ in imports_in_names(names, context=self.context):
             self.__clobbered(import_.name, node)
 
-        return super().generic_visit(node)
+    def enter_AsyncFor(self, node: ast.AsyncFor) -> None:
+        return self.enter_For(node)
 
-    def visit_AsyncFor(self, node: ast.AsyncFor) -> None:
-        return self.visit_For(node)
-
-    def visit_With(self, node: ast.With | ast.AsyncWith) -> None:
+    def enter_With(self, node: ast.With | ast.AsyncWith) -> None:
         for item in node.items:
             if item.optional_vars is None:
                 continue
@@ -163,10 +151,8 @@ class ImportClobberingAssertor(Assertor):
             for import_ in imports_in_names(names, context=self.context):
                 self.__clobbered(import_.name, node)
 
-        return super().generic_visit(node)
-
-    def visit_AsyncWith(self, node: ast.AsyncWith) -> None:
-        return self.visit_With(node)
+    def enter_AsyncWith(self, node: ast.AsyncWith) -> None:
+        return self.enter_With(node)
 
     def check_comprehension(
         self,
@@ -178,16 +164,14 @@ class ImportClobberingAssertor(Assertor):
             for import_ in imports_in_names(names, context=self.context):
                 self.__clobbered(import_.name, node)
 
-        return super().generic_visit(node)
-
-    def visit_ListComp(self, node: ast.ListComp) -> None:
+    def enter_ListComp(self, node: ast.ListComp) -> None:
         self.check_comprehension(node)
 
-    def visit_SetComp(self, node: ast.SetComp) -> None:
+    def enter_SetComp(self, node: ast.SetComp) -> None:
         self.check_comprehension(node)
 
-    def visit_GeneratorExp(self, node: ast.GeneratorExp) -> None:
+    def enter_GeneratorExp(self, node: ast.GeneratorExp) -> None:
         self.check_comprehension(node)
 
-    def visit_DictComp(self, node: ast.DictComp) -> None:
+    def enter_DictComp(self, node: ast.DictComp) -> None:
         self.check_comprehension(node)
@@ -10,14 +10,25 @@ from rattr.results._types import (
 
 # isort: on
 from rattr.results._find_call_target import find_call_target_and_ir
+from rattr.results._scc import (
+    IrCallGraph,
+    generate_results_from_ir_by_scc,
+    iter_results_from_ir_by_scc,
+    strongly_connected_components,
+)
 from rattr.results._simplify_utils import (
     construct_call_swaps,
+    function_results_from_ir,
     unbind_ir_with_call_swaps,
     unbind_name,
 )
+from rattr.results._summaries import FunctionSummaries, FunctionSummary
 from rattr.results.util import (
     destructively_simplify_ir_call_tree,
     generate_results_from_ir,
+    generate_results_from_ir_by_call_tree,
+    iter_results_from_ir,
+    iter_results_from_ir_by_call_tree,
     make_target_ir_call_tree,
 )
 
@@ -28,9 +39,19 @@ __all__ = [
     "IrTarget",
     "find_call_target_and_ir",
     "construct_call_swaps",
+    "function_results_from_ir",
     "unbind_ir_with_call_swaps",
     "unbind_name",
+    "FunctionSummaries",
+    "FunctionSummary",
+    "IrCallGraph",
+    "generate_results_from_ir_by_scc",
+    "iter_results_from_ir_by_scc",
+    "strongly_connected_components",
     "destructively_simplify_ir_call_tree",
     "generate_results_from_ir",
+    "generate_results_from_ir_by_call_tree",
+    "iter_results_from_ir",
+    "iter_results_from_ir_by_call_tree",
     "make_target_ir_call_tree",
 ]
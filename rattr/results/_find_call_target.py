@@ -57,23 +57,25 @@ def resolve_function(
     if call.symbol.target is None:
         raise ImportError
 
-    error_ = f"unable to resolve call to {call.symbol.target.name!r}"
-
-    if call.caller is not None:
-        error_ = f"{error_} in {call.caller.name!r}"
-
     if is_excluded_name(call.symbol.target.name):
-        error.error(f"{error_}, the target matches an exclusion", culprit=call.symbol)
+        error.error(
+            __unresolved_call(call, ", the target matches an exclusion"),
+            culprit=call.symbol,
+        )
         return None
 
     try:
         target = __resolve_target_and_ir(call, environment=environment)
     except ImportError:
         if not is_call_to_method_or_member(call.symbol):
-            error_ += ", the target is likely a nested function or @rattr_ignore'd"
-            error.error(f"{error_}", culprit=call.symbol)
+            error.error(
+                __unresolved_call(
+                    call, ", the target is likely a nested function or @rattr_ignore'd"
+                ),
+                culprit=call.symbol,
+            )
         else:
-            error.info(f"{error_}", culprit=call.symbol)
+            error.info(lambda: __unresolved_call(call), culprit=call.symbol)
         return None
 
     return target
@@ -84,12 +86,13 @@ def resolve_class_init(
     *,
     environment: IrEnvironment,
 ) -> IrTarget | None:
-    error_ = f"unable to resolve initialiser for {call.symbol.target.name!r}"
-
     try:
         target = __resolve_target_and_ir(call, environment=environment)
     except ImportError:
-        error.error(error_, culprit=call.symbol)
+        error.error(
+            f"unable to resolve initialiser for {call.symbol.target.name!r}",
+            culprit=call.symbol,
+        )
         return None
 
     return target
@@ -103,9 +106,6 @@ def resolve_import(
     config = Config()
     arguments = config.arguments
 
-    module_ = f"{target.module_name!r}"
-    error_ = f"ignoring call to {target.name!r} imported from {{loc}}"
-
     if target.module_name is None:
         raise ImportError
 
@@ -113,40 +113,43 @@ def resolve_import(
         return None
 
     if not arguments.follow_local_imports:
-        error.info(error_.format(loc="local module"), culprit=target)
+        error.info(lambda: __ignored_import(target, "local module"), culprit=target)
         return None
 
     if not arguments.follow_pip_imports and is_in_pip(target.module_name):
-        error.info(error_.format(loc=f"pip installed module {module_}"), culprit=target)
+        error.info(
+            lambda: __ignored_import(
+                target, f"pip installed module {target.module_name!r}"
+            ),
+            culprit=target,
+        )
         return None
 
     if not arguments.follow_stdlib_imports and is_in_stdlib(target.module_name):
-        error.info(error_.format(loc=f"stdlib module {module_}"), culprit=target)
+        error.info(
+            lambda: __ignored_import(target, f"stdlib module {target.module_name!r}"),
+            culprit=target,
+        )
         return None
 
     module_ir = environment.import_irs.get(target.module_name, None)
 
     if module_ir is None:
-        raise ImportError(f"{module_} not found")
+        raise ImportError(f"{target.module_name!r} not found")
 
     local_name = target.name.replace(f"{target.module_name}.", "").removesuffix("()")
     new_target = module_ir.context.get(local_name)
 
-    imported_as_ = (
-        f" (imported as {target.name!r})" if target.name != local_name else ""
-    )
-    unresolved_ = (
-        f"unable to resolve call to {local_name!r} in import {module_}{imported_as_}, "
-        f"{{why}}"
-    )
-
     if isinstance(new_target, (Func, Class)):
         ir = module_ir.get(new_target)
 
         # NOTE
         # If the imported function is ignored then it will have no IR
         if ir is None:
-            error.error(unresolved_.format(why="it is likely ignored"), culprit=target)
+            error.error(
+                __unresolved_import(target, local_name, "it is likely ignored"),
+                culprit=target,
+            )
             return None
 
         return IrTarget(symbol=new_target, ir=ir)
@@ -155,13 +158,41 @@ def resolve_import(
         return resolve_import(new_target, environment=environment)
 
     if new_target is None and is_call_to_method_or_member(local_name):
-        error.info(unresolved_.format(why="it is a method"), culprit=target)
+        error.info(
+            lambda: __unresolved_import(target, local_name, "it is a method"),
+            culprit=target,
+        )
     else:
-        error.error(unresolved_.format(why="it is likely undefined"), culprit=target)
+        error.error(
+            __unresolved_import(target, local_name, "it is likely undefined"),
+            culprit=target,
+        )
 
     return None
 
 
+def __unresolved_call(call: IrCall, reason: str = "") -> str:
+    message = f"unable to resolve call to {call.symbol.target.name!r}"
+
+    if call.caller is not None:
+        message = f"{message} in {call.caller.name!r}"
+
+    return f"{message}{reason}"
+
+
+def __ignored_import(target: Import, loc: str) -> str:
+    return f"ignoring call to {target.name!r} imported from {loc}"
+
+
+def __unresolved_import(target: Import, local_name: Identifier, why: str) -> str:
+    imported_as = f" (imported as {target.name!r})" if target.name != local_name else ""
+
+    return (
+        f"unable to resolve call to {local_name!r} in import "
+        f"{target.module_name!r}{imported_as}, {why}"
+    )
+
+
 def __resolve_target_and_ir(
     call: IrCall,
     *,
@@ -202,16 +233,25 @@ def __resolve_real_class_target(
     *,
     environment: IrEnvironment,
 ) -> Class:
+    return find_class_by_name(target.name, environment=environment) or target
+
+
+def find_class_by_name(name: str, *, environment: IrEnvironment) -> Class | None:
+    """Return the first class of the given name, preferring the classes in the target.
+
+    NB: This depends upon the target (and the order of the imports), thus so does the
+    initialiser resolved for a call to a class.
+    """
     for symbol in environment.target_ir:
-        if isinstance(symbol, Class) and target.name == symbol.name:
+        if isinstance(symbol, Class) and name == symbol.name:
             return symbol
 
     for _, import_ir in environment.import_irs.items():
         for symbol in import_ir:
-            if isinstance(symbol, Class) and target.name == symbol.name:
+            if isinstance(symbol, Class) and name == symbol.name:
                 return symbol
 
-    return target
+    return None
 
 
 def is_call_to_method_or_member(target: Call | Identifier) -> bool:
@@ -0,0 +1,381 @@
+"""Parallel results generation by the call tree engine, see `--jobs`.
+
+The call tree of each function in the target is constructed and simplified in a process
+pool, to which the environment (i.e. the IR of the target and the imports) is sent once
+per worker. The results are given in the order of the target, and the errors, warnings,
+etc and badness of each function are replayed as though the function had been
+simplified in the main process.
+
+Exactness:
+    A call tree is simplified in place, thus the IR of each function in the call tree
+    gains the names of its callees. When no call was pruned from the call tree (i.e.
+    given recursion, or a call made by more than one function in the call tree, see
+    `make_target_ir_call_tree`) each function in the call tree gains every name of its
+    callees, thus the results do not depend upon the functions simplified before. The
+    worker gives back the results and the names gained by each IR, which are added to
+    the environment of the main process. As the functions before it in the worker were
+    replayed in the main process first, the IR there has the names it had in the worker.
+
+    Otherwise the function is simplified in the main process, in order, as without
+    `--jobs`.
+"""
+from __future__ import annotations
+
+import io
+import math
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stderr
+from typing import TYPE_CHECKING
+
+import attrs
+
+from rattr.config import Config, State
+from rattr.error.diagnostics import diagnostics
+from rattr.extra.tracing import span, tracer
+from rattr.results._simplify_utils import function_results_from_ir
+from rattr.results._types import IrEnvironment, IrTarget
+from rattr.results.util import (
+    destructively_simplify_ir_call_tree,
+    make_target_ir_call_tree,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+    from typing import Final, Union
+
+    from rattr.analyser.types import ImportIrs
+    from rattr.config import Arguments
+    from rattr.error.diagnostics import Diagnostic
+    from rattr.extra.tracing import TraceEvent
+    from rattr.models.ir import FileIr, FunctionIr
+    from rattr.models.results import FunctionName, FunctionResults
+    from rattr.models.symbol import Name, UserDefinedCallableSymbol
+    from rattr.results._types import IrCallTreeNode
+    from rattr.versioning.typing import TypeAlias
+
+    IrKey: TypeAlias = tuple[Union[str, None], UserDefinedCallableSymbol]
+    """The module of the IR (`None` for the target) and the function."""
+
+    IrIndex: TypeAlias = int
+    """The index of the IR in the environment, see `index_environment`."""
+
+    IrNames: TypeAlias = dict[str, set[Name]]
+    """The names of each simplified field of an IR, see `SIMPLIFIED_FIELDS`."""
+
+
+SIMPLIFIED_FIELDS: Final = ("gets", "sets", "dels")
+"""The fields of an IR which are changed by simplification."""
+
+CHUNKS_PER_JOB: Final = 4
+"""The number of chunks of the target's functions given to each worker, on average."""
+
+
+@attrs.frozen
+class FunctionOutcome:
+    results: FunctionResults
+    """The results of the function."""
+
+    stderr: str
+    """The output of the worker to stderr, other than the errors, warnings, etc."""
+
+    diagnostics: list[Diagnostic]
+    """The errors, warnings, etc emitted by the worker, to be replayed."""
+
+    state: State
+    """The badness accrued by the worker."""
+
+    changes: dict[IrIndex, IrNames]
+    """The names gained by each IR which was changed."""
+
+    trace_events: list[TraceEvent] = attrs.field(factory=list)
+    """The spans recorded by the worker, when given `--trace`."""
+
+
+def iter_results_from_ir_in_parallel(
+    *,
+    target_ir: FileIr,
+    import_irs: ImportIrs,
+    jobs: int | None = None,
+) -> Iterator[tuple[FunctionName, FunctionResults]]:
+    """Yield the results of each function in the target, generated in parallel.
+
+    See `iter_results_from_ir_by_call_tree`, the results, errors, warnings, etc, and
+    badness are the same and are given in the same order.
+
+    NB: The IR of the target and the imports is simplified in place.
+    """
+    environment = IrEnvironment(target_ir=target_ir, import_irs=import_irs)
+    irs = list(index_environment(environment).values())
+
+    targets = list(target_ir.items())
+    chunks = _chunks(len(targets), _jobs(jobs) * CHUNKS_PER_JOB)
+
+    executor = make_results_executor(environment, jobs)
+
+    try:
+        futures = [
+            executor.submit(_results_in_worker, start, stop) for start, stop in chunks
+        ]
+
+        for future, (start, stop) in zip(futures, chunks):
+            outcomes = dict(enumerate(future.result(), start))
+
+            for index in range(start, stop):
+                symbol, ir = targets[index]
+
+                if (outcome := outcomes.get(index)) is not None:
+                    function_results = _replay(outcome, irs)
+                else:
+                    function_results = _results_in_main(
+                        IrTarget(symbol=symbol, ir=ir),
+                        environment,
+                    )
+
+                yield symbol.id, function_results
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def index_environment(environment: IrEnvironment) -> dict[IrKey, FunctionIr]:
+    """Return each IR in the environment by its module and function."""
+    irs: dict[IrKey, FunctionIr] = {}
+
+    for module, file_ir in environment.import_irs.items():
+        for function, ir in file_ir.items():
+            irs[(module, function)] = ir
+
+    for function, ir in environment.target_ir.items():
+        irs[(None, function)] = ir
+
+    return irs
+
+
+def make_results_executor(
+    environment: IrEnvironment,
+    jobs: int | None = None,
+) -> ProcessPoolExecutor:
+    """Return a process pool for generating the results, using `--jobs` by default."""
+    config = Config()
+
+    return ProcessPoolExecutor(
+        max_workers=_jobs(jobs),
+        initializer=_initialise_worker,
+        initargs=(config.arguments, config.state.current_file, environment),
+    )
+
+
+def _jobs(jobs: int | None) -> int:
+    if jobs is None:
+        jobs = Config().arguments.jobs
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+
+    return jobs
+
+
+def _chunks(number_of_functions: int, number_of_chunks: int) -> list[tuple[int, int]]:
+    size = max(1, math.ceil(number_of_functions / number_of_chunks))
+    return [
+        (start, min(start + size, number_of_functions))
+        for start in range(0, number_of_functions, size)
+    ]
+
+
+def _replay(outcome: FunctionOutcome, irs: list[FunctionIr]) -> FunctionResults:
+    """Return the worker's results, replaying its errors, badness, and changes."""
+    diagnostics.write(outcome.stderr)
+    diagnostics.replay(outcome.diagnostics)
+    tracer.extend(outcome.trace_events)
+
+    config = Config()
+    config.state.badness_from_target_file += outcome.state.badness_from_target_file
+    config.state.badness_from_imports += outcome.state.badness_from_imports
+    config.state.badness_from_simplification += (
+        outcome.state.badness_from_simplification
+    )
+
+    for index, changes in outcome.changes.items():
+        for field in SIMPLIFIED_FIELDS:
+            irs[index][field] |= changes[field]  # type: ignore[literal-required]
+
+    return outcome.results
+
+
+def _results_in_main(target: IrTarget, environment: IrEnvironment) -> FunctionResults:
+    """Return the results of the function simplified in the main process, in place."""
+    with span(target.symbol.id, "results", engine="tree"):
+        root = make_target_ir_call_tree(target, environment=environment)
+        simplified = destructively_simplify_ir_call_tree(root)
+
+        return function_results_from_ir(simplified)
+
+
+class _Worker:
+    """The environment of a worker, simplified in place by the worker's functions."""
+
+    def __init__(self, environment: IrEnvironment, current_file: Path | None) -> None:
+        self.environment = environment
+        self.current_file = current_file
+
+        self.targets = list(environment.target_ir.items())
+
+        self.irs = list(index_environment(environment).values())
+        self.indices = {id(ir["sets"]): index for index, ir in enumerate(self.irs)}
+
+
+_worker: _Worker | None = None
+
+
+def _initialise_worker(
+    arguments: Arguments,
+    current_file: Path | None,
+    environment: IrEnvironment,
+) -> None:
+    global _worker
+
+    # NOTE
+    # The arguments were validated in the main process, do not re-emit the warnings
+    with redirect_stderr(io.StringIO()):
+        config = Config(arguments=arguments, state=State())
+
+    config.arguments = arguments
+
+    # The worker is not profiled, though it may inherit the profiler when forked
+    sys.setprofile(None)
+
+    _worker = _Worker(environment, current_file)
+
+
+def _results_in_worker(start: int, stop: int) -> list[FunctionOutcome | None]:
+    """Return the outcome of each function, `None` for those left to the main process.
+
+    NB: Given an error which exits (i.e. `error.fatal`), the functions from that one are
+    left to the main process, which then exits upon simplifying it.
+    """
+    if _worker is None:
+        raise RuntimeError("the worker has no environment")  # never
+
+    outcomes: list[FunctionOutcome | None] = []
+
+    for symbol, ir in _worker.targets[start:stop]:
+        try:
+            outcome = _function_outcome_in_worker(
+                _worker,
+                IrTarget(symbol=symbol, ir=ir),
+            )
+        except SystemExit:
+            break
+
+        outcomes.append(outcome)
+
+    return outcomes
+
+
+def _function_outcome_in_worker(
+    worker: _Worker,
+    target: IrTarget,
+) -> FunctionOutcome | None:
+    config = Config()
+    config.state = State(current_file=worker.current_file)
+
+    stderr = io.StringIO()
+    diagnostics.reset(deferred_stream=stderr)
+
+    if config.arguments.trace is not None:
+        tracer.start()
+
+    try:
+        with redirect_stderr(stderr), span(target.symbol.id, "results", engine="tree"):
+            simplified = _simplify_in_worker(worker, target)
+    finally:
+        trace_events = tracer.stop()
+
+    if simplified is None:
+        return None
+
+    results, changes = simplified
+
+    return FunctionOutcome(
+        results=results,
+        stderr=stderr.getvalue(),
+        diagnostics=diagnostics.deferred,
+        state=config.state,
+        changes=changes,
+        trace_events=trace_events,
+    )
+
+
+def _simplify_in_worker(
+    worker: _Worker,
+    target: IrTarget,
+) -> tuple[FunctionResults, dict[IrIndex, IrNames]] | None:
+    """Return the results and the changes of the function, see the docstring.
+
+    Returns `None`, without simplifying the function, when its results may depend upon
+    the functions simplified before it, or an IR is not in the environment.
+    """
+    root = make_target_ir_call_tree(target, environment=worker.environment)
+    nodes = list(_nodes(root))
+
+    if not _is_complete(nodes):
+        return None
+
+    if any(id(node.target.ir["sets"]) not in worker.indices for node in nodes):
+        return None
+
+    # NB: Only the IR of a node with children is changed
+    before = {
+        worker.indices[id(node.target.ir["sets"])]: _copy_names(node.target.ir)
+        for node in nodes
+        if node.children
+    }
+
+    simplified = destructively_simplify_ir_call_tree(root)
+
+    changes: dict[IrIndex, IrNames] = {}
+
+    for index, names in before.items():
+        if any((changed := _difference(worker.irs[index], names)).values()):
+            changes[index] = changed
+
+    return function_results_from_ir(simplified), changes
+
+
+def _is_complete(nodes: list[IrCallTreeNode]) -> bool:
+    """Return `True` if no call was pruned from the call tree.
+
+    A call is pruned when the same call was made before elsewhere in the call tree, see
+    `make_target_ir_call_tree`; the same call made again by one function is not.
+    """
+    seen = {child.edge_in.symbol for node in nodes for child in node.children}
+
+    calls = sum(len({call.symbol for call in node.edges_out} & seen) for node in nodes)
+
+    return calls == len(nodes) - 1
+
+
+def _nodes(root: IrCallTreeNode) -> Iterator[IrCallTreeNode]:
+    unvisited = [root]
+
+    while unvisited:
+        node = unvisited.pop()
+        unvisited.extend(node.children)
+
+        yield node
+
+
+def _copy_names(ir: FunctionIr | IrNames) -> IrNames:
+    return {field: set(ir[field]) for field in SIMPLIFIED_FIELDS}  # type: ignore
+
+
+def _difference(
+    names: FunctionIr | IrNames,
+    other: FunctionIr | IrNames,
+) -> IrNames:
+    return {
+        field: names[field] - other[field]  # type: ignore[literal-required]
+        for field in SIMPLIFIED_FIELDS
+    }
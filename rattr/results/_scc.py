@@ -0,0 +1,475 @@
+"""Results generation from summaries over the strongly connected components of the calls.
+
+Rather than resolving, and simplifying, the calls of each function's call tree again for
+every function in the target (see `make_target_ir_call_tree`), the call graph reachable
+from the target is resolved once and partitioned into strongly connected components
+(SCCs). The simplified IR (the "summary") of each function which can not reach a cycle
+is computed once, with the callees before the callers, and a caller binds the summary of
+each of its callees (see `construct_call_swaps` and `unbind_ir_with_call_swaps`).
+
+The results are exactly those of the call tree engine:
+    The call tree engine expands a call (i.e. the same call text, see `Call`) only once
+    per call tree, and simplifies the IR of each function in the environment in place,
+    thus the results of a function may depend upon the functions simplified before it.
+    Here the call tree of each function in the target is constructed, in order, from
+    the resolved calls of the call graph. Where the subtree of a function is the whole
+    of its unrolled call tree (i.e. no call in it is expanded elsewhere) its simplified
+    IR is its summary, thus the subtree is not simplified again; otherwise the call
+    tree is simplified as in the call tree engine.
+
+    The summary of a function can only grow its IR in the environment, thus once its
+    IR is its summary it is not unioned again.
+
+Summaries:
+    When given, the cached summary of an imported function is used rather than
+    simplifying the function (and its callees) again, and the summaries of the imported
+    functions which are simplified are added to the cache (see `FunctionSummaries`).
+    The calls of such a function are still resolved, as the call trees which reach it
+    depend upon them.
+
+Differences to the call tree engine:
+    Each call is resolved (and any errors emitted) once, rather than once per call tree
+    which reaches it.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, NamedTuple
+
+from rattr.extra.tracing import span
+from rattr.models.results import FileResults
+from rattr.models.symbol import Class
+from rattr.results._find_call_target import find_call_target_and_ir, find_class_by_name
+from rattr.results._simplify_utils import (
+    construct_call_swaps,
+    function_results_from_ir,
+    unbind_ir_with_call_swaps,
+)
+from rattr.results._summaries import FunctionSummaries, FunctionSummary
+from rattr.results._types import IrCall, IrEnvironment, IrTarget
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from pathlib import Path
+
+    from rattr.analyser.types import ImportIrs
+    from rattr.ast.types import Identifier
+    from rattr.models.ir import FileIr, FunctionIr
+    from rattr.models.results import FunctionName, FunctionResults
+    from rattr.models.symbol import Call
+
+    NodeId = int
+    """The id of the node's IR, function symbols are not unique across modules."""
+
+
+class IrCallGraphEdge(NamedTuple):
+    call: IrCall
+    target: IrTarget
+
+    @property
+    def target_id(self) -> NodeId:
+        return id(self.target.ir)
+
+
+class IrCallGraph:
+    """The call graph of the given environment, resolved lazily from the given targets.
+
+    When given the summaries, the summary of an imported function is taken from them
+    where it is up-to-date, see `summary`.
+    """
+
+    def __init__(
+        self,
+        environment: IrEnvironment,
+        summaries: FunctionSummaries | None = None,
+    ) -> None:
+        self.environment = environment
+        self.summaries = summaries
+
+        self.targets: dict[NodeId, IrTarget] = {}
+        self._edges: dict[NodeId, list[IrCallGraphEdge]] = {}
+
+        self.sizes: dict[NodeId, int] = {}
+        """The number of nodes in the unrolled call tree of each function which can not
+        reach a cycle, see `unrolled_call_tree_sizes`."""
+
+        self._summaries: dict[NodeId, FunctionIr] = {}
+
+        self.origins: dict[NodeId, Path] = {}
+        """The module origin of each imported function, if given the summaries."""
+
+        self.dependencies: dict[NodeId, dict[Path, str] | None] = {}
+        """The dependencies of each summarised function, `None` if not cacheable."""
+
+        self.classes: dict[NodeId, dict[Identifier, str]] = {}
+        """The classes resolved by name in the calls of each summarised function."""
+
+        self._calls_to_classes: dict[NodeId, set[Identifier]] = {}
+        self._class_modules: dict[Identifier, str] = {}
+
+        if summaries is not None:
+            self.origins = {
+                id(function_ir): file_ir.context.file
+                for file_ir in environment.import_irs.values()
+                for function_ir in file_ir.values()
+            }
+
+    def add(self, target: IrTarget) -> NodeId:
+        self.targets.setdefault(id(target.ir), target)
+        return id(target.ir)
+
+    def edges_out(self, node: NodeId) -> list[IrCallGraphEdge]:
+        """Return the resolved calls out of the given node, in call tree order."""
+        if node in self._edges:
+            return self._edges[node]
+
+        caller = self.targets[node]
+        edges: list[IrCallGraphEdge] = []
+        calls_to_classes: set[Identifier] = set()
+
+        for symbol in sorted(caller.ir["calls"], key=lambda c: c.id):
+            call = IrCall(caller=caller.symbol, symbol=symbol)
+            callee = find_call_target_and_ir(call, environment=self.environment)
+
+            if isinstance(symbol.target, Class):
+                calls_to_classes.add(symbol.target.name)
+
+            if callee is None:
+                continue
+
+            self.add(callee)
+            edges.append(IrCallGraphEdge(call=call, target=callee))
+
+        self._edges[node] = edges
+        self._calls_to_classes[node] = calls_to_classes
+
+        return edges
+
+    def summary(self, node: NodeId) -> FunctionIr:
+        """Return the simplified IR of the node, which must not reach a cycle.
+
+        The IR of the function in the environment is not changed.
+        """
+        unsummarised = [node]
+
+        while unsummarised:
+            current = unsummarised[-1]
+
+            if current in self._summaries:
+                unsummarised.pop()
+                continue
+
+            if (cached := self._cached_summary(current)) is not None:
+                self._summaries[current] = {
+                    "gets": set(cached.gets),
+                    "sets": set(cached.sets),
+                    "dels": set(cached.dels),
+                    "calls": set(),
+                }
+                self.dependencies[current] = dict(cached.dependencies)
+                self.classes[current] = dict(cached.classes)
+
+                unsummarised.pop()
+                continue
+
+            edges = self.edges_out(current)
+
+            if callees := [
+                e.target_id for e in edges if e.target_id not in self._summaries
+            ]:
+                unsummarised.extend(callees)
+                continue
+
+            summary = self.targets[current].ir.copy()
+            summary["gets"] = set(summary["gets"])
+            summary["sets"] = set(summary["sets"])
+            summary["dels"] = set(summary["dels"])
+
+            for edge in edges:
+                _union_bound_callee(summary, self._summaries[edge.target_id], edge=edge)
+
+            self._summaries[current] = summary
+            self._cache_summary(current)
+
+            unsummarised.pop()
+
+        return self._summaries[node]
+
+    def _cache_summary(self, node: NodeId) -> None:
+        """Add the summary of the node to the summaries, if cacheable."""
+        if self.summaries is None or node in self.dependencies:
+            return
+
+        origin = self.origins.get(node)
+
+        if origin is None:
+            self.dependencies[node] = None
+            return
+
+        dependencies = {origin: self.summaries.filehash(origin)}
+        classes = {
+            name: self._class_module(name)
+            for name in self._calls_to_classes.get(node, ())
+        }
+
+        for edge in self.edges_out(node):
+            callee_dependencies = self.dependencies.get(edge.target_id)
+
+            if callee_dependencies is None:
+                self.dependencies[node] = None
+                return
+
+            dependencies.update(callee_dependencies)
+            classes.update(self.classes.get(edge.target_id, {}))
+
+        target = self.targets[node]
+        summary = FunctionSummary.from_ir(
+            self._summaries[node],
+            dependencies=dependencies,
+            classes=classes,
+        )
+
+        self.summaries.put(origin, target.symbol.id, summary)
+        self.dependencies[node] = dependencies
+        self.classes[node] = classes
+
+    def _cached_summary(self, node: NodeId) -> FunctionSummary | None:
+        if self.summaries is None:
+            return None
+
+        if (origin := self.origins.get(node)) is None:
+            return None
+
+        summary = self.summaries.get(origin, self.targets[node].symbol.id)
+
+        if summary is None:
+            return None
+
+        # A class shadowed by another in this environment (i.e. a class in the target)
+        if any(
+            self._class_module(name) != module
+            for name, module in summary.classes.items()
+        ):
+            return None
+
+        return summary
+
+    def _class_module(self, name: Identifier) -> str:
+        """Return the module of the class a call to `name` resolves to, see `classes`."""
+        if name not in self._class_modules:
+            cls = find_class_by_name(name, environment=self.environment)
+            module = str(cls.location.defined_in) if cls is not None else ""
+
+            self._class_modules[name] = module
+
+        return self._class_modules[name]
+
+
+def generate_results_from_ir_by_scc(
+    *,
+    target_ir: FileIr,
+    import_irs: ImportIrs,
+    summaries: FunctionSummaries | None = None,
+) -> FileResults:
+    return FileResults(
+        function_results=dict(
+            iter_results_from_ir_by_scc(
+                target_ir=target_ir,
+                import_irs=import_irs,
+                summaries=summaries,
+            )
+        )
+    )
+
+
+def iter_results_from_ir_by_scc(
+    *,
+    target_ir: FileIr,
+    import_irs: ImportIrs,
+    summaries: FunctionSummaries | None = None,
+) -> Iterator[tuple[FunctionName, FunctionResults]]:
+    """Yield the results of each function in the target, see the module docstring."""
+    environment = IrEnvironment(target_ir=target_ir, import_irs=import_irs)
+
+    with span("resolve call graph", "results", engine="scc"):
+        graph = IrCallGraph(environment, summaries)
+        roots = [graph.add(IrTarget(symbol=s, ir=ir)) for s, ir in target_ir.items()]
+
+        graph.sizes = unrolled_call_tree_sizes(graph, roots)
+
+    # The functions whose IR in the environment is their summary
+    summarised: set[NodeId] = set()
+
+    for symbol, ir in target_ir.items():
+        with span(symbol.id, "results", engine="scc"):
+            target = IrTarget(symbol=symbol, ir=ir)
+            simplified = _destructively_simplify(graph, target, summarised)
+
+            function_results = function_results_from_ir(simplified)
+
+        yield symbol.id, function_results
+
+
+def unrolled_call_tree_sizes(
+    graph: IrCallGraph,
+    roots: Iterable[NodeId],
+) -> dict[NodeId, int]:
+    """Return the number of nodes in the unrolled call tree of each function.
+
+    The call tree is unrolled if each call is expanded wherever it is made, the call
+    tree of a function which is in, or can reach, a cyclic SCC is infinite, thus such
+    functions are not given.
+    """
+    sizes: dict[NodeId, int] = {}
+
+    for component in strongly_connected_components(graph, roots):
+        (node, *others) = component
+
+        if others:
+            continue
+
+        edges = graph.edges_out(node)
+
+        if all(edge.target_id in sizes for edge in edges):
+            sizes[node] = 1 + sum(sizes[edge.target_id] for edge in edges)
+
+    return sizes
+
+
+def strongly_connected_components(
+    graph: IrCallGraph,
+    roots: Iterable[NodeId],
+) -> Iterator[list[NodeId]]:
+    """Yield the SCCs reachable from the roots, callees before callers.
+
+    Implementation:
+        Tarjan's algorithm, iteratively as the call graph may be deeper than the
+        recursion limit; the SCCs are found in reverse topological order.
+    """
+    index: dict[NodeId, int] = {}
+    lowlink: dict[NodeId, int] = {}
+
+    stack: list[NodeId] = []
+    on_stack: set[NodeId] = set()
+
+    for root in roots:
+        if root in index:
+            continue
+
+        index[root] = lowlink[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+
+        work = [(root, iter(graph.edges_out(root)))]
+
+        while work:
+            node, edges = work[-1]
+
+            for edge in edges:
+                callee = edge.target_id
+
+                if callee not in index:
+                    index[callee] = lowlink[callee] = len(index)
+                    stack.append(callee)
+                    on_stack.add(callee)
+                    work.append((callee, iter(graph.edges_out(callee))))
+                    break
+
+                if callee in on_stack:
+                    lowlink[node] = min(lowlink[node], index[callee])
+            else:
+                work.pop()
+
+                if work:
+                    caller, _ = work[-1]
+                    lowlink[caller] = min(lowlink[caller], lowlink[node])
+
+                if lowlink[node] != index[node]:
+                    continue
+
+                component: list[NodeId] = []
+
+                while True:
+                    member = stack.pop()
+                    on_stack.remove(member)
+                    component.append(member)
+
+                    if member == node:
+                        break
+
+                yield component[::-1]
+
+
+def _union_bound_callee(
+    ir: FunctionIr,
+    callee_ir: FunctionIr,
+    *,
+    edge: IrCallGraphEdge,
+) -> None:
+    swaps = construct_call_swaps(edge.target.symbol, edge.call.symbol)
+    unbound = unbind_ir_with_call_swaps(callee_ir, swaps)
+
+    ir["sets"] |= unbound["sets"]
+    ir["gets"] |= unbound["gets"]
+    ir["dels"] |= unbound["dels"]
+
+
+def _destructively_simplify(
+    graph: IrCallGraph,
+    target: IrTarget,
+    summarised: set[NodeId],
+) -> FunctionIr:
+    """Return the simplified IR of the target as given by the call tree engine.
+
+    See `make_target_ir_call_tree` and `destructively_simplify_ir_call_tree`, except
+    that a subtree which is the whole of its unrolled call tree is given the summary of
+    its root, see the module docstring.
+    """
+    # Breadth-first, so reversed this is the post-order of the call tree
+    nodes: list[NodeId] = [graph.add(target)]
+    children: list[list[tuple[int, IrCallGraphEdge]]] = [[]]
+
+    seen: set[Call] = set()
+    i = 0
+
+    while i < len(nodes):
+        for edge in graph.edges_out(nodes[i]):
+            if edge.call.symbol in seen:
+                continue
+
+            children[i].append((len(nodes), edge))
+
+            nodes.append(edge.target_id)
+            children.append([])
+
+            seen.add(edge.call.symbol)
+
+        i += 1
+
+    subtree_sizes = [1] * len(nodes)
+
+    for i in reversed(range(len(nodes))):
+        if not children[i]:
+            # Leaves are already simplified
+            continue
+
+        node = nodes[i]
+        ir = graph.targets[node].ir
+
+        subtree_sizes[i] += sum(subtree_sizes[child] for child, _ in children[i])
+
+        if subtree_sizes[i] == graph.sizes.get(node):
+            if node not in summarised:
+                summary = graph.summary(node)
+
+                ir["sets"] |= summary["sets"]
+                ir["gets"] |= summary["gets"]
+                ir["dels"] |= summary["dels"]
+
+                summarised.add(node)
+
+            continue
+
+        for _, edge in children[i]:
+            _union_bound_callee(ir, edge.target.ir, edge=edge)
+
+    return target.ir
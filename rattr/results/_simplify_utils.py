@@ -4,15 +4,18 @@ import ast
 import re
 from typing import TYPE_CHECKING, TypedDict
 
+import attrs
+
 from rattr import error
 from rattr.config import Config
-from rattr.models.symbol import Name
+from rattr.models.symbol import Name, intern_name
 
 if TYPE_CHECKING:
     from typing import Final, Literal
 
     from rattr.ast.types import Identifier
     from rattr.models.ir import FunctionIr
+    from rattr.models.results import FunctionResults
     from rattr.models.symbol import Call, Func
 
 
@@ -120,6 +123,16 @@ def construct_call_swaps(func: Func, call: Call) -> dict[Identifier, Identifier]
     return swaps
 
 
+def function_results_from_ir(ir: FunctionIr) -> FunctionResults:
+    """Return the results of the simplified function IR."""
+    return {
+        "gets": {s.id for s in ir["gets"]},
+        "sets": {s.id for s in ir["sets"]},
+        "dels": {s.id for s in ir["dels"]},
+        "calls": {s.name_of_call for s in ir["calls"]},
+    }
+
+
 def unbind_ir_with_call_swaps(
     ir: FunctionIr,
     swaps: dict[Identifier, Identifier],
@@ -152,7 +165,7 @@ def unbind_name(symbol: Name, new_basename: Identifier) -> Name:
         raise ValueError("never")
 
     new_name = symbol.name.replace(old, new, 1)
-    return Name(name=new_name, basename=new_basename, location=symbol.location)
+    return intern_name(attrs.evolve(symbol, name=new_name, basename=new_basename))
 
 
 re_name = re.compile(
@@ -0,0 +1,180 @@
+"""Cached summaries (i.e. simplified IR) of imported functions.
+
+The summary of an imported function depends only upon the IR of the modules which it
+reaches (and the arguments and plugins), thus, unlike the results of the target, it can
+be re-used by other targets (in batch mode) and, when persisted, by later runs (see
+`--cache-summaries`). A summary is keyed by the function and the content hash of its
+module, and is valid while the content of every module which it depends upon is
+unchanged.
+
+The summary of a function which reaches a function in the target, or which is (or
+reaches) a recursive function, is not cached (see `rattr.results._scc`).
+
+The initialiser for a call to a class is resolved by name, preferring the classes in the
+target (see `find_class_by_name`), thus a summary also records the module of the class
+which each such name resolved to, and is only used where each name resolves to a class
+in the same module.
+"""
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import attrs
+
+from rattr.models.results.cacheable import (
+    CacheableFunctionSummary,
+    CacheableImportInfo,
+)
+from rattr.models.util.hash import hash_file_content
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from rattr.ast.types import Identifier
+    from rattr.models.ir import FunctionIr
+    from rattr.models.symbol import Name
+
+
+@attrs.frozen
+class FunctionSummary:
+    gets: frozenset[Name]
+    sets: frozenset[Name]
+    dels: frozenset[Name]
+
+    dependencies: Mapping[Path, str] = attrs.field(hash=False)
+    """The file hash of each module which the summary depends upon (and its own)."""
+
+    classes: Mapping[Identifier, str] = attrs.field(factory=dict, hash=False)
+    """The module of the class each called class resolved to by name, `""` if none."""
+
+    @classmethod
+    def from_ir(
+        cls,
+        ir: FunctionIr,
+        *,
+        dependencies: Mapping[Path, str],
+        classes: Mapping[Identifier, str] | None = None,
+    ) -> FunctionSummary:
+        return cls(
+            gets=frozenset(ir["gets"]),
+            sets=frozenset(ir["sets"]),
+            dels=frozenset(ir["dels"]),
+            dependencies=dict(dependencies),
+            classes=dict(classes or {}),
+        )
+
+
+class FunctionSummaries:
+    """The summaries of imported functions, by module and function name.
+
+    The content of a module is hashed once for the lifetime of the summaries (or until
+    `refresh` is called), thus the files are assumed not to change while in use.
+    """
+
+    def __init__(self, *, persist: bool = False) -> None:
+        self.persist = persist
+
+        self._summaries: dict[tuple[Path, str, Identifier], FunctionSummary] = {}
+        self._filehashes: dict[Path, str] = {}
+
+        self._loaded: set[tuple[Path, str]] = set()
+        self._modified: set[tuple[Path, str]] = set()
+
+    def __len__(self) -> int:
+        return len(self._summaries)
+
+    def filehash(self, origin: Path) -> str:
+        if origin not in self._filehashes:
+            self._filehashes[origin] = hash_file_content(origin)
+
+        return self._filehashes[origin]
+
+    def refresh(self) -> None:
+        """Forget the file hashes, s.t. changed files invalidate their summaries."""
+        self._filehashes.clear()
+
+    def get(self, origin: Path, name: Identifier) -> FunctionSummary | None:
+        """Return the summary of the function, if it is up-to-date."""
+        filehash = self.filehash(origin)
+
+        if self.persist and (origin, filehash) not in self._loaded:
+            self._load(origin, filehash)
+
+        summary = self._summaries.get((origin, filehash, name))
+
+        if summary is None:
+            return None
+
+        if any(
+            self.filehash(dependency) != dependency_filehash
+            for dependency, dependency_filehash in summary.dependencies.items()
+        ):
+            return None
+
+        return summary
+
+    def put(self, origin: Path, name: Identifier, summary: FunctionSummary) -> None:
+        filehash = self.filehash(origin)
+
+        self._summaries[(origin, filehash, name)] = summary
+        self._modified.add((origin, filehash))
+
+    def flush(self) -> None:
+        """Write the modified summaries to the cache dir, if persisted."""
+        # HACK Avoid circular import (the plugins use `rattr.results`)
+        from rattr.models.results.util import (
+            make_cacheable_function_summaries,
+            write_cached_function_summaries,
+        )
+
+        if not self.persist:
+            return
+
+        for origin, filehash in sorted(self._modified):
+            cache = make_cacheable_function_summaries(origin, filehash=filehash)
+
+            for (_origin, _filehash, name), summary in self._summaries.items():
+                if (_origin, _filehash) != (origin, filehash):
+                    continue
+
+                cache.summaries[name] = CacheableFunctionSummary(
+                    gets=sorted(summary.gets, key=lambda s: s.id),
+                    sets=sorted(summary.sets, key=lambda s: s.id),
+                    dels=sorted(summary.dels, key=lambda s: s.id),
+                    dependencies=[
+                        CacheableImportInfo(filepath=path, filehash=hash)
+                        for path, hash in sorted(summary.dependencies.items())
+                    ],
+                    classes=dict(sorted(summary.classes.items())),
+                )
+
+            write_cached_function_summaries(origin, cache)
+
+        self._modified.clear()
+
+    def _load(self, origin: Path, filehash: str) -> None:
+        # HACK Avoid circular import (the plugins use `rattr.results`)
+        from rattr.models.results.util import load_cached_function_summaries
+
+        self._loaded.add((origin, filehash))
+
+        cache = load_cached_function_summaries(origin, filehash=filehash)
+
+        if cache is None:
+            return
+
+        for name, summary in cache.summaries.items():
+            self._summaries.setdefault(
+                (origin, filehash, name),
+                FunctionSummary(
+                    gets=frozenset(summary.gets),
+                    sets=frozenset(summary.sets),
+                    dels=frozenset(summary.dels),
+                    dependencies={
+                        Path(info.filepath): info.filehash
+                        for info in summary.dependencies
+                    },
+                    classes=dict(summary.classes),
+                ),
+            )
@@ -3,6 +3,8 @@ from __future__ import annotations
 from collections import deque
 from typing import TYPE_CHECKING
 
+from rattr.config import Config, ResultsEngine
+from rattr.extra.tracing import span
 from rattr.models.results import FileResults
 from rattr.results import (
     IrCallTreeNode,
@@ -10,37 +12,134 @@ from rattr.results import (
     IrTarget,
     construct_call_swaps,
     find_call_target_and_ir,
+    function_results_from_ir,
     unbind_ir_with_call_swaps,
 )
+from rattr.results._scc import iter_results_from_ir_by_scc
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from typing import Final
+
     from rattr.analyser.types import ImportIrs
     from rattr.models.ir import FileIr, FunctionIr
+    from rattr.models.results import FunctionName, FunctionResults
     from rattr.models.symbol import Call
+    from rattr.results._summaries import FunctionSummaries
+
+
+PARALLEL_MIN_FUNCTIONS: Final = 32
+"""The number of functions in the target from which `--jobs` generates the results in
+parallel, as starting the worker pool costs more than simplifying a few functions."""
 
 
 def generate_results_from_ir(
     *,
     target_ir: FileIr,
     import_irs: ImportIrs,
+    engine: ResultsEngine | None = None,
+    summaries: FunctionSummaries | None = None,
+    jobs: int | None = None,
 ) -> FileResults:
+    """Return the results of the target, using the given engine or `--results-engine`.
+
+    When given, the summaries of imported functions are used and updated by the SCC
+    engine, see `FunctionSummaries`.
+
+    The call tree engine generates the results in parallel given more than one job
+    (`--jobs` by default) and at least `PARALLEL_MIN_FUNCTIONS` functions in the target,
+    see `iter_results_from_ir_in_parallel`.
+
+    NB: The IR of the target and the imports is simplified in place.
+    """
     results = FileResults()
+
+    for function, function_results in iter_results_from_ir(
+        target_ir=target_ir,
+        import_irs=import_irs,
+        engine=engine,
+        summaries=summaries,
+        jobs=jobs,
+    ):
+        results[function] = function_results
+
+    return results
+
+
+def iter_results_from_ir(
+    *,
+    target_ir: FileIr,
+    import_irs: ImportIrs,
+    engine: ResultsEngine | None = None,
+    summaries: FunctionSummaries | None = None,
+    jobs: int | None = None,
+) -> Iterator[tuple[FunctionName, FunctionResults]]:
+    """Yield the results of each function in the target, as each is ready.
+
+    See `generate_results_from_ir`, the functions are given in the order of the target
+    and the results of a function are not changed once yielded.
+    """
+    config = Config()
+
+    if engine is None:
+        engine = config.arguments.results_engine
+    if jobs is None:
+        jobs = config.arguments.jobs
+
+    if engine == ResultsEngine.scc:
+        return iter_results_from_ir_by_scc(
+            target_ir=target_ir,
+            import_irs=import_irs,
+            summaries=summaries,
+        )
+
+    if jobs != 1 and len(target_ir) >= PARALLEL_MIN_FUNCTIONS:
+        from rattr.results._parallel import iter_results_from_ir_in_parallel
+
+        return iter_results_from_ir_in_parallel(
+            target_ir=target_ir,
+            import_irs=import_irs,
+            jobs=jobs,
+        )
+
+    return iter_results_from_ir_by_call_tree(
+        target_ir=target_ir,
+        import_irs=import_irs,
+    )
+
+
+def generate_results_from_ir_by_call_tree(
+    *,
+    target_ir: FileIr,
+    import_irs: ImportIrs,
+) -> FileResults:
+    return FileResults(
+        function_results=dict(
+            iter_results_from_ir_by_call_tree(
+                target_ir=target_ir,
+                import_irs=import_irs,
+            )
+        )
+    )
+
+
+def iter_results_from_ir_by_call_tree(
+    *,
+    target_ir: FileIr,
+    import_irs: ImportIrs,
+) -> Iterator[tuple[FunctionName, FunctionResults]]:
     environment = IrEnvironment(target_ir=target_ir, import_irs=import_irs)
 
     for symbol, ir in target_ir.items():
-        target = IrTarget(symbol=symbol, ir=ir)
+        with span(symbol.id, "results", engine="tree"):
+            target = IrTarget(symbol=symbol, ir=ir)
 
-        ir_call_tree = make_target_ir_call_tree(target, environment=environment)
-        simplified = destructively_simplify_ir_call_tree(ir_call_tree)
+            ir_call_tree = make_target_ir_call_tree(target, environment=environment)
+            simplified = destructively_simplify_ir_call_tree(ir_call_tree)
 
-        results[symbol.id] = {
-            "gets": {s.id for s in simplified["gets"]},
-            "sets": {s.id for s in simplified["sets"]},
-            "dels": {s.id for s in simplified["dels"]},
-            "calls": {s.name_of_call for s in simplified["calls"]},
-        }
+            function_results = function_results_from_ir(simplified)
 
-    return results
+        yield symbol.id, function_results
 
 
 def make_target_ir_call_tree(
@@ -0,0 +1,23 @@
+"""Rattr as a daemon, answering requests over a Unix socket.
+
+See `rattr.server._server` for the protocol.
+"""
+from __future__ import annotations
+
+from rattr.server._client import send_request
+from rattr.server._server import (
+    HAS_UNIX_SOCKETS,
+    FileSignature,
+    RattrServer,
+    is_serving,
+    serve,
+)
+
+__all__ = [
+    "send_request",
+    "HAS_UNIX_SOCKETS",
+    "FileSignature",
+    "RattrServer",
+    "is_serving",
+    "serve",
+]
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import json
+import socket
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from typing import Any
+
+
+def send_request(socket_path: Path, method: str, **params: Any) -> dict[str, Any]:
+    """Return the server's response to the request, see `rattr.server`.
+
+    >>> send_request(Path(".rattr/rattr.sock"), "results", target="a.py", function="f")
+    {"ok": true, "target": "a.py", "function": "f", "results": {...}, ...}
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        raise OSError("rattr serve requires Unix sockets, which are unsupported here")
+
+    request = json.dumps({"method": method, "params": params}).encode("utf-8")
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(str(socket_path))
+        client.sendall(request + b"\n")
+
+        with client.makefile("rb") as response:
+            return json.loads(response.readline())
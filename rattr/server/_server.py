@@ -0,0 +1,329 @@
+"""The rattr daemon, see `rattr serve --help`.
+
+Each request is a newline delimited JSON object with a `method` and, optionally,
+`params`; each is answered, in order, by a JSON object on a single line. Where the
+request failed `ok` is `false` and `error` gives the reason.
+
+    {"method": "ping"}
+    {"ok": true}
+
+    {"method": "analyse", "params": {"target": "path/to/file.py"}}
+    {"ok": true, "target": "...", "results": {...}, "badness": 0, "stderr": "..."}
+
+    {"method": "results", "params": {"target": "...", "function": "fn"}}
+    {"ok": true, "target": "...", "function": "fn", "results": {...}, ...}
+
+    {"method": "shutdown"}
+    {"ok": true}
+
+The analysed imports (and the summaries of imported functions) are kept between
+requests. Before each analysis the modules which have changed (by size and mtime, then
+by content hash) are discarded, as are the modules which expanded a starred import from
+a changed module. The module locator forgets the modules found (and not found) only if
+a file was created, removed, or renamed in a directory it has seen.
+
+The diagnostics are those of the current request, see `RattrServer.analyse`.
+"""
+from __future__ import annotations
+
+import io
+import json
+import os
+import socket
+import socketserver
+from contextlib import ExitStack, redirect_stderr
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import attrs
+
+from rattr import error
+from rattr.analyser.parallel import make_import_executor, start_workers
+from rattr.cli.exit_codes import EXIT_FAILURE, EXIT_SUCCESS
+from rattr.config import Config
+from rattr.config.state import enter_target
+from rattr.error.diagnostics import diagnostics
+from rattr.models.util import hash_file_content, serialise
+from rattr.module_locator.util import invalidate_changed_caches
+from rattr.results import FunctionSummaries
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+    from typing import Any, Final
+
+    from rattr.analyser.file import AnalysedImports
+    from rattr.models.results import FileResults
+
+    Response = dict[str, Any]
+
+
+HAS_UNIX_SOCKETS: Final = hasattr(socket, "AF_UNIX")
+"""`False` where there are no Unix sockets (i.e. Windows), thus there is no daemon."""
+
+# NOTE
+# `socketserver.UnixStreamServer` is undefined where there are no Unix sockets, there
+# the server is never instantiated (see `serve`) and so the base is never used
+_UnixStreamServer = (
+    socketserver.UnixStreamServer if HAS_UNIX_SOCKETS else socketserver.BaseServer
+)
+
+
+@attrs.frozen
+class FileSignature:
+    size: int
+    mtime_ns: int
+    filehash: str
+
+    @classmethod
+    def of(cls, path: Path) -> FileSignature | None:
+        """Return the signature of the file, or `None` if it does not exist."""
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+
+        return cls(
+            size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            filehash=hash_file_content(path),
+        )
+
+    @staticmethod
+    def has_changed(path: Path, signature: FileSignature | None) -> bool:
+        if signature is None:
+            return path.exists()
+
+        return not signature.is_up_to_date(path)
+
+    def is_up_to_date(self, path: Path) -> bool:
+        try:
+            stat = path.stat()
+        except OSError:
+            return False
+
+        if (stat.st_size, stat.st_mtime_ns) == (self.size, self.mtime_ns):
+            return True
+
+        return hash_file_content(path) == self.filehash
+
+
+class RattrServer(_UnixStreamServer):
+    """Serve the analysis of targets, keeping the analysed imports warm."""
+
+    def __init__(self, socket_path: Path, *, executor: Executor | None = None) -> None:
+        super().__init__(str(socket_path), RattrRequestHandler)
+
+        if executor is not None:
+            start_workers(executor)
+
+        self.executor = executor
+        self.is_shutting_down = False
+
+        self.analysed_imports: AnalysedImports = {}
+        self.signatures: dict[Path, FileSignature | None] = {}
+        self.summaries = FunctionSummaries(
+            persist=Config().arguments.cache_summaries,
+        )
+
+    def dispatch(self, line: bytes) -> Response:
+        try:
+            request = json.loads(line)
+        except json.JSONDecodeError:
+            return {"ok": False, "error": "malformed request"}
+
+        if not isinstance(request, dict):
+            return {"ok": False, "error": "malformed request"}
+
+        method = request.get("method")
+        params = request.get("params", {})
+
+        if not isinstance(params, dict):
+            return {"ok": False, "error": "malformed request"}
+
+        if method == "ping":
+            return {"ok": True}
+
+        if method == "shutdown":
+            self.is_shutting_down = True
+            return {"ok": True}
+
+        if method == "analyse":
+            return self.analyse(params.get("target"))
+
+        if method == "results":
+            return self.results(params.get("target"), params.get("function"))
+
+        return {"ok": False, "error": f"unknown method {method!r}"}
+
+    def analyse(self, target: str | None) -> Response:
+        # HACK Circular import as `rattr.__main__` imports `rattr.server` for `serve`
+        from rattr.__main__ import analyse_target
+
+        if target is None:
+            return {"ok": False, "error": "missing target"}
+
+        if not Path(target).is_file():
+            return {"ok": False, "error": f"file {target!r} does not exist"}
+
+        # Modules may have been created (or deleted) since the last request
+        invalidate_changed_caches()
+        self.invalidate_changed_imports()
+
+        config = Config()
+        stderr = io.StringIO()
+
+        # NB: The diagnostics of the previous requests are forgotten, lest they grow
+        # without bound (those of the analysed imports are replayed when reused)
+        diagnostics.reset()
+
+        with redirect_stderr(stderr), enter_target(Path(target)):
+            try:
+                *_, results = analyse_target(
+                    analysed_imports=self.analysed_imports,
+                    executor=self.executor,
+                    summaries=self.summaries,
+                )
+            except SystemExit:
+                results, reason = None, "fatal error in analysis"
+            except Exception as exc:
+                # i.e. a syntax error in the target, the daemon must still respond
+                results, reason = None, f"{type(exc).__name__}: {exc}"
+
+            badness = config.state.badness
+
+        self.record_analysed_imports()
+
+        if results is None:
+            return {
+                "ok": False,
+                "error": reason,
+                "target": target,
+                "stderr": stderr.getvalue(),
+            }
+
+        return {
+            "ok": True,
+            "target": target,
+            "results": _to_json(results),
+            "badness": badness,
+            "stderr": stderr.getvalue(),
+        }
+
+    def results(self, target: str | None, function: str | None) -> Response:
+        if function is None:
+            return {"ok": False, "error": "missing function"}
+
+        response = self.analyse(target)
+
+        if not response["ok"]:
+            return response
+
+        if function not in response["results"]:
+            return {"ok": False, "error": f"no function {function!r} in {target!r}"}
+
+        return {
+            **response,
+            "function": function,
+            "results": response["results"][function],
+        }
+
+    def invalidate_changed_imports(self) -> None:
+        """Discard the analysed imports which depend upon a changed file."""
+        changed = {
+            path
+            for path, signature in self.signatures.items()
+            if FileSignature.has_changed(path, signature)
+        }
+
+        for path in changed:
+            del self.signatures[path]
+
+        for origin, analysed in list(self.analysed_imports.items()):
+            dependencies = {Path(origin), *map(Path, analysed.dependencies)}
+
+            if dependencies & changed:
+                del self.analysed_imports[origin]
+
+        self.summaries.refresh()
+
+    def record_analysed_imports(self) -> None:
+        """Record the signature of the files which the analysed imports depend upon.
+
+        NB: A file changed during the analysis which first analysed it is not detected.
+        """
+        for origin, analysed in self.analysed_imports.items():
+            for path in (Path(origin), *map(Path, analysed.dependencies)):
+                if path not in self.signatures:
+                    self.signatures[path] = FileSignature.of(path)
+
+
+class RattrRequestHandler(socketserver.StreamRequestHandler):
+    server: RattrServer
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            if not line.strip():
+                continue
+
+            response = self.server.dispatch(line)
+
+            self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+            self.wfile.flush()
+
+            if self.server.is_shutting_down:
+                return
+
+
+def serve(config: Config) -> int:
+    """Serve requests on the socket given by `--socket` until shutdown."""
+    socket_path: Path = config.arguments.socket
+
+    if not HAS_UNIX_SOCKETS:
+        error.error("rattr serve requires Unix sockets, which are unsupported here")
+        return EXIT_FAILURE
+
+    if socket_path.exists():
+        if is_serving(socket_path):
+            error.error(f"rattr is already serving on {str(socket_path)!r}")
+            return EXIT_FAILURE
+
+        socket_path.unlink()
+
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+
+    with ExitStack() as stack:
+        if config.arguments.jobs != 1:
+            executor = stack.enter_context(make_import_executor())
+        else:
+            executor = None
+
+        server = stack.enter_context(RattrServer(socket_path, executor=executor))
+        stack.callback(os.unlink, socket_path)
+
+        error.info(f"serving on {str(socket_path)!r}")
+
+        try:
+            while not server.is_shutting_down:
+                server.handle_request()
+        except KeyboardInterrupt:
+            pass
+
+    return EXIT_SUCCESS
+
+
+def is_serving(socket_path: Path) -> bool:
+    """Return `True` if a server is listening on the given socket."""
+    if not HAS_UNIX_SOCKETS:
+        return False
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        try:
+            client.connect(str(socket_path))
+        except OSError:
+            return False
+
+    return True
+
+
+def _to_json(results: FileResults) -> dict[str, Any]:
+    return json.loads(serialise(results))
@@ -22,7 +22,7 @@ _ = setup(
     author_email="brandon@saude.org, bpharris@pm.me",
     maintainer="Brandon Harris",
     maintainer_email="brandon@saude.org, bpharris@pm.me",
-    packages=find_packages(),
+    packages=find_packages(exclude=["benchmarks", "benchmarks.*"]),
     description="Rattr rats on your attrs.",
     long_description=README.read_text(),
     long_description_content_type="text/markdown",
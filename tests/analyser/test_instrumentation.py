@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import ast
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from rattr.analyser.base import run_assertors
+from rattr.analyser.file import FileAnalyser
+from rattr.analyser.function import FunctionAnalyser
+from rattr.analyser.instrumentation import (
+    VisitorInstrumentation,
+    VisitorStats,
+    VisitStats,
+    by_own_time,
+)
+from rattr.models.context import compile_root_context
+from rattr.plugins.assertors.import_clobbering import ImportClobberingAssertor
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from tests.shared import ParseFn, StateFn
+
+
+SOURCE = """
+import os
+
+def fn(a, b):
+    a.x = [item.y for item in b.items]
+    return getattr(a, "z")
+"""
+
+
+@pytest.fixture(autouse=True)
+def __set_current_file(state: StateFn) -> Iterator[None]:
+    with state(current_file=Path(__file__)):
+        yield
+
+
+@pytest.fixture
+def instrumentation() -> Iterator[VisitorInstrumentation]:
+    instrumentation = VisitorInstrumentation()
+
+    try:
+        yield instrumentation
+    finally:
+        instrumentation.stop()
+
+
+def analyse(parse: ParseFn) -> None:
+    ast_ = parse(SOURCE)
+    FileAnalyser(ast_, compile_root_context(ast_)).analyse()
+
+
+def test_not_instrumenting(instrumentation: VisitorInstrumentation, parse: ParseFn):
+    analyse(parse)
+
+    assert not instrumentation.is_instrumenting
+    assert instrumentation.collect() is None
+    assert instrumentation.stop() is None
+
+    assert "visit" not in vars(FunctionAnalyser)
+    assert "generic_visit" not in vars(FunctionAnalyser)
+
+
+def test_stop_restores_the_analysers(instrumentation: VisitorInstrumentation):
+    visit_call = vars(FunctionAnalyser)["visit_Call"]
+
+    instrumentation.start()
+
+    assert vars(FunctionAnalyser)["visit_Call"] is not visit_call
+    assert FunctionAnalyser.visit is not ast.NodeVisitor.visit
+
+    instrumentation.stop()
+
+    assert vars(FunctionAnalyser)["visit_Call"] is visit_call
+    assert FunctionAnalyser.visit is ast.NodeVisitor.visit
+    assert "visit" not in vars(FunctionAnalyser)
+    assert "generic_visit" not in vars(FunctionAnalyser)
+
+
+def test_visits_are_recorded(instrumentation: VisitorInstrumentation, parse: ParseFn):
+    instrumentation.start()
+    analyse(parse)
+    stats = instrumentation.stop()
+
+    assert stats is not None
+
+    assert stats.by_node_type["FunctionDef"].count == 1
+    assert stats.by_node_type["ListComp"].count == 1
+    assert stats.by_node_type["Call"].count == 1
+
+    assert stats.by_method["FileAnalyser.visit_FunctionDef"].count == 1
+    assert stats.by_method["FunctionAnalyser.visit_ListComp"].count == 1
+    assert stats.by_method["FunctionAnalyser.visit_comprehension"].count == 1
+    assert stats.by_method["FunctionAnalyser.visit_Call"].count == 1
+
+    for visits in (stats.by_node_type, stats.by_method):
+        for visit_stats in visits.values():
+            assert visit_stats.count > 0
+            assert 0 <= visit_stats.own_time <= visit_stats.time
+
+
+def test_custom_analysers_are_recorded(
+    instrumentation: VisitorInstrumentation,
+    parse: ParseFn,
+):
+    instrumentation.start()
+    analyse(parse)
+    stats = instrumentation.stop()
+
+    assert stats is not None
+    assert stats.by_method["GetattrAnalyser.on_call"].count == 1
+
+
+def test_multiplexed_assertors_are_recorded(
+    instrumentation: VisitorInstrumentation,
+    parse: ParseFn,
+):
+    ast_ = parse(SOURCE)
+    context = compile_root_context(ast_)
+
+    instrumentation.start()
+    run_assertors([ImportClobberingAssertor(is_strict=False)], ast_, context)
+    stats = instrumentation.stop()
+
+    assert stats is not None
+    assert stats.by_method["ImportClobberingAssertor.enter_FunctionDef"].count == 1
+    assert stats.by_method["ImportClobberingAssertor.enter_Assign"].count == 1
+
+
+def test_nested_visits_are_excluded_from_the_own_time(
+    instrumentation: VisitorInstrumentation,
+    parse: ParseFn,
+):
+    instrumentation.start()
+    analyse(parse)
+    stats = instrumentation.stop()
+
+    assert stats is not None
+
+    module = stats.by_node_type["Module"]
+    function_def = stats.by_node_type["FunctionDef"]
+
+    assert module.time >= function_def.time
+    assert module.own_time <= module.time - function_def.time
+
+
+def test_collect(instrumentation: VisitorInstrumentation, parse: ParseFn):
+    instrumentation.start()
+
+    analyse(parse)
+    first = instrumentation.collect()
+
+    analyse(parse)
+    second = instrumentation.collect()
+
+    assert instrumentation.is_instrumenting
+    assert first is not None and second is not None
+    assert first.by_node_type["FunctionDef"].count == 1
+    assert second.by_node_type["FunctionDef"].count == 1
+
+
+def test_extend(instrumentation: VisitorInstrumentation):
+    from_worker = VisitorStats(
+        by_node_type={"Call": VisitStats(count=2, time=2.0, own_time=1.0)},
+        by_method={"FunctionAnalyser.visit_Call": VisitStats(1, 1.0, 1.0)},
+    )
+
+    instrumentation.extend(from_worker)
+    assert instrumentation.stats is None
+
+    instrumentation.start()
+    instrumentation.extend(from_worker)
+    instrumentation.extend(from_worker)
+
+    assert instrumentation.stop() == VisitorStats(
+        by_node_type={"Call": VisitStats(count=4, time=4.0, own_time=2.0)},
+        by_method={"FunctionAnalyser.visit_Call": VisitStats(2, 2.0, 2.0)},
+    )
+
+
+def test_by_own_time():
+    visits = {
+        "cheap": VisitStats(count=10, time=5.0, own_time=1.0),
+        "expensive": VisitStats(count=1, time=2.0, own_time=2.0),
+    }
+
+    assert [key for key, _ in by_own_time(visits)] == ["expensive", "cheap"]
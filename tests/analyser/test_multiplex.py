@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import ast
+from pathlib import Path
+from typing import TYPE_CHECKING
+from unittest import mock
+
+import pytest
+
+from rattr.analyser.base import Assertor, run_assertors
+from rattr.analyser.multiplex import SKIP_CHILDREN, is_multiplexable, multiplex
+from rattr.config.state import enter_file
+from rattr.models.context import Context
+from rattr.models.symbol import Name
+
+if TYPE_CHECKING:
+    from rattr.analyser.multiplex import SkipChildren
+
+
+SOURCE = """\
+def fn(a):
+    return a.b
+
+class Cls:
+    def method(self):
+        return self.x
+
+def skipped():
+    return skipped.y
+"""
+
+
+class Recorder:
+    """Record the handled nodes, skipping the children of the given function."""
+
+    def __init__(self, skip: str | None = None) -> None:
+        self.skip = skip
+        self.events: list[tuple[str, str]] = []
+
+    def enter_FunctionDef(self, node: ast.FunctionDef) -> SkipChildren | None:
+        self.events.append(("enter", node.name))
+
+        if node.name == self.skip:
+            return SKIP_CHILDREN
+
+    def leave_FunctionDef(self, node: ast.FunctionDef) -> None:
+        self.events.append(("leave", node.name))
+
+    def enter_Attribute(self, node: ast.Attribute) -> None:
+        self.events.append(("enter", ast.unparse(node)))
+
+
+class LegacyAssertor(Assertor):
+    def __init__(self) -> None:
+        super().__init__(is_strict=False)
+        self.names: list[str] = []
+
+    def visit_Name(self, node: ast.Name) -> None:
+        self.names.append(node.id)
+
+
+class HandlerAssertor(Assertor):
+    def __init__(self) -> None:
+        super().__init__(is_strict=False)
+        self.names: list[str] = []
+
+    def enter_Name(self, node: ast.Name) -> None:
+        self.context.add(Name(node.id))
+        self.names.append(node.id)
+
+
+@pytest.fixture
+def tree() -> ast.Module:
+    return ast.parse(SOURCE)
+
+
+def test_multiplex(tree: ast.Module):
+    recorder = Recorder()
+    multiplex(tree, [recorder])
+
+    assert recorder.events == [
+        ("enter", "fn"),
+        ("enter", "a.b"),
+        ("leave", "fn"),
+        ("enter", "method"),
+        ("enter", "self.x"),
+        ("leave", "method"),
+        ("enter", "skipped"),
+        ("enter", "skipped.y"),
+        ("leave", "skipped"),
+    ]
+
+
+def test_multiplex_is_equivalent_to_separate_walks(tree: ast.Module):
+    separate = [Recorder(), Recorder(skip="fn"), Recorder(skip="skipped")]
+    multiplexed = [Recorder(), Recorder(skip="fn"), Recorder(skip="skipped")]
+
+    for recorder in separate:
+        multiplex(tree, [recorder])
+
+    multiplex(tree, multiplexed)
+
+    assert [r.events for r in multiplexed] == [r.events for r in separate]
+
+
+def test_multiplex_skip_children_is_per_visitor(tree: ast.Module):
+    skips, does_not_skip = Recorder(skip="skipped"), Recorder()
+    multiplex(tree, [skips, does_not_skip])
+
+    assert skips.events[-1] == ("enter", "skipped")
+    assert does_not_skip.events[-2:] == [("enter", "skipped.y"), ("leave", "skipped")]
+
+
+def test_multiplex_walks_the_tree_once(tree: ast.Module):
+    with mock.patch(
+        "rattr.analyser.multiplex.ast.iter_child_nodes",
+        side_effect=ast.iter_child_nodes,
+    ) as iter_child_nodes:
+        multiplex(tree, [Recorder()])
+        once = iter_child_nodes.call_count
+
+        iter_child_nodes.reset_mock()
+        multiplex(tree, [Recorder() for _ in range(4)])
+
+    assert iter_child_nodes.call_count == once
+
+
+def test_is_multiplexable():
+    assert is_multiplexable(Recorder())
+    assert is_multiplexable(HandlerAssertor())
+
+    assert not is_multiplexable(object())
+    assert not is_multiplexable(LegacyAssertor())
+    assert not is_multiplexable(ast.NodeVisitor())
+
+
+def test_run_assertors(tree: ast.Module):
+    handler, other_handler, legacy = (
+        HandlerAssertor(),
+        HandlerAssertor(),
+        LegacyAssertor(),
+    )
+
+    with enter_file(Path("target.py")):
+        context = Context(parent=None)
+        run_assertors([handler, legacy, other_handler], tree, context)
+
+    assert handler.names == other_handler.names == legacy.names
+    assert handler.names == ["a", "self", "skipped"]
+
+    # Each assertor is given its own copy of the context
+    assert handler.context is not other_handler.context
+    assert "a" in handler.context
+    assert "a" not in context
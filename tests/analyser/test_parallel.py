@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+import pytest
+
+from rattr.analyser.file import parse_and_analyse_file
+from rattr.analyser.instrumentation import instrumentation
+from rattr.analyser.parallel import make_import_executor
+from rattr.config import Config, State
+from rattr.config.state import enter_target
+from rattr.error.diagnostics import diagnostics
+from rattr.extra.tracing import tracer
+from rattr.results import generate_results_from_ir
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+    from pathlib import Path
+
+    from rattr.analyser.file import AnalysedImports
+    from tests.shared import ArgumentsFn
+
+
+@pytest.fixture
+def target(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    (tmp_path / "first.py").write_text(
+        "from second import inner\n"
+        "import third\n"
+        "\n"
+        "def outer(a):\n"
+        "    return inner(a.b) + third.other(a)\n"
+    )
+    (tmp_path / "second.py").write_text(
+        "from third import *\n"
+        "\n"
+        "def inner(x):\n"
+        "    x.mutated = True\n"
+        "    return undefined_fn(x)\n"
+    )
+    (tmp_path / "third.py").write_text(
+        "def other(y):\n    del y.deleted\n    return y.attr\n"
+    )
+    (tmp_path / "target.py").write_text(
+        "from first import outer\n"
+        "import second\n"
+        "\n"
+        "def fn(arg):\n"
+        "    return outer(arg) + second.inner(arg)\n"
+    )
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(
+        "rattr.module_locator._locate.derive_working_dir",
+        lambda: str(tmp_path),
+    )
+
+    return tmp_path / "target.py"
+
+
+def analyse(target: Path, *, jobs: int, analysed_imports: AnalysedImports = None):
+    config = Config()
+
+    with enter_target(target):
+        if jobs == 1:
+            file_ir, import_irs, stats = parse_and_analyse_file(analysed_imports)
+        else:
+            with make_import_executor(jobs) as executor:
+                file_ir, import_irs, stats = parse_and_analyse_file(
+                    analysed_imports,
+                    executor=executor,
+                )
+
+        results = generate_results_from_ir(target_ir=file_ir, import_irs=import_irs)
+        state = State(
+            badness_from_target_file=config.state.badness_from_target_file,
+            badness_from_imports=config.state.badness_from_imports,
+            badness_from_simplification=config.state.badness_from_simplification,
+        )
+
+    return results, import_irs, stats, state
+
+
+def test_parallel_is_equivalent_to_sequential(target: Path, capfd):
+    sequential = analyse(target, jobs=1)
+    _, sequential_stderr = capfd.readouterr()
+
+    parallel = analyse(target, jobs=2)
+    _, parallel_stderr = capfd.readouterr()
+
+    sequential_results, sequential_irs, sequential_stats, sequential_state = sequential
+    parallel_results, parallel_irs, parallel_stats, parallel_state = parallel
+
+    assert parallel_results == sequential_results
+    assert parallel_irs == sequential_irs
+    assert list(parallel_irs.keys()) == list(sequential_irs.keys())
+    assert parallel_stats.import_lines == sequential_stats.import_lines
+    assert parallel_stats.number_of_imports == sequential_stats.number_of_imports
+    assert parallel_state == sequential_state
+
+    assert "undefined_fn" in sequential_stderr
+    assert parallel_stderr == sequential_stderr
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_low_memory_is_equivalent(target: Path, arguments: ArgumentsFn, jobs: int):
+    default_results, default_irs, *_ = analyse(target, jobs=jobs)
+
+    with arguments(low_memory=True):
+        results, import_irs, *_ = analyse(target, jobs=jobs)
+
+    assert results == default_results
+    assert import_irs == default_irs
+    assert all(
+        foc.token is None for file_ir in import_irs.values() for foc in file_ir.keys()
+    )
+
+
+def test_parallel_skips_previously_analysed_imports(target: Path):
+    analysed_imports: AnalysedImports = {}
+
+    first, *_ = analyse(target, jobs=2, analysed_imports=analysed_imports)
+    assert len(analysed_imports) == 3
+
+    second, *_ = analyse(target, jobs=2, analysed_imports=analysed_imports)
+    assert len(analysed_imports) == 3
+
+    assert first == second
+
+
+def test_parallel_batch_mode(target: Path):
+    (target.parent / "t3.py").write_text(
+        "from target import fn\n"
+        "\n"
+        "def caller(a):\n"
+        "    return fn(a) + undefined_caller(a)\n"
+    )
+    (target.parent / "target.py").write_text(
+        "import third\n"
+        "\n"
+        "def fn(arg):\n"
+        "    return third.other(arg) + undefined_fn(arg)\n"
+    )
+
+    batch = [target, target.parent / "t3.py"]
+
+    def analyse_batch(executor: Executor | None) -> list[State]:
+        config = Config()
+        states: list[State] = []
+
+        for target in batch:
+            with enter_target(target):
+                parse_and_analyse_file(executor=executor)
+                states.append(config.state)
+
+        return states
+
+    sequential = analyse_batch(None)
+
+    # The pool is shared between the targets, as in batch mode
+    with make_import_executor(2) as executor:
+        parallel = analyse_batch(executor)
+
+    assert parallel == sequential
+    assert parallel[1].badness_from_imports > 0
+
+
+def test_parallel_fatal_error(target: Path, capfd):
+    (target.parent / "third.py").write_text("x = lambda: 1\nx, y = lambda: 1, 2\n")
+
+    with pytest.raises(SystemExit):
+        analyse(target, jobs=2)
+
+    _, stderr = capfd.readouterr()
+    assert "lambda assignment must be one-to-one" in stderr
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_trace(target: Path, arguments: ArgumentsFn, jobs: int):
+    with arguments(trace=target.parent / "trace.json"):
+        tracer.start()
+
+        try:
+            analyse(target, jobs=jobs)
+        finally:
+            events = tracer.stop()
+
+    # When given `--jobs` the main process waits upon the (prefetched) analysis
+    modules = {
+        e["name"]: e
+        for e in events
+        if e["args"].get("origin") is not None and not e["args"].get("prefetched")
+    }
+    phases = {(e["name"], e["pid"]) for e in events if e["cat"] == "import"}
+
+    assert sorted(modules) == ["first", "second", "third"]
+
+    for module in modules.values():
+        assert ("read", module["pid"]) in phases
+        assert ("parse", module["pid"]) in phases
+        assert ("root context", module["pid"]) in phases
+        assert ("analyse", module["pid"]) in phases
+
+    if jobs == 1:
+        assert {module["pid"] for module in modules.values()} == {os.getpid()}
+    else:
+        assert os.getpid() not in {module["pid"] for module in modules.values()}
+        assert {"first", "second", "third"} <= {
+            n for n, p in phases if p == os.getpid()
+        }
+
+    assert [e["name"] for e in events if e["cat"] == "results"] == ["fn"]
+    assert {e["name"] for e in events if e["cat"] == "target"} == {
+        "parse",
+        "root context",
+        "assert",
+        "analyse imports",
+        "analyse file",
+        "analyse",
+    }
+
+
+def test_visitor_stats_are_equivalent(target: Path, arguments: ArgumentsFn):
+    counts = {}
+
+    for jobs in (1, 2):
+        with arguments(visitor_stats=True):
+            instrumentation.start()
+
+            try:
+                *_, stats, _ = analyse(target, jobs=jobs)
+            finally:
+                instrumentation.stop()
+
+        assert stats.visitors is not None
+
+        counts[jobs] = (
+            {k: v.count for k, v in stats.visitors.by_node_type.items()},
+            {k: v.count for k, v in stats.visitors.by_method.items()},
+        )
+
+    # The imports analysed by the workers are added to the stats of the main process
+    assert counts[2] == counts[1]
+    assert counts[1][0]["Module"] == 4
+
+
+def test_diagnostics_are_equivalent(target: Path):
+    records = {}
+
+    for jobs in (1, 2):
+        diagnostics.reset()
+        analyse(target, jobs=jobs)
+
+        records[jobs] = list(diagnostics.records.values())
+
+    assert records[2] == records[1]
+    assert any("undefined_fn" in d.message for d in records[1])
@@ -335,3 +335,29 @@ class TestGeneratorExpession:
 
         assert file_ir == expected_file_ir
         assert file_results == expected_file_results
+
+
+class TestLocations:
+    def test_equal_names_keep_their_own_location(
+        self,
+        analyse_single_file: Callable[[str], tuple[FileIr, FileResults]],
+    ):
+        file_ir, _ = analyse_single_file(
+            """
+            def a(x):
+                x.foo = 1
+                return x.bar
+
+            def b(x):
+                print("shift the columns")
+                return x.bar + x.foo
+            """
+        )
+        function_irs = {fn.name: file_ir[fn] for fn in file_ir}
+
+        def lines(fn: str, action: str) -> dict[str, int]:
+            return {s.name: s.location.lineno for s in function_irs[fn][action]}
+
+        assert lines("a", "sets") == {"x.foo": 2}
+        assert lines("a", "gets") == {"x.bar": 3}
+        assert lines("b", "gets") == {"x.bar": 7, "x.foo": 7}
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import ast
+from typing import TYPE_CHECKING
+
+import attrs
+import pytest
+
+from benchmarks.generate import SyntheticPackageConfig, generate_package
+from rattr.analyser.file import parse_and_analyse_file
+from rattr.config.state import enter_target
+from rattr.results import generate_results_from_ir
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def sources(root: Path) -> dict[str, str]:
+    return {
+        str(file.relative_to(root)): file.read_text()
+        for file in sorted(root.rglob("*.py"))
+    }
+
+
+def test_generate_package_is_deterministic(tmp_path: Path):
+    config = SyntheticPackageConfig(modules=8, functions_per_module=4)
+
+    generate_package(tmp_path / "first", config)
+    generate_package(tmp_path / "second", config)
+
+    assert sources(tmp_path / "first") == sources(tmp_path / "second")
+
+    generate_package(tmp_path / "other", attrs.evolve(config, seed=1))
+
+    assert sources(tmp_path / "first") != sources(tmp_path / "other")
+
+
+def test_generate_package_shape(tmp_path: Path):
+    config = SyntheticPackageConfig(
+        modules=6,
+        functions_per_module=3,
+        call_depth=2,
+        import_fan_out=2,
+        starred_import_chain=2,
+        recursion_cycles=1,
+    )
+    target = generate_package(tmp_path, config)
+
+    assert target == tmp_path / "target.py"
+    assert sorted(sources(tmp_path)) == [
+        "synthetic/__init__.py",
+        *(f"synthetic/mod_{i}.py" for i in range(6)),
+        "target.py",
+    ]
+
+    for i in range(6):
+        module = ast.parse((tmp_path / "synthetic" / f"mod_{i}.py").read_text())
+        imports = [node for node in module.body if isinstance(node, ast.ImportFrom)]
+        functions = [n.name for n in module.body if isinstance(n, ast.FunctionDef)]
+
+        is_starred = [alias.name == "*" for node in imports for alias in node.names]
+
+        # The first modules import the next by a starred import
+        assert is_starred.count(True) == (1 if i < 2 else 0)
+
+        # The next module is always imported, and the last module imports nothing
+        if i < 5:
+            assert imports[0].module == f"synthetic.mod_{i + 1}"
+        else:
+            assert imports == []
+
+        # Each entry function has a chain of helpers
+        assert len(functions) == 3 * (1 + 2)
+        assert [f for f in functions if f.startswith("fn_")] == [
+            f"fn_{i}_0",
+            f"fn_{i}_1",
+            f"fn_{i}_2",
+        ]
+
+
+@pytest.mark.parametrize(
+    "changes",
+    [
+        {"modules": 0},
+        {"functions_per_module": 0},
+        {"import_fan_out": 0},
+        {"call_depth": -1},
+        {"starred_import_chain": 10},
+        {"recursion_cycles": 11},
+    ],
+)
+def test_invalid_config(changes):
+    with pytest.raises(ValueError):
+        SyntheticPackageConfig(**{"modules": 10, "functions_per_module": 10, **changes})
+
+
+def test_generated_package_is_analysed(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    config = SyntheticPackageConfig(
+        modules=6,
+        functions_per_module=3,
+        recursion_cycles=2,
+        name="synthetic_analysed",
+    )
+    target = generate_package(tmp_path, config)
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(
+        "rattr.module_locator._locate.derive_working_dir",
+        lambda: str(tmp_path),
+    )
+
+    with enter_target(target):
+        file_ir, import_irs, stats = parse_and_analyse_file()
+        results = generate_results_from_ir(target_ir=file_ir, import_irs=import_irs)
+
+    assert stats.number_of_unique_imports == 6
+    assert sorted(import_irs) == [f"synthetic_analysed.mod_{i}" for i in range(6)]
+
+    assert list(results.keys()) == ["target_0", "target_1", "target_2"]
+    assert "obj.target.attr_0" in results["target_0"]["sets"]
+    assert "other.items" in results["target_0"]["gets"]
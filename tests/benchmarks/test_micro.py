@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from benchmarks.micro import (
+    BENCHMARK_FILE,
+    BENCHMARKS,
+    BenchmarkResult,
+    compare,
+    load_baseline,
+    run_benchmark,
+    run_benchmarks,
+    save_baseline,
+)
+from rattr.config.state import enter_file
+
+
+@pytest.mark.parametrize("name", list(BENCHMARKS))
+def test_benchmark(name: str, capfd):
+    with enter_file(BENCHMARK_FILE):
+        run = BENCHMARKS[name]()
+        run()
+
+    # i.e. the benchmark exercises the happy path
+    _, stderr = capfd.readouterr()
+    assert "fatal" not in stderr
+
+
+def test_benchmarks_are_registered():
+    assert {
+        "unbind_name",
+        "construct_call_swaps",
+        "Context.get_call_target",
+        "Context.__getitem__",
+        "find_module_spec_fast",
+        "derive_module_name_from_path",
+        "serialise[CacheableResults]",
+        "deserialise[CacheableResults]",
+    } <= set(BENCHMARKS)
+
+    assert any(name.startswith("FunctionAnalyser.analyse[") for name in BENCHMARKS)
+
+
+def test_run_benchmark():
+    calls = 0
+
+    def setup():
+        def run():
+            nonlocal calls
+            calls += 1
+
+        return run
+
+    result = run_benchmark(setup, repeat=3, min_time=0.001)
+
+    assert 0 < result.best <= result.median
+    assert result.number >= 1
+    assert calls >= 3 * result.number
+
+
+def test_run_benchmarks_by_pattern():
+    results = run_benchmarks("^construct_call_swaps$", repeat=1, min_time=0.001)
+
+    assert list(results) == ["construct_call_swaps"]
+
+
+def test_compare():
+    baseline = {
+        "faster": BenchmarkResult(best=2.0, median=2.0, number=1),
+        "slower": BenchmarkResult(best=1.0, median=1.0, number=1),
+        "within_tolerance": BenchmarkResult(best=1.0, median=1.0, number=1),
+    }
+    results = {
+        "faster": BenchmarkResult(best=1.0, median=1.0, number=1),
+        "slower": BenchmarkResult(best=1.5, median=1.5, number=1),
+        "within_tolerance": BenchmarkResult(best=1.05, median=1.05, number=1),
+        "new": BenchmarkResult(best=1.0, median=1.0, number=1),
+    }
+
+    comparisons = {c.name: c for c in compare(results, baseline, tolerance=0.1)}
+
+    assert comparisons["faster"].change == pytest.approx(-0.5)
+    assert comparisons["slower"].change == pytest.approx(0.5)
+    assert comparisons["new"].change is None
+
+    assert [name for name, c in comparisons.items() if c.is_regression] == ["slower"]
+
+
+def test_save_and_load_baseline(tmp_path: Path):
+    results = {
+        "a": BenchmarkResult(best=1e-6, median=2e-6, number=1024),
+        "b": BenchmarkResult(best=0.5, median=0.5, number=1),
+    }
+
+    save_baseline(tmp_path / "baseline.json", results)
+
+    assert load_baseline(tmp_path / "baseline.json") == results
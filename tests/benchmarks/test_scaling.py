@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from benchmarks.scaling import run_benchmarks
+
+
+def test_run_benchmarks():
+    report = run_benchmarks(["tiny"])
+
+    (benchmark,) = report["benchmarks"]
+
+    assert benchmark["size"] == "tiny"
+    assert benchmark["config"]["modules"] == 5
+    assert benchmark["modules"] == 5 + 1
+    assert benchmark["lines"] > 0
+    assert benchmark["lines_per_second"] > 0
+
+    assert set(benchmark["time"]) == {
+        "parse",
+        "root_context",
+        "assert",
+        "analyse_imports",
+        "analyse_file",
+        "results",
+        "total",
+    }
+    assert benchmark["time"]["total"] >= benchmark["time"]["analyse_imports"]
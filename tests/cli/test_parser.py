@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import io
+from pathlib import Path
+
+from rattr.cli.parser import parse_arguments, parse_serve_arguments
+
+
+class TestTargets:
+    def test_single_target(self):
+        arguments = parse_arguments(
+            sys_args=["a.py"],
+            project_toml_conf={},
+            exit_on_error=False,
+        )
+
+        assert arguments.target == Path("a.py")
+        assert arguments.targets == [Path("a.py")]
+        assert not arguments.is_in_batch_mode
+
+    def test_multiple_targets(self):
+        arguments = parse_arguments(
+            sys_args=["a.py", "b.py", "c.py"],
+            project_toml_conf={},
+            exit_on_error=False,
+        )
+
+        assert arguments.target == Path("a.py")
+        assert arguments.targets == [Path("a.py"), Path("b.py"), Path("c.py")]
+        assert arguments.is_in_batch_mode
+
+    def test_targets_from_stdin(self, monkeypatch):
+        monkeypatch.setattr("sys.stdin", io.StringIO("b.py\n\n  c.py  \n"))
+
+        arguments = parse_arguments(
+            sys_args=["a.py", "-"],
+            project_toml_conf={},
+            exit_on_error=False,
+        )
+
+        assert arguments.target == Path("a.py")
+        assert arguments.targets == [Path("a.py"), Path("b.py"), Path("c.py")]
+
+
+class TestTrace:
+    def test_trace(self):
+        arguments = parse_arguments(
+            sys_args=["--trace", "trace.json", "a.py"],
+            project_toml_conf={},
+            exit_on_error=False,
+        )
+
+        assert arguments.trace == Path("trace.json")
+
+    def test_no_trace(self):
+        arguments = parse_arguments(
+            sys_args=["a.py"],
+            project_toml_conf={},
+            exit_on_error=False,
+        )
+
+        assert arguments.trace is None
+
+
+class TestProfile:
+    def test_profile(self):
+        arguments = parse_arguments(
+            sys_args=["--profile", "profile", "a.py"],
+            project_toml_conf={},
+            exit_on_error=False,
+        )
+
+        assert arguments.profile == Path("profile")
+
+    def test_no_profile(self):
+        arguments = parse_arguments(
+            sys_args=["a.py"],
+            project_toml_conf={},
+            exit_on_error=False,
+        )
+
+        assert arguments.profile is None
+
+
+class TestDiagnostics:
+    def test_diagnostics(self):
+        arguments = parse_arguments(
+            sys_args=["--diagnostics", "diagnostics.sarif", "a.py"],
+            project_toml_conf={},
+            exit_on_error=False,
+        )
+
+        assert arguments.diagnostics == Path("diagnostics.sarif")
+
+    def test_no_diagnostics(self):
+        arguments = parse_arguments(
+            sys_args=["a.py"],
+            project_toml_conf={},
+            exit_on_error=False,
+        )
+
+        assert arguments.diagnostics is None
+
+
+class TestServeArguments:
+    def test_socket(self):
+        arguments = parse_serve_arguments(
+            sys_args=["--socket", "my.sock", "--follow-imports", "3"],
+            project_toml_conf={},
+            exit_on_error=False,
+        )
+
+        assert arguments.socket == Path("my.sock")
+        assert arguments.is_serving
+        assert arguments.cache_file is None
+        assert arguments.trace is None
+        assert arguments.profile is None
+        assert arguments.diagnostics is None
+        assert arguments._follow_imports_level == 3
+
+    def test_default_socket(self, monkeypatch, tmp_path: Path):
+        monkeypatch.setattr("rattr.cli.parser.find_project_root", lambda: tmp_path)
+
+        arguments = parse_serve_arguments(
+            sys_args=[],
+            project_toml_conf={},
+            exit_on_error=False,
+        )
+
+        assert arguments.socket == tmp_path / ".rattr" / "rattr.sock"
+
+    def test_cli_arguments_are_not_serving(self):
+        arguments = parse_arguments(
+            sys_args=["a.py"],
+            project_toml_conf={},
+            exit_on_error=False,
+        )
+
+        assert not arguments.is_serving
@@ -7,7 +7,7 @@ from unittest import mock
 import pytest
 
 from rattr.cli.parser import _parse_project_config, parse_arguments
-from rattr.config import Arguments, Output
+from rattr.config import Arguments, CacheFormat, Output, ResultsEngine
 from rattr.versioning import is_python_version
 
 
@@ -36,6 +36,7 @@ class TestToml:
             _warning_level="all",
             threshold=1,
             # From sys_args
+            _targets=[Path("my/rattr/target.py")],
             target=Path("my/rattr/target.py"),
             # Defaults
             pyproject_toml_override=None,
@@ -44,7 +45,18 @@ class TestToml:
             is_strict=False,
             stdout=Output.results,
             force_refresh_cache=False,
+            cache_imports=False,
+            jobs=1,
+            results_engine=ResultsEngine.tree,
+            cache_summaries=False,
+            cache_format=CacheFormat.json,
+            low_memory=False,
+            memory_stats=False,
+            visitor_stats=False,
             cache_file=None,
+            trace=None,
+            profile=None,
+            diagnostics=None,
         )
 
     def test_valid_toml_without_sys_args(self, toml_well_formed):
@@ -91,10 +103,22 @@ class TestToml:
             truncate_deep_paths=False,
             stdout=Output.results,
             force_refresh_cache=False,
+            cache_imports=False,
+            jobs=1,
+            results_engine=ResultsEngine.tree,
+            cache_summaries=False,
+            cache_format=CacheFormat.json,
+            low_memory=False,
+            memory_stats=False,
+            visitor_stats=False,
             cache_file=None,
+            trace=None,
+            profile=None,
+            diagnostics=None,
             # Sys args
             _follow_imports_level=3,
             _excluded_names=["fn_excluded_1", "fn_excluded_2", "fn_excluded_3"],
+            _targets=[Path("this/is/the/target.py")],
             target=Path("this/is/the/target.py"),
         )
 
@@ -115,11 +139,23 @@ class TestToml:
             is_strict=False,
             stdout=Output.results,
             force_refresh_cache=False,
+            cache_imports=False,
+            jobs=1,
+            results_engine=ResultsEngine.tree,
+            cache_summaries=False,
+            cache_format=CacheFormat.json,
+            low_memory=False,
+            memory_stats=False,
+            visitor_stats=False,
             cache_file=None,
+            trace=None,
+            profile=None,
+            diagnostics=None,
             # Toml
             _excluded_names=["fn_excluded_4", "fn_excluded_5"],
             threshold=500,
             # Required sys arg
+            _targets=[Path("my/rattr/target.py")],
             target=Path("my/rattr/target.py"),
         )
 
@@ -140,7 +176,18 @@ class TestToml:
             is_strict=False,
             stdout=Output.results,
             force_refresh_cache=False,
+            cache_imports=False,
+            jobs=1,
+            results_engine=ResultsEngine.tree,
+            cache_summaries=False,
+            cache_format=CacheFormat.json,
+            low_memory=False,
+            memory_stats=False,
+            visitor_stats=False,
             cache_file=None,
+            trace=None,
+            profile=None,
+            diagnostics=None,
             # From toml and sys args
             _excluded_names=[
                 "fn_excluded_4",
@@ -151,6 +198,7 @@ class TestToml:
             ],
             # From sys args
             threshold=8,  # 500 from toml, overwritten by sys args
+            _targets=[Path("this/is/the/target.py")],
             target=Path("this/is/the/target.py"),
         )
 
@@ -256,6 +304,15 @@ class TestTomlValidation:
             ({"strict": False}),
             ({"threshold": 1}),
             ({"threshold": -600}),  # Invalid but checked by `validate_arguments`
+            ({"cache-imports": True}),
+            ({"cache-imports": False}),
+            ({"jobs": 4}),
+            ({"results-engine": "scc"}),
+            ({"cache-summaries": True}),
+            ({"cache-format": "compact"}),
+            ({"low-memory": True}),
+            ({"memory-stats": True}),
+            ({"visitor-stats": True}),
             ({"stdout": "ir"}),
             ({"stdout": "results"}),
         ],
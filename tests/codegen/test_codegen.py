@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import pytest
+
+from rattr.codegen import gen_import_from_stmt
+
+
+@pytest.mark.parametrize(
+    "module, target, expected",
+    [
+        ("module", "name", "from module import name"),
+        ("module", "*", "from module import *"),
+        ("package.module", "name", "from package.module import name"),
+        ("package.module", "*", "from package.module import *"),
+    ],
+)
+def test_gen_import_from_stmt(module: str, target: str, expected: str):
+    assert gen_import_from_stmt(module, target) == expected
+
+
+@pytest.mark.parametrize(
+    "module, target",
+    [
+        ("", "name"),
+        ("package.", "name"),
+        ("package..module", "name"),
+        ("1module", "name"),
+        ("module", "a.b"),
+        ("module", ""),
+    ],
+)
+def test_gen_import_from_stmt_is_invalid(module: str, target: str):
+    with pytest.raises(ValueError):
+        gen_import_from_stmt(module, target)
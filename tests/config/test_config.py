@@ -6,6 +6,9 @@ from pathlib import Path
 
 import pytest
 
+from rattr.config import State
+from rattr.config.state import enter_target
+
 short_relative_path = Path("relative_dir") / "file.txt"
 long_relative_path = (
     Path("relative_dir")
@@ -91,6 +94,27 @@ class TestState:
             assert config.state.full_badness == 15
 
 
+class TestEnterTarget:
+    def test_enter_target(self, config, state):
+        old_target, old_state = config.arguments.target, config.state
+
+        with state(badness_from_target_file=3):
+            with enter_target(Path("other.py")):
+                assert config.arguments.target == Path("other.py")
+                assert config.state == State()
+
+                with state(current_file=Path("other.py")):
+                    assert config.is_in_target_file
+                    config.increment_badness(5)
+
+                assert config.state.badness_from_target_file == 5
+
+            assert config.state.badness_from_target_file == 3
+
+        assert config.arguments.target == old_target
+        assert config.state is old_state
+
+
 class TestConfig:
     def test_increment_badness(self, assert_badness, config, state, reset):
         with reset():
@@ -16,7 +16,8 @@ import pytest
 from rattr.analyser.base import Assertor, CustomFunctionAnalyser
 from rattr.analyser.file import FileAnalyser
 from rattr.ast.types import Identifier
-from rattr.config import Arguments, Config, Output, State
+from rattr.config import Arguments, CacheFormat, Config, Output, ResultsEngine, State
+from rattr.error.diagnostics import diagnostics
 from rattr.models.context import Context, SymbolTable, compile_root_context
 from rattr.models.ir import FileIr, FunctionIr
 from rattr.models.results import FileResults
@@ -28,6 +29,7 @@ from rattr.models.symbol import (
     Symbol,
     UserDefinedCallableSymbol,
 )
+from rattr.module_locator.util import forget_directory_listings
 from rattr.results import generate_results_from_ir
 from tests.helpers import clear_memoisation_caches
 
@@ -88,6 +90,11 @@ def pytest_configure(config):
         "markers",
         "update_expected_irs: as with update_expected_results but for irs",
     )
+    config.addinivalue_line(
+        "markers",
+        "wall_clock: mark test that asserts a wall-clock budget, thus depends upon the "
+        "machine, only run if the mark is explicitly given",
+    )
 
 
 def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]):
@@ -118,6 +125,11 @@ def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item
         "update_expected_irs",
         config=config,
     )
+    skip_test_items_with_mark_if_not_explicitly_given(
+        items,
+        "wall_clock",
+        config=config,
+    )
 
 
 def skip_test_items_with_mark(items: list[pytest.Item], mark: str):
@@ -189,6 +201,18 @@ def _init_testing_config() -> None:
             is_strict=False,
             threshold=0,
             stdout=Output.results,
+            force_refresh_cache=False,
+            cache_imports=False,
+            jobs=1,
+            results_engine=ResultsEngine.tree,
+            cache_summaries=False,
+            cache_format=CacheFormat.json,
+            low_memory=False,
+            memory_stats=False,
+            visitor_stats=False,
+            trace=None,
+            profile=None,
+            diagnostics=None,
             target=Path("target.py"),
         ),
         state=State(),
@@ -206,6 +230,12 @@ def _reset_memoisation() -> None:
     import rattr
 
     clear_memoisation_caches(rattr)
+    forget_directory_listings()
+
+
+@pytest.fixture(scope="function", autouse=True)
+def _reset_diagnostics() -> None:
+    diagnostics.reset()
 
 
 @pytest.fixture(scope="function")
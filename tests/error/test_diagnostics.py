@@ -0,0 +1,289 @@
+from __future__ import annotations
+
+import ast
+import io
+import json
+from contextlib import redirect_stderr
+from pathlib import Path
+from typing import TYPE_CHECKING
+from unittest import mock
+
+import pytest
+
+from rattr import error
+from rattr.config import Config
+from rattr.config.state import enter_file, enter_target
+from rattr.error.diagnostics import (
+    FLUSH_EVERY,
+    Diagnostic,
+    Level,
+    diagnostics,
+    write_diagnostics,
+)
+
+if TYPE_CHECKING:
+    from tests.shared import ArgumentsFn
+
+
+def culprit(line: int, col: int = 4) -> ast.AST:
+    return ast.Name(id="x", lineno=line, col_offset=col)
+
+
+class TestDeduplication:
+    def test_identical_diagnostics_are_shown_once(self, capfd):
+        config = Config()
+
+        with enter_target(Path("target.py")), enter_file(Path("target.py")):
+            error.warning("the message", culprit(1))
+            error.warning("the message", culprit(1))
+            error.warning("the message", culprit(2))
+            error.warning("another message", culprit(1))
+
+            badness = config.state.badness
+
+        _, stderr = capfd.readouterr()
+
+        assert stderr.count("the message") == 2
+        assert stderr.count("another message") == 1
+
+        # The badness of the repeated diagnostic is still counted
+        assert badness == 4
+
+        assert diagnostics.repeated == 1
+        assert [d.count for d in diagnostics.records.values()] == [2, 1, 1]
+
+    def test_identical_diagnostics_are_shown_for_each_target(self, capfd):
+        for target in ("a.py", "b.py"):
+            with enter_target(Path(target)), enter_file(Path("shared.py")):
+                error.error("the message", culprit(1))
+                error.error("the message", culprit(1))
+
+        _, stderr = capfd.readouterr()
+
+        assert stderr.count("the message") == 2
+        assert diagnostics.repeated == 2
+        assert [d.count for d in diagnostics.records.values()] == [4]
+
+    def test_deferred(self, capfd):
+        deferred_stream = io.StringIO()
+        diagnostics.reset(deferred_stream=deferred_stream)
+
+        with redirect_stderr(deferred_stream):
+            error.error("the message", culprit(1))
+            error.error("the message", culprit(1))
+
+        _, stderr = capfd.readouterr()
+
+        assert stderr == ""
+        assert deferred_stream.getvalue() == ""
+        assert [(d.message, d.count) for d in diagnostics.deferred] == [
+            ("the message", 2)
+        ]
+
+    def test_replay(self, capfd):
+        from_worker = [
+            Diagnostic(Level.error, "the message", "module.py", 1, 4, count=3),
+            Diagnostic(Level.error, "another message", "module.py", 2, 4),
+        ]
+
+        with enter_target(Path("target.py")), enter_file(Path("module.py")):
+            error.error("the message", culprit(1))
+            diagnostics.replay(from_worker)
+
+        _, stderr = capfd.readouterr()
+
+        # The worker's diagnostics are deduplicated as though emitted here
+        assert stderr.count("the message") == 1
+        assert stderr.count("another message") == 1
+        assert diagnostics.repeated == 3
+        assert [d.count for d in diagnostics.records.values()] == [4, 1]
+
+    def test_capture(self, capfd):
+        with enter_target(Path("a.py")), enter_file(Path("shared.py")):
+            with diagnostics.capture() as captured:
+                error.error("the message", culprit(1))
+                error.error("the message", culprit(1))
+
+        # The repeated diagnostic is captured, s.t. it is counted when replayed
+        assert [(d.message, d.count) for d in captured] == [
+            ("the message", 1),
+            ("the message", 1),
+        ]
+
+        with enter_target(Path("b.py")), enter_file(Path("shared.py")):
+            diagnostics.replay(captured)
+
+        _, stderr = capfd.readouterr()
+
+        assert stderr.count("the message") == 2
+        assert diagnostics.repeated == 2
+        assert [d.count for d in diagnostics.records.values()] == [4]
+
+
+class TestLazyMessage:
+    def test_message_is_built_when_shown(self, capfd):
+        error.warning(lambda: "the message", culprit(1))
+
+        _, stderr = capfd.readouterr()
+
+        assert "the message" in stderr
+
+    def test_message_is_not_built_when_not_shown(
+        self,
+        capfd,
+        arguments: ArgumentsFn,
+    ):
+        message = mock.Mock(return_value="the message")
+        config = Config()
+
+        with arguments(_warning_level="none"), enter_target(Path("target.py")):
+            error.warning(message, culprit(1))
+            error.info(message, culprit(1))
+
+            badness = config.state.full_badness
+
+        _, stderr = capfd.readouterr()
+
+        assert stderr == ""
+        assert not message.called
+        assert badness == 1
+
+
+class TestBuffering:
+    @pytest.fixture(autouse=True)
+    def buffered(self):
+        diagnostics.reset(buffered=True)
+
+    def test_diagnostics_are_written_on_flush(self, capfd):
+        error.error("the message", culprit(1))
+
+        assert capfd.readouterr().err == ""
+
+        diagnostics.flush()
+
+        assert "the message" in capfd.readouterr().err
+
+    def test_diagnostics_are_written_in_batches(self, capfd):
+        for line in range(FLUSH_EVERY + 1):
+            error.error("the message", culprit(line))
+
+        assert capfd.readouterr().err.count("the message") == FLUSH_EVERY
+
+        diagnostics.flush()
+
+        assert capfd.readouterr().err.count("the message") == 1
+
+    def test_diagnostics_are_written_to_the_stream_at_the_time(self, capfd):
+        redirected = io.StringIO()
+
+        error.error("the first message", culprit(1))
+
+        with redirect_stderr(redirected):
+            error.error("the second message", culprit(2))
+            diagnostics.flush()
+
+        error.error("the third message", culprit(3))
+        diagnostics.flush()
+
+        stderr = capfd.readouterr().err
+
+        assert "the first message" in stderr
+        assert "the second message" in redirected.getvalue()
+        assert "the third message" in stderr
+
+        assert "the second message" not in stderr
+        assert stderr.index("the first message") < stderr.index("the third message")
+
+    def test_fatal_flushes(self, capfd):
+        error.error("the message", culprit(1))
+
+        with pytest.raises(SystemExit):
+            error.fatal("the fatal message", culprit(2))
+
+        stderr = capfd.readouterr().err
+
+        assert stderr.index("the message") < stderr.index("the fatal message")
+
+
+class TestWriteDiagnostics:
+    @pytest.fixture
+    def records(self) -> list[Diagnostic]:
+        return [
+            Diagnostic(Level.warning, "the message", "module.py", 3, 4, count=2),
+            Diagnostic(Level.info, "another message", "module.py", None, None),
+            Diagnostic(Level.rattr, "a rattr message", None, None, None),
+        ]
+
+    def test_json(self, tmp_path: Path, records: list[Diagnostic]):
+        file = tmp_path / "diagnostics.json"
+        write_diagnostics(file, records)
+
+        assert json.loads(file.read_text()) == {
+            "diagnostics": [
+                {
+                    "level": "warning",
+                    "message": "the message",
+                    "file": "module.py",
+                    "line": 3,
+                    "column": 4,
+                    "count": 2,
+                },
+                {
+                    "level": "info",
+                    "message": "another message",
+                    "file": "module.py",
+                    "line": None,
+                    "column": None,
+                    "count": 1,
+                },
+                {
+                    "level": "rattr",
+                    "message": "a rattr message",
+                    "file": None,
+                    "line": None,
+                    "column": None,
+                    "count": 1,
+                },
+            ]
+        }
+
+    def test_sarif(self, tmp_path: Path, records: list[Diagnostic]):
+        file = tmp_path / "diagnostics.sarif"
+        write_diagnostics(file, records)
+
+        sarif = json.loads(file.read_text())
+
+        assert sarif["version"] == "2.1.0"
+        assert sarif["runs"][0]["tool"]["driver"]["name"] == "rattr"
+        assert sarif["runs"][0]["results"] == [
+            {
+                "level": "warning",
+                "message": {"text": "the message"},
+                "occurrenceCount": 2,
+                "locations": [
+                    {
+                        "physicalLocation": {
+                            "artifactLocation": {"uri": "module.py"},
+                            "region": {"startLine": 3, "startColumn": 5},
+                        }
+                    }
+                ],
+            },
+            {
+                "level": "note",
+                "message": {"text": "another message"},
+                "occurrenceCount": 1,
+                "locations": [
+                    {
+                        "physicalLocation": {
+                            "artifactLocation": {"uri": "module.py"},
+                        }
+                    }
+                ],
+            },
+            {
+                "level": "note",
+                "message": {"text": "a rattr message"},
+                "occurrenceCount": 1,
+            },
+        ]
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import pstats
+from typing import TYPE_CHECKING
+
+import pytest
+
+from rattr.extra.profiling import PhaseProfiler, write_profiles
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def first_phase_function() -> int:
+    return sum(range(100))
+
+
+def second_phase_function() -> int:
+    return max(range(100))
+
+
+def functions_in(profile) -> set[str]:
+    stats = pstats.Stats(profile)
+    return {function for _, _, function in stats.stats}  # type: ignore[attr-defined]
+
+
+@pytest.fixture
+def profiler() -> PhaseProfiler:
+    return PhaseProfiler()
+
+
+def test_phase_is_not_profiled_when_not_profiling(profiler: PhaseProfiler):
+    with profiler.phase("first"):
+        first_phase_function()
+
+    assert not profiler.is_profiling
+    assert profiler.stop() == {}
+
+
+def test_phases_are_profiled_separately(profiler: PhaseProfiler):
+    profiler.start()
+
+    with profiler.phase("first"):
+        first_phase_function()
+
+    with profiler.phase("second"):
+        second_phase_function()
+
+    profiles = profiler.stop()
+
+    assert not profiler.is_profiling
+    assert list(profiles) == ["first", "second"]
+
+    assert "first_phase_function" in functions_in(profiles["first"])
+    assert "second_phase_function" not in functions_in(profiles["first"])
+
+    assert "second_phase_function" in functions_in(profiles["second"])
+    assert "first_phase_function" not in functions_in(profiles["second"])
+
+
+def test_phase_entered_again_is_added_to_the_profile(profiler: PhaseProfiler):
+    profiler.start()
+
+    with profiler.phase("first"):
+        first_phase_function()
+
+    with profiler.phase("first"):
+        second_phase_function()
+
+    profiles = profiler.stop()
+
+    assert list(profiles) == ["first"]
+    assert {"first_phase_function", "second_phase_function"} <= functions_in(
+        profiles["first"]
+    )
+
+
+def test_nested_phase_is_profiled_as_the_outer_phase(profiler: PhaseProfiler):
+    profiler.start()
+
+    with profiler.phase("outer"):
+        with profiler.phase("inner"):
+            first_phase_function()
+
+    profiles = profiler.stop()
+
+    assert list(profiles) == ["outer"]
+    assert "first_phase_function" in functions_in(profiles["outer"])
+
+
+def test_write_profiles(profiler: PhaseProfiler, tmp_path: Path):
+    profiler.start()
+
+    with profiler.phase("first"):
+        first_phase_function()
+
+    with profiler.phase("second"):
+        second_phase_function()
+
+    write_profiles(tmp_path / "profile", profiler.stop(), top=5)
+
+    assert sorted(p.name for p in (tmp_path / "profile").iterdir()) == [
+        "first.pstats",
+        "second.pstats",
+        "summary.txt",
+    ]
+
+    stats = pstats.Stats(str(tmp_path / "profile" / "first.pstats"))
+    assert "first_phase_function" in {f for _, _, f in stats.stats}  # type: ignore
+
+    summary = (tmp_path / "profile" / "summary.txt").read_text()
+
+    assert summary.index("first: ") < summary.index("second: ")
+    assert "Top 5 functions by own time" in summary
+    assert "Top 5 functions by cumulative time" in summary
+    assert "first_phase_function" in summary
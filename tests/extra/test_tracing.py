@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import json
+import os
+from typing import TYPE_CHECKING
+
+import pytest
+
+from rattr.extra.tracing import Tracer, write_trace
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture
+def tracer() -> Tracer:
+    return Tracer()
+
+
+def test_span_is_not_recorded_when_not_tracing(tracer: Tracer):
+    with tracer.span("name", "category"):
+        pass
+
+    assert not tracer.is_tracing
+    assert tracer.stop() == []
+
+
+def test_span(tracer: Tracer):
+    tracer.start()
+
+    with tracer.span("outer", "category", origin="module.py"):
+        with tracer.span("inner", "category"):
+            pass
+
+    inner, outer = tracer.stop()
+
+    assert not tracer.is_tracing
+
+    assert outer["name"] == "outer"
+    assert outer["cat"] == "category"
+    assert outer["ph"] == "X"
+    assert outer["pid"] == os.getpid()
+    assert outer["args"] == {"origin": "module.py"}
+
+    assert inner["name"] == "inner"
+    assert inner["args"] == {}
+
+    # The inner span is within the outer span
+    assert outer["ts"] <= inner["ts"]
+    assert inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"]
+
+
+def test_span_is_recorded_on_error(tracer: Tracer):
+    tracer.start()
+
+    with pytest.raises(ValueError), tracer.span("name", "category"):
+        raise ValueError
+
+    assert [event["name"] for event in tracer.stop()] == ["name"]
+
+
+def test_start_discards_previous_events(tracer: Tracer):
+    tracer.start()
+
+    with tracer.span("discarded", "category"):
+        pass
+
+    tracer.start()
+
+    assert tracer.stop() == []
+
+
+def test_extend(tracer: Tracer):
+    event = {"name": "name", "cat": "category", "ph": "X", "ts": 0, "dur": 0}
+
+    tracer.extend([event])
+    assert tracer.stop() == []
+
+    tracer.start()
+    tracer.extend([event])
+    assert tracer.stop() == [event]
+
+
+def test_write_trace(tracer: Tracer, tmp_path: Path):
+    trace_file = tmp_path / "trace" / "trace.json"
+
+    tracer.start()
+
+    with tracer.span("name", "category"):
+        pass
+
+    worker_event = {
+        "name": "name",
+        "cat": "category",
+        "ph": "X",
+        "ts": 0,
+        "dur": 0,
+        "pid": -1,
+        "tid": -1,
+        "args": {},
+    }
+    tracer.extend([worker_event])
+
+    events = tracer.stop()
+    write_trace(trace_file, events)
+
+    trace = json.loads(trace_file.read_text())
+
+    assert trace["displayTimeUnit"] == "ms"
+    assert trace["traceEvents"] == [
+        {
+            "name": "process_name",
+            "ph": "M",
+            "pid": -1,
+            "args": {"name": "rattr worker"},
+        },
+        {
+            "name": "process_name",
+            "ph": "M",
+            "pid": os.getpid(),
+            "args": {"name": "rattr"},
+        },
+        *events,
+    ]
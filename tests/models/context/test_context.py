@@ -308,3 +308,74 @@ def test_context_redefinition_in_child_scope():
 
     assert root.symbol_table._symbols == {"var_one": Name("var_one")}
     assert child.symbol_table._symbols == {}
+
+
+def test_context_copy_on_write():
+    root = Context(parent=None)
+    root.add([Name("a"), Name("b")])
+
+    child = Context(parent=root)
+    child.add(Name("c"))
+
+    copy = child.copy_on_write()
+
+    assert copy.file == child.file
+    assert list(copy) == list(child) == ["a", "b", "c"]
+
+    # Modifications, incl. of ancestors through the copy, are not shared
+    copy.add(Name("d"))
+    copy.remove("c")
+    del copy["a"]
+
+    assert list(copy) == ["b", "d"]
+    assert list(child) == ["a", "b", "c"]
+    assert list(root) == ["a", "b"]
+
+    # ... in either direction
+    child.add(Name("e"))
+    root.remove("b")
+
+    assert list(copy) == ["b", "d"]
+
+
+def test_context_lookup_sees_changes_to_ancestors():
+    root = Context(parent=None)
+    root.add(Name("a"))
+
+    child = Context(parent=root)
+    grandchild = Context(parent=child)
+    child.add(Name("b"))
+
+    assert list(grandchild) == ["a", "b"]
+
+    # Modified after the lookup, via the context and via the symbol table
+    root.add(Name("c"))
+    child.symbol_table.add(Name("d"))
+
+    assert "c" in grandchild
+    assert grandchild.get("d") == Name("d")
+    assert list(grandchild) == ["a", "c", "b", "d"]
+
+    # Deleted from an ancestor, via a descendant
+    del grandchild["a"]
+
+    assert "a" not in root
+    assert "a" not in child
+    assert grandchild.get("a") is None
+
+
+def test_context_lookup_with_shadowing():
+    root = Context(parent=None)
+    root.add(Name("a"))
+
+    child = Context(parent=root)
+    child.add(shadow := Func("a", interface=CallInterface()), is_argument=True)
+
+    assert child["a"] is shadow
+    assert len(child) == 1
+    assert child.all_names == {"a"}
+
+    # Removing the shadowing symbol reveals the symbol in the ancestor
+    child.remove("a")
+
+    assert child["a"] == Name("a")
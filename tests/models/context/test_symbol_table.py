@@ -139,3 +139,41 @@ class TestSymbolTablePop:
         symbol = after.pop("not_a_real_symbol")
         assert symbol is None
         assert before == after
+
+
+class TestSymbolTableCopyOnWrite:
+    def test_copy_shares_symbols(self, symbol_table: SymbolTable):
+        copy_ = symbol_table.copy_on_write()
+
+        assert copy_ == symbol_table
+        assert copy_._symbols is symbol_table._symbols
+
+    def test_modifying_the_copy(self, symbol_table: SymbolTable):
+        before = copy.deepcopy(symbol_table)
+        copy_ = symbol_table.copy_on_write()
+
+        copy_.add(Name("new"))
+        copy_.remove("x")
+        copy_.pop("y")
+
+        assert symbol_table == before
+        assert list(copy_.names) == ["var", "z", "my_func", "new"]
+
+    def test_modifying_the_original(self, symbol_table: SymbolTable):
+        copy_ = symbol_table.copy_on_write()
+        before = copy.deepcopy(copy_)
+
+        symbol_table.add(Name("new"))
+        symbol_table.remove("x")
+
+        assert copy_ == before
+        assert "new" in symbol_table
+        assert "x" not in symbol_table
+
+    def test_clear(self, symbol_table: SymbolTable):
+        copy_ = symbol_table.copy_on_write()
+
+        copy_.clear()
+
+        assert len(copy_) == 0
+        assert len(symbol_table) == 5
@@ -10,18 +10,23 @@ from unittest import mock
 import pytest
 
 from rattr.analyser.types import ImportIrs
-from rattr.config._types import FollowImports
-from rattr.models.ir import FileIr
+from rattr.config._types import CacheFormat, FollowImports
+from rattr.models.ir import FileIr, FunctionIr
 from rattr.models.results import CacheableResults, FileResults
+from rattr.models.results.cacheable import CacheableImportInfo
 from rattr.models.results.util import (
+    files_are_unchanged,
+    load_cached_file_ir,
     make_arguments_hash,
+    make_cacheable_file_ir,
     make_cacheable_import_info,
     make_cacheable_results,
     make_plugins_hash,
     target_cache_file_is_up_to_date,
+    write_cached_file_ir,
 )
-from rattr.models.symbol import Import, Location
-from rattr.models.util import serialise
+from rattr.models.symbol import CallInterface, Func, Import, Location, Name
+from rattr.models.util import hash_file_content, serialise, serialise_compact
 
 if TYPE_CHECKING:
     from collections.abc import Generator, Iterable
@@ -46,6 +51,7 @@ if TYPE_CHECKING:
             follow_imports: FollowImports = FollowImports.pip,
             excluded_imports: Iterable[str] = (),
             excluded_names: Iterable[str] = (),
+            cache_format: CacheFormat = CacheFormat.json,
         ) -> Mocked:
             ...
 
@@ -68,6 +74,7 @@ def mock_config():
         follow_imports: FollowImports = FollowImports.pip,
         excluded_imports: Iterable[str] = (),
         excluded_names: Iterable[str] = (),
+        cache_format: CacheFormat = CacheFormat.json,
     ) -> Generator[None]:
         with mock.patch("rattr.models.results.util.Config") as m_config:
             m_config.return_value = mock.Mock(
@@ -77,6 +84,7 @@ def mock_config():
                     follow_imports=follow_imports,
                     excluded_imports=set(excluded_imports),
                     excluded_names=set(excluded_names),
+                    cache_format=cache_format,
                 ),
             )
             yield
@@ -589,3 +597,183 @@ def test_target_cache_file_is_up_to_date_deserialisation_error():
         fp.write("blah")
         filename = fp.name
         assert not target_cache_file_is_up_to_date(Path("test.py"), filename)
+
+
+@pytest.mark.posix
+@mock.patch("rattr.models.results.util.isfile", lambda _: True)  # type: ignore[reportUnknownArgumentType]
+@pytest.mark.parametrize("compress", [False, True])
+def test_target_cache_file_is_up_to_date_compact(
+    mock_config: MakeConfigFn,
+    make_root_context: MakeRootContextFn,
+    tmp_path: Path,
+    compress: bool,
+):
+    with mock_config():
+        cache = make_cacheable_results(
+            FileResults(),
+            FileIr(context=make_root_context((), include_root_symbols=True)),
+            ImportIrs(),
+        )
+
+        cache_file = tmp_path / "cache.json"
+        serialised = serialise_compact(cache, compress=compress)
+
+        cache_file.write_bytes(serialised)
+        assert target_cache_file_is_up_to_date(cache.filepath, cache_file)
+
+        cache_file.write_bytes(serialised[: len(serialised) // 2])
+        assert not target_cache_file_is_up_to_date(cache.filepath, cache_file)
+
+
+@pytest.fixture()
+def old_file(tmp_path: Path) -> Path:
+    """Return a file last modified a minute ago."""
+    file = tmp_path / "old.py"
+    file.write_text("x = 1\n")
+
+    a_minute_ago = file.stat().st_mtime_ns - 60 * 10**9
+    os.utime(file, ns=(a_minute_ago, a_minute_ago))
+
+    return file
+
+
+def test_files_are_unchanged_by_stat_are_not_hashed(old_file: Path):
+    info = CacheableImportInfo.from_file(old_file)
+    now = old_file.stat().st_mtime_ns + 60 * 10**9
+
+    with mock.patch("rattr.models.results.util.hash_file_content") as hash:
+        assert files_are_unchanged([info] * 3, recorded_at_ns=now)
+
+    assert hash.call_count == 0
+
+
+def test_files_are_unchanged_touched_file(old_file: Path):
+    info = CacheableImportInfo.from_file(old_file)
+    now = old_file.stat().st_mtime_ns + 60 * 10**9
+
+    old_file.touch()
+    assert files_are_unchanged([info], recorded_at_ns=now)
+
+    old_file.write_text("x = 2\n")
+    assert not files_are_unchanged([info], recorded_at_ns=now)
+    assert not files_are_unchanged([info, info], recorded_at_ns=now)
+
+
+def test_files_are_unchanged_racily_modified_file(old_file: Path):
+    info = CacheableImportInfo.from_file(old_file)
+    mtime_ns = old_file.stat().st_mtime_ns
+
+    # Same size and modification time, as when changed within the timestamp resolution
+    old_file.write_text("x = 2\n")
+    os.utime(old_file, ns=(mtime_ns, mtime_ns))
+
+    # Recorded in the same tick as the file was modified, thus the stat is not trusted
+    assert not files_are_unchanged([info], recorded_at_ns=mtime_ns)
+
+
+def test_files_are_unchanged_without_stat(old_file: Path):
+    # i.e. a cache written by an older version
+    info = CacheableImportInfo(
+        filepath=old_file,
+        filehash=CacheableImportInfo.from_file(old_file).filehash,
+    )
+    now = old_file.stat().st_mtime_ns + 60 * 10**9
+
+    with mock.patch(
+        "rattr.models.results.util.hash_file_content",
+        side_effect=hash_file_content,
+    ) as hash:
+        assert files_are_unchanged([info], recorded_at_ns=now)
+
+    assert hash.call_count == 1
+
+
+@pytest.fixture()
+def import_cache(tmp_path: Path) -> Generator[Path, None, None]:
+    """Return a fake imported module, whose cache is in the temporary directory."""
+    origin = tmp_path / "module.py"
+    origin.write_text("def fn(a):\n    return a.b\n")
+
+    with mock.patch(
+        "rattr.models.results.util.get_import_cache_file",
+        lambda origin: tmp_path / "cache" / f"{Path(origin).stem}.json",
+    ):
+        yield origin
+
+
+@pytest.mark.parametrize("cache_format", list(CacheFormat))
+def test_load_cached_file_ir_round_trip(
+    mock_config: MakeConfigFn,
+    make_root_context: MakeRootContextFn,
+    import_cache: Path,
+    cache_format: CacheFormat,
+):
+    fn = Func(name="fn", interface=CallInterface(args=("a",)))
+    file_ir = FileIr(
+        context=make_root_context([fn], include_root_symbols=True),
+        file_ir={fn: FunctionIr.new(gets=[Name("a.b", "a")])},
+    )
+
+    with mock_config(cache_format=cache_format):
+        assert load_cached_file_ir(import_cache) is None
+
+        cache = make_cacheable_file_ir(import_cache, file_ir, lines=2)
+        write_cached_file_ir(import_cache, cache)
+
+        cached = load_cached_file_ir(import_cache)
+
+    assert cached is not None
+    assert cached.lines == 2
+    assert cached.ir == file_ir
+
+    # The cache is read regardless of the current format
+    with mock_config(cache_format=CacheFormat.json):
+        assert load_cached_file_ir(import_cache) == cached
+
+
+def test_load_cached_file_ir_is_invalidated(
+    mock_config: MakeConfigFn,
+    make_root_context: MakeRootContextFn,
+    import_cache: Path,
+):
+    starred = import_cache.parent / "starred.py"
+    starred.write_text("x = 1\n")
+
+    file_ir = FileIr(context=make_root_context((), include_root_symbols=True))
+
+    def write_cache() -> None:
+        cache = make_cacheable_file_ir(
+            import_cache,
+            file_ir,
+            lines=2,
+            dependencies=[starred],
+        )
+        write_cached_file_ir(import_cache, cache)
+
+    with mock_config():
+        write_cache()
+        assert load_cached_file_ir(import_cache) is not None
+
+        # The module itself is changed
+        import_cache.write_text("def fn(a):\n    return a.c\n")
+        assert load_cached_file_ir(import_cache) is None
+
+        # A dependency of the module is changed
+        write_cache()
+        starred.write_text("x = 2\n")
+        assert load_cached_file_ir(import_cache) is None
+
+    # The arguments are changed
+    with mock_config():
+        write_cache()
+    with mock_config(excluded_names=["fn"]):
+        assert load_cached_file_ir(import_cache) is None
+
+
+def test_load_cached_file_ir_is_malformed(mock_config: MakeConfigFn, import_cache):
+    cache_file = import_cache.parent / "cache" / "module.json"
+    cache_file.parent.mkdir()
+    cache_file.write_text('{"version": "blah"}')
+
+    with mock_config():
+        assert load_cached_file_ir(import_cache) is None
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import ast
+import gc
+from pathlib import Path
+
+from rattr.models.symbol import CallInterface, Name, intern_name, interned_name
+from rattr.models.symbol._intern import _interned_names
+from rattr.results import unbind_name
+
+
+def test_interned_name():
+    name = interned_name("a.b", "a")
+
+    assert name == Name("a.b", "a")
+    assert interned_name("a.b", "a") is name
+    assert interned_name("a.b") is name
+
+    assert interned_name("a.c", "a") is not name
+
+
+def test_interned_name_is_per_file(state):
+    name = interned_name("a.b", "a")
+
+    with state(current_file=Path("another.py")):
+        other = interned_name("a.b", "a")
+
+    assert other == name
+    assert other is not name
+    assert other.location.defined_in == Path("another.py")
+
+
+def test_interned_name_is_per_position():
+    lhs, rhs = ast.parse("a.b\na.b").body
+
+    name = interned_name("a.b", "a", token=lhs.value)
+
+    assert interned_name("a.b", "a", token=lhs.value) is name
+    assert interned_name("a.b", "a", token=rhs.value) is not name
+    assert interned_name("a.b", "a", token=rhs.value).location.lineno == 2
+    assert interned_name("a.b", "a") is not name
+
+
+def test_intern_name():
+    name = Name("c.d", "c")
+
+    assert intern_name(name) is name
+    assert intern_name(Name("c.d", "c")) is name
+    assert interned_name("c.d", "c") is name
+
+
+def test_intern_name_with_interface():
+    name = Name("fn", interface=CallInterface(args=("a",)))
+    assert intern_name(name) is name
+    assert intern_name(Name("fn", interface=CallInterface(args=("a",)))) is not name
+
+
+def test_interned_names_are_held_weakly():
+    name = interned_name("forgotten", "forgotten")
+    key = (name.location.defined_in, "forgotten", "forgotten", None)
+
+    assert key in _interned_names
+
+    del name
+    gc.collect()
+
+    assert key not in _interned_names
+
+
+def test_unbind_name_is_interned():
+    name = Name("e.f", "e")
+
+    assert unbind_name(name, "x") is unbind_name(Name("e.f", "e"), "x")
+    assert unbind_name(name, "x") == Name("x.f", "x")
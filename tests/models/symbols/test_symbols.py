@@ -4,6 +4,7 @@ import ast
 from importlib.util import find_spec
 from pathlib import Path
 
+import attrs
 import pytest
 
 from rattr.models.symbol import (
@@ -17,6 +18,7 @@ from rattr.models.symbol import (
     Class,
     Func,
     Import,
+    Location,
     Name,
     Symbol,
 )
@@ -122,6 +124,52 @@ class TestHasLocation:
         assert not symbol.has_location
 
 
+class TestLazyLocation:
+    def test_location_is_created_on_access(self, simple_name: Name, test_file: Path):
+        assert simple_name._location is None
+
+        location = simple_name.location
+
+        assert location.defined_in == test_file
+        assert simple_name.location is location
+
+    def test_location_is_in_the_file_of_creation(self, state, test_file: Path):
+        token = ast.parse("a = b").body[0]
+        name = Name("a", token=token)
+
+        with state(current_file=Path("another.py")):
+            location = name.location
+
+        assert location.defined_in == test_file
+        assert (location.lineno, location.col_offset) == (1, 0)
+
+    def test_explicit_location(self, state):
+        location = Location(lineno=4, col_offset=2, file=Path("explicit.py"))
+
+        with state(current_file=None):
+            assert Name("a", location=location).location is location
+
+    def test_evolve_keeps_the_location(self, simple_name: Name, test_file: Path):
+        evolved = attrs.evolve(simple_name, name="other")
+
+        assert evolved.location.defined_in == test_file
+
+    def test_release_token(self, test_file: Path):
+        token = ast.parse("\n\ncall(a)").body[0].value
+        target = Func("call", token=token.func, interface=CallInterface())
+        call = Call("call", token=token, target=target)
+
+        call.release_token()
+
+        assert call.token is None and call.target.token is None
+        assert call.location.lineno == call.target.location.lineno == 3
+        assert call.location.defined_in == test_file
+
+    def test_hash_is_cached(self, simple_name: Name):
+        assert simple_name._attrs_cached_hash is None
+        assert hash(simple_name) == simple_name._attrs_cached_hash
+
+
 class TestIsImport:
     @pytest.mark.parametrize("symbol_fixture", ["simple_import"])
     def test_is_import(self, symbol_fixture: str, request: pytest.FixtureRequest):
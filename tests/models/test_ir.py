@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import ast
 import copy
 from typing import TYPE_CHECKING
 
@@ -114,3 +115,19 @@ def test_equality_with_non_matching_context_and_non_matching_ir(
         file_ir=copy.deepcopy(underlying_file_ir_b),
     )
     assert lhs != rhs
+
+
+def test_release_tokens(make_root_context: MakeRootContextFn):
+    token = ast.parse("def fn(a):\n    return a.b").body[0]
+    fn = Func.from_fn_def(token)
+    name = Name("a.b", "a", token=token.body[0].value)
+
+    file_ir = FileIr(
+        context=make_root_context([fn], include_root_symbols=True),
+        file_ir={fn: FunctionIr.new(gets={name})},
+    )
+    file_ir.release_tokens()
+
+    assert fn.token is None and name.token is None
+    assert all(s.token is None for s in file_ir.context.symbol_table.symbols)
+    assert (fn.location.lineno, name.location.lineno) == (1, 2)
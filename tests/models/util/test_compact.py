@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import json
+import marshal
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from rattr.error.diagnostics import Diagnostic, Level
+from rattr.models.ir import FileIr, FunctionIr
+from rattr.models.results import FileResults, FunctionResults
+from rattr.models.results.cacheable import (
+    CacheableBadness,
+    CacheableFileIr,
+    CacheableImportInfo,
+)
+from rattr.models.symbol import Call, CallArguments, CallInterface, Func, Name
+from rattr.models.util import (
+    deserialise,
+    deserialise_unstructured,
+    serialise,
+    serialise_compact,
+)
+from rattr.models.util._compact import (
+    COMPACT_FORMAT_VERSION,
+    COMPACT_MAGIC,
+    CompactFormatError,
+    decode_compact,
+    encode_compact,
+    is_compact,
+)
+
+if TYPE_CHECKING:
+    from tests.shared import MakeRootContextFn
+
+
+@pytest.fixture
+def file_ir(make_root_context: MakeRootContextFn) -> FileIr:
+    fn = Func("fn", interface=CallInterface(args=("a",)))
+    other = Func("other", interface=CallInterface(args=("b", "c")))
+
+    return FileIr(
+        context=make_root_context([fn, other], include_root_symbols=True),
+        file_ir={
+            fn: FunctionIr.new(
+                gets={Name("a.b", "a"), Name("a.c", "a")},
+                calls={
+                    Call(
+                        name="other",
+                        args=CallArguments(args=("a", "a")),
+                        target=other,
+                    ),
+                },
+            ),
+            other: FunctionIr.new(sets={Name("b.b", "b")}, dels={Name("c")}),
+        },
+    )
+
+
+@pytest.fixture
+def cacheable_file_ir(file_ir: FileIr) -> CacheableFileIr:
+    return CacheableFileIr(
+        version="0.0.0",
+        arguments_hash="arguments",
+        plugins_hash="plugins",
+        filepath=Path("/some/module.py"),
+        filehash="filehash",
+        dependencies=[
+            CacheableImportInfo(filepath=Path("/some/starred.py"), filehash="hash"),
+        ],
+        lines=8,
+        ir=file_ir,
+        diagnostics=[
+            Diagnostic(Level.error, "'undefined_fn' potentially undefined", None, 3, 4),
+        ],
+        badness=CacheableBadness(badness_from_imports=1),
+    )
+
+
+@pytest.mark.parametrize(
+    "unstructured",
+    [
+        {},
+        [],
+        {"a": [1, 2.5, None, True], "b": {"c": "d"}},
+        ["repeated"] * 8,
+    ],
+)
+@pytest.mark.parametrize("compress", [False, True])
+def test_encode_compact_round_trip(unstructured, compress: bool):
+    encoded = encode_compact(unstructured, compress=compress)
+
+    assert is_compact(encoded)
+    assert decode_compact(encoded) == unstructured
+
+
+def test_encode_compact_shares_repeated_strings():
+    names = [f"symbol_{i}.attribute" for i in range(64)]
+
+    # Copies, s.t. the strings are equal but are not the same object
+    encoded = encode_compact(
+        {f"fn_{i}": {"gets": [n.encode().decode() for n in names]} for i in range(8)}
+    )
+
+    # Each repeat is a reference into marshal's table, not a copy of the string
+    assert all(encoded.count(name.encode()) == 1 for name in names)
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_serialise_compact_file_ir(cacheable_file_ir: CacheableFileIr, compress):
+    serialised = serialise_compact(cacheable_file_ir, compress=compress)
+
+    assert is_compact(serialised)
+    assert deserialise(serialised, type=CacheableFileIr) == cacheable_file_ir
+    assert deserialise_unstructured(serialised) == json.loads(
+        serialise(cacheable_file_ir)
+    )
+
+
+def test_serialise_compact_is_smaller_than_json(cacheable_file_ir: CacheableFileIr):
+    as_json = serialise(cacheable_file_ir).encode("utf-8")
+
+    assert len(serialise_compact(cacheable_file_ir)) < len(as_json)
+    assert len(serialise_compact(cacheable_file_ir, compress=True)) < len(as_json)
+
+
+def test_serialise_compact_file_results():
+    results = FileResults(
+        {
+            "fn": FunctionResults.new(gets={"a", "a.b"}, calls={"other"}),
+            "other": FunctionResults.the_empty_results(),
+        }
+    )
+
+    assert deserialise(serialise_compact(results), type=FileResults) == results
+
+
+def test_deserialise_detects_the_format(cacheable_file_ir: CacheableFileIr):
+    as_json = serialise(cacheable_file_ir)
+
+    assert not is_compact(as_json)
+    assert not is_compact(as_json.encode("utf-8"))
+
+    assert deserialise(as_json, type=CacheableFileIr) == cacheable_file_ir
+    assert deserialise(as_json.encode("utf-8"), type=CacheableFileIr) == (
+        cacheable_file_ir
+    )
+
+
+@pytest.mark.parametrize(
+    "serialised",
+    [
+        b"",
+        b"{}",
+        COMPACT_MAGIC,
+        COMPACT_MAGIC + bytes((COMPACT_FORMAT_VERSION + 1, marshal.version, 0)),
+        COMPACT_MAGIC + bytes((COMPACT_FORMAT_VERSION, marshal.version + 1, 0)),
+        COMPACT_MAGIC + bytes((COMPACT_FORMAT_VERSION, marshal.version, 255)),
+        COMPACT_MAGIC + bytes((COMPACT_FORMAT_VERSION, marshal.version, 0)),
+        COMPACT_MAGIC + bytes((COMPACT_FORMAT_VERSION, marshal.version, 1)) + b"xx",
+        encode_compact({"a": "b"})[:-2],
+    ],
+)
+def test_decode_compact_malformed(serialised: bytes):
+    with pytest.raises(CompactFormatError):
+        decode_compact(serialised)
+
+    # i.e. is caught as is a JSON decoding error
+    if is_compact(serialised):
+        with pytest.raises(ValueError):
+            deserialise_unstructured(serialised)
@@ -1,10 +1,16 @@
 from __future__ import annotations
 
 import importlib.util
+import os
 from typing import TYPE_CHECKING
+from unittest import mock
 
 import pytest
 
+from rattr.module_locator._locate import (
+    find_module_in_path,
+    rescan_changed_directories,
+)
 from rattr.module_locator.models import ModuleSpec
 from rattr.module_locator.util import (
     derive_module_names_left,
@@ -19,6 +25,7 @@ from rattr.module_locator.util import (
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
+    from pathlib import Path
     from typing import Final
 
     from tests.shared import ArgumentsFn
@@ -238,6 +245,22 @@ def test_is_in_stdlib_known_stdlib_modules(stdlib_modules: Iterable[str]):
         assert is_in_stdlib(modulename)
 
 
+@pytest.mark.parametrize(
+    "modulename",
+    [
+        "__future__",
+        "_thread",
+        "_collections_abc.Mapping",
+        # Not in `sys.stdlib_module_names`
+        "test.support",
+        "distutils.core",
+        "telnetlib",
+    ],
+)
+def test_is_in_stdlib_special_cases(modulename: str):
+    assert is_in_stdlib(modulename)
+
+
 @pytest.mark.parametrize(
     "modulename, expected",
     testcases := [
@@ -323,3 +346,88 @@ def test_is_in_import_blacklist_from_cli_argument(
             assert is_in_import_blacklist(banned_module)
         for unbanned_module in sorted(unbanned):
             assert not is_in_import_blacklist(unbanned_module)
+
+
+@pytest.fixture
+def python_path(tmp_path: Path) -> Path:
+    (tmp_path / "package" / "sub").mkdir(parents=True)
+    (tmp_path / "package" / "__init__.py").write_text("")
+    (tmp_path / "package" / "module.py").write_text("")
+    (tmp_path / "package" / "sub" / "__init__.py").write_text("")
+    (tmp_path / "namespace").mkdir()
+    (tmp_path / "namespace" / "module.py").write_text("")
+    (tmp_path / "shadowed").mkdir()
+    (tmp_path / "shadowed.py").write_text("")
+    (tmp_path / "top.py").write_text("")
+
+    return tmp_path
+
+
+@pytest.mark.parametrize(
+    "modulename,expected",
+    [
+        ("", None),
+        ("top", "top.py"),
+        ("package", "package/__init__.py"),
+        ("package.module", "package/module.py"),
+        ("package.sub", "package/sub/__init__.py"),
+        ("package.nope", None),
+        ("namespace", None),
+        ("namespace.module", "namespace/module.py"),
+        # The directory takes precedence, even without an `__init__.py`
+        ("shadowed", None),
+        ("top.nope", None),
+        ("nope", None),
+    ],
+)
+def test_find_module_in_path(python_path: Path, modulename: str, expected: str):
+    location = find_module_in_path(python_path, modulename)
+
+    if expected is None:
+        assert location is None
+    else:
+        assert location == python_path.resolve() / expected
+
+
+def test_find_module_in_path_scans_each_directory_once(python_path: Path):
+    with mock.patch(
+        "rattr.module_locator._locate.os.scandir",
+        side_effect=os.scandir,
+    ) as scandir:
+        for _ in range(3):
+            find_module_in_path(python_path, "package.module")
+            find_module_in_path(python_path, "package.sub")
+            find_module_in_path(python_path, "top")
+
+    assert scandir.call_count == 3
+
+
+def test_rescan_changed_directories(python_path: Path, monkeypatch: pytest.MonkeyPatch):
+    # The directories were only just created, trust their mtime regardless
+    monkeypatch.setattr("rattr.module_locator._locate.RACY_LISTING_NS", 0)
+
+    assert find_module_in_path(python_path, "package.late") is None
+
+    # A file which is only modified does not change the directory
+    (python_path / "package" / "module.py").write_text("x = 1\n")
+
+    assert not rescan_changed_directories()
+
+    (python_path / "package" / "late.py").write_text("")
+    os.utime(python_path / "package", ns=(0, 1))
+
+    assert rescan_changed_directories()
+    assert not rescan_changed_directories()
+    assert find_module_in_path(python_path, "package.late") is not None
+
+
+def test_rescan_recently_modified_directories(python_path: Path):
+    assert find_module_in_path(python_path, "late") is None
+
+    # i.e. the file was created in the same (coarse) mtime tick as the scan
+    stat = python_path.stat()
+    (python_path / "late.py").write_text("")
+    os.utime(python_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    assert rescan_changed_directories()
+    assert find_module_in_path(python_path, "late") is not None
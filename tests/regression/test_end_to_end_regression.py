@@ -10,7 +10,7 @@ import pytest
 
 from rattr.analyser.file import parse_and_analyse_file
 from rattr.cli import parse_arguments
-from rattr.config import Config
+from rattr.config import Config, ResultsEngine
 from rattr.models.util import OutputIrs, deserialise, serialise, serialise_irs
 from rattr.results import generate_results_from_ir
 from tests.regression.shared import (
@@ -39,9 +39,11 @@ if TYPE_CHECKING:
     zip(code_files, results_files),
     ids=[str(f.relative_to(code_dir)) for f in code_files],
 )
+@pytest.mark.parametrize("engine", list(ResultsEngine), ids=str)
 def test_run_e2e_regression_tests_for_results(
     code_file: Path,
     results_file: Path,
+    engine: ResultsEngine,
 ):
     # TODO
     #   Make this more end-to-end-y (that is, use `main(...))
@@ -66,7 +68,11 @@ def test_run_e2e_regression_tests_for_results(
 
     # Equivalent to main function
     file_ir, import_irs, _ = parse_and_analyse_file()
-    actual_results = generate_results_from_ir(target_ir=file_ir, import_irs=import_irs)
+    actual_results = generate_results_from_ir(
+        target_ir=file_ir,
+        import_irs=import_irs,
+        engine=engine,
+    )
 
     if not actual_results:
         pytest.skip(f"no results for {code_file}")
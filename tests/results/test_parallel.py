@@ -0,0 +1,278 @@
+from __future__ import annotations
+
+import copy
+import os
+from typing import TYPE_CHECKING
+from unittest import mock
+
+import pytest
+
+from rattr.analyser.file import parse_and_analyse_file
+from rattr.config import Config, State
+from rattr.config.state import enter_target
+from rattr.error.diagnostics import diagnostics
+from rattr.extra.tracing import tracer
+from rattr.results import IrEnvironment, IrTarget, generate_results_from_ir
+from rattr.results._parallel import (
+    CHUNKS_PER_JOB,
+    _chunks,
+    _initialise_worker,
+    _replay,
+    _results_in_main,
+    _results_in_worker,
+    index_environment,
+    iter_results_from_ir_in_parallel,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from tests.shared import ArgumentsFn
+
+
+@pytest.fixture
+def target(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    (tmp_path / "helpers.py").write_text(
+        "def shared(x):\n"
+        "    x.shared = True\n"
+        "    return leaf(x)\n"
+        "\n"
+        "def leaf(y):\n"
+        "    return y.leaf\n"
+    )
+
+    functions = [
+        "from helpers import shared\n",
+        # Mutual recursion, the results depend upon the order of simplification
+        "def ping(a, n):\n    a.ping = n\n    return pong(a.inner, n)\n",
+        "def pong(b, n):\n"
+        "    del b.pong\n"
+        "    return ping(b, n) + undefined_fn(b)\n",
+        # The same call made by more than one function in the call tree
+        "def caller(c):\n    return middle(c) + shared(c)\n",
+        "def middle(d):\n    return shared(d.attr)\n",
+        # An error when simplifying, i.e. in `construct_call_swaps`
+        "def too_many(e):\n    return middle(e, e.other)\n",
+    ]
+    calls = ["caller(arg) + shared(arg)", "ping(arg, 1)", "middle(arg)"]
+    functions += [
+        f"def fn_{i}(arg):\n"
+        f"    arg.set_{i} = arg.get_{i}\n"
+        f"    return {calls[i % len(calls)]}\n"
+        for i in range(12)
+    ]
+
+    (tmp_path / "target.py").write_text("\n".join(functions))
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(
+        "rattr.module_locator._locate.derive_working_dir",
+        lambda: str(tmp_path),
+    )
+
+    return tmp_path / "target.py"
+
+
+def generate(target: Path, *, jobs: int):
+    config = Config()
+
+    with enter_target(target):
+        file_ir, import_irs, _ = parse_and_analyse_file()
+
+        if jobs == 1:
+            results = generate_results_from_ir(
+                target_ir=file_ir,
+                import_irs=import_irs,
+                jobs=1,
+            )
+        else:
+            results = dict(
+                iter_results_from_ir_in_parallel(
+                    target_ir=file_ir,
+                    import_irs=import_irs,
+                    jobs=jobs,
+                )
+            )
+
+        state = State(
+            badness_from_target_file=config.state.badness_from_target_file,
+            badness_from_imports=config.state.badness_from_imports,
+            badness_from_simplification=config.state.badness_from_simplification,
+        )
+
+    return dict(results), file_ir, import_irs, state
+
+
+@pytest.mark.parametrize("jobs", [2, 3])
+@pytest.mark.parametrize("chunks_per_job", [CHUNKS_PER_JOB, 100])
+def test_parallel_is_equivalent_to_sequential(
+    target: Path,
+    capfd,
+    jobs: int,
+    chunks_per_job: int,
+):
+    sequential = generate(target, jobs=1)
+    _, sequential_stderr = capfd.readouterr()
+
+    # NB: Given one function per chunk, the workers do not simplify every function
+    # before each function
+    with mock.patch("rattr.results._parallel.CHUNKS_PER_JOB", chunks_per_job):
+        parallel = generate(target, jobs=jobs)
+    _, parallel_stderr = capfd.readouterr()
+
+    sequential_results, sequential_ir, sequential_irs, sequential_state = sequential
+    parallel_results, parallel_ir, parallel_irs, parallel_state = parallel
+
+    assert parallel_results == sequential_results
+    assert list(parallel_results) == list(sequential_results)
+    assert parallel_state == sequential_state
+
+    # The IR is simplified in place, as without --jobs
+    assert parallel_ir == sequential_ir
+    assert parallel_irs == sequential_irs
+
+    assert "received too many positional arguments" in sequential_stderr
+    assert parallel_stderr == sequential_stderr
+
+
+def test_diagnostics_are_equivalent(target: Path):
+    records = {}
+
+    for jobs in (1, 2):
+        diagnostics.reset()
+        generate(target, jobs=jobs)
+
+        records[jobs] = list(diagnostics.records.values())
+
+    assert records[2] == records[1]
+
+
+def test_parallel_fatal_error(target: Path, arguments: ArgumentsFn, capfd):
+    stderr = {}
+
+    for jobs in (1, 2):
+        with arguments(is_strict=True), pytest.raises(SystemExit):
+            generate(target, jobs=jobs)
+
+        _, stderr[jobs] = capfd.readouterr()
+
+    assert "received too many positional arguments" in stderr[1]
+    assert stderr[2] == stderr[1]
+
+
+def test_trace(target: Path, arguments: ArgumentsFn):
+    with arguments(trace=target.parent / "trace.json"):
+        tracer.start()
+
+        try:
+            results, *_ = generate(target, jobs=2)
+        finally:
+            events = tracer.stop()
+
+    functions = [e for e in events if e["cat"] == "results"]
+
+    assert {e["name"] for e in functions} == set(results)
+    assert any(e["pid"] != os.getpid() for e in functions)
+
+
+@pytest.mark.parametrize(
+    "number_of_functions, expected",
+    [
+        (0, []),
+        (3, [(0, 1), (1, 2), (2, 3)]),
+        (8, [(0, 2), (2, 4), (4, 6), (6, 8)]),
+        (9, [(0, 3), (3, 6), (6, 9)]),
+    ],
+)
+def test_chunks(number_of_functions: int, expected: list[tuple[int, int]]):
+    assert _chunks(number_of_functions, 4) == expected
+
+
+class TestGenerateResultsFromIr:
+    @pytest.fixture
+    def iter_in_parallel(self) -> mock.Mock:
+        with mock.patch(
+            "rattr.results._parallel.iter_results_from_ir_in_parallel",
+            return_value=iter([]),
+        ) as iter_in_parallel:
+            yield iter_in_parallel
+
+    def test_jobs(self, target: Path, iter_in_parallel: mock.Mock):
+        with mock.patch("rattr.results.util.PARALLEL_MIN_FUNCTIONS", 1):
+            generate(target, jobs=1)
+            assert not iter_in_parallel.called
+
+            with enter_target(target):
+                file_ir, import_irs, _ = parse_and_analyse_file()
+                generate_results_from_ir(
+                    target_ir=file_ir,
+                    import_irs=import_irs,
+                    jobs=2,
+                )
+
+            assert iter_in_parallel.called
+
+    def test_too_few_functions(self, target: Path, iter_in_parallel: mock.Mock):
+        with enter_target(target):
+            file_ir, import_irs, _ = parse_and_analyse_file()
+            results = generate_results_from_ir(
+                target_ir=file_ir,
+                import_irs=import_irs,
+                jobs=2,
+            )
+
+        assert not iter_in_parallel.called
+        assert len(results) == len(file_ir)
+
+
+def test_order_dependent_functions_are_simplified_in_the_main_process(
+    target: Path,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    config = Config()
+
+    monkeypatch.setattr("rattr.results._parallel._worker", None)
+
+    with enter_target(target):
+        file_ir, import_irs, _ = parse_and_analyse_file()
+
+        _initialise_worker(config.arguments, None, IrEnvironment(file_ir, import_irs))
+        outcomes = dict(zip(file_ir.keys(), _results_in_worker(0, len(file_ir))))
+
+    left_to_main = {
+        function.name for function, outcome in outcomes.items() if outcome is None
+    }
+
+    # Given recursion, or the call to `leaf` made by each `shared` in the call tree
+    assert {"ping", "pong", "caller", "fn_0", "fn_1"} <= left_to_main
+    assert {"middle", "too_many", "fn_2", "fn_5"}.isdisjoint(left_to_main)
+
+
+def test_changes_are_those_of_the_main_process(
+    target: Path,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    config = Config()
+
+    monkeypatch.setattr("rattr.results._parallel._worker", None)
+
+    with enter_target(target):
+        file_ir, import_irs, _ = parse_and_analyse_file()
+
+        environment = IrEnvironment(file_ir, import_irs)
+        in_main = copy.deepcopy(environment)
+
+        _initialise_worker(config.arguments, None, copy.deepcopy(environment))
+        (outcome,) = _results_in_worker(3, 4)
+
+        results = _replay(outcome, list(index_environment(environment).values()))
+
+        middle = list(in_main.target_ir.items())[3]
+        expected = _results_in_main(IrTarget(*middle), in_main)
+
+    assert middle[0].name == "middle"
+    assert outcome.changes
+
+    assert results == expected
+    assert environment == in_main
@@ -0,0 +1,291 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest import mock
+
+import pytest
+
+from rattr.analyser.file import FileAnalyser
+from rattr.config import ResultsEngine
+from rattr.results import (
+    IrCallGraph,
+    IrEnvironment,
+    IrTarget,
+    generate_results_from_ir,
+    iter_results_from_ir,
+    strongly_connected_components,
+    unbind_ir_with_call_swaps,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from rattr.models.ir import FileIr
+    from rattr.models.results import FileResults
+
+
+@pytest.fixture
+def analyse(parse_with_context) -> Callable[[str], FileIr]:
+    def _inner(source: str) -> FileIr:
+        ast_module, context = parse_with_context(source)
+        return FileAnalyser(ast_module, context).analyse()
+
+    return _inner
+
+
+@pytest.fixture
+def results_by_engine(
+    analyse: Callable[[str], FileIr],
+) -> Callable[[str], dict[ResultsEngine, FileResults]]:
+    # The IR is simplified in place, thus each engine is given a fresh analysis
+    def _inner(source: str) -> dict[ResultsEngine, FileResults]:
+        return {
+            engine: generate_results_from_ir(
+                target_ir=analyse(source),
+                import_irs={},
+                engine=engine,
+            )
+            for engine in ResultsEngine
+        }
+
+    return _inner
+
+
+def test_strongly_connected_components(analyse: Callable[[str], FileIr]):
+    file_ir = analyse(
+        """
+        def a(x):
+            return b(x)
+
+        def b(x):
+            return c(x) + d(x)
+
+        def c(x):
+            return x.c
+
+        def d(x):
+            return b(x.d)
+        """
+    )
+
+    graph = IrCallGraph(IrEnvironment(target_ir=file_ir, import_irs={}))
+    roots = [graph.add(IrTarget(symbol=s, ir=ir)) for s, ir in file_ir.items()]
+
+    components = [
+        sorted(graph.targets[node].symbol.name for node in component)
+        for component in strongly_connected_components(graph, roots)
+    ]
+
+    assert components == [["c"], ["b", "d"], ["a"]]
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        pytest.param(
+            """
+            def leaf(p):
+                p.leaf = p.other
+
+            def mid(q, r):
+                return leaf(q) + leaf(r.attr)
+
+            def fn(a):
+                return mid(a, a.b) + mid(a.c, a)
+            """,
+            id="acyclic",
+        ),
+        pytest.param(
+            """
+            def fn(node):
+                if node.left:
+                    return fn(node.left)
+                return node.value
+            """,
+            id="direct-recursion",
+        ),
+        pytest.param(
+            """
+            def names_of(node):
+                if node.kind:
+                    return call_name(node.func)
+                return compound_name(node.value)
+
+            def call_name(node):
+                return names_of(node.inner) + helper(node)
+
+            def compound_name(name):
+                return names_of(name.attr)
+
+            def helper(target):
+                return target.name
+
+            def entry(x):
+                return names_of(x) + compound_name(x.y)
+            """,
+            id="indirect-recursion",
+        ),
+        pytest.param(
+            """
+            def fn(x, y):
+                return left(x, y) + right(y, x)
+
+            def left(a, b):
+                return mid(a)
+
+            def right(a, b):
+                return mid(a)
+
+            def mid(q):
+                return q.attr
+
+            def other(z):
+                return left(z, z) + mid(z)
+            """,
+            id="same-call-in-siblings",
+        ),
+        pytest.param(
+            """
+            def right(a, b):
+                return mid(a)
+
+            def fn(x, y):
+                return left(x, y) + right(y, x)
+
+            def left(a, b):
+                return mid(a)
+
+            def mid(q):
+                return q.attr
+            """,
+            id="same-call-in-siblings-simplified-before",
+        ),
+        pytest.param(
+            """
+            def fn(a):
+                return outer(a.attr) + inner(a)
+
+            def outer(a):
+                return inner(a)
+
+            def inner(b):
+                b.set = b.get
+            """,
+            id="same-call-in-caller-and-callee",
+        ),
+        pytest.param(
+            """
+            def entry(n):
+                return first(n) + second(n.next)
+
+            def first(m):
+                return walk(m) + leaf(m)
+
+            def second(m):
+                return leaf(m)
+
+            def walk(node):
+                return walk(node.next) + leaf(node)
+
+            def leaf(p):
+                p.leaf = p.other
+            """,
+            id="same-call-in-recursion",
+        ),
+    ],
+)
+def test_engines_give_the_same_results(results_by_engine, source: str):
+    results = results_by_engine(source)
+
+    assert results[ResultsEngine.scc] == results[ResultsEngine.tree]
+
+
+def test_identical_call_in_multiple_callers(results_by_engine):
+    # `mid(a)` is the same call in both `left` and `right`, the call tree engine expands
+    # it only once per call tree and so `fn` depends upon the order of the functions
+    results = results_by_engine(
+        """
+        def fn(x, y):
+            return left(x, y) + right(y, x)
+
+        def left(a, b):
+            return mid(a)
+
+        def right(a, b):
+            return mid(a)
+
+        def mid(q):
+            return q.attr
+        """
+    )
+
+    assert "y.attr" not in results[ResultsEngine.tree]["fn"]["gets"]
+    assert results[ResultsEngine.scc] == results[ResultsEngine.tree]
+
+
+def test_summaries_are_used_for_whole_call_trees(
+    analyse: Callable[[str], FileIr],
+    monkeypatch: pytest.MonkeyPatch,
+):
+    source = """
+        def fn(a):
+            return outer(a.attr) + other(a)
+
+        def outer(b):
+            return inner(b)
+
+        def inner(c):
+            c.set = c.get
+
+        def other(d):
+            return inner(d.x) + inner(d)
+        """
+
+    unbind = mock.Mock(side_effect=unbind_ir_with_call_swaps)
+    monkeypatch.setattr("rattr.results._scc.unbind_ir_with_call_swaps", unbind)
+
+    results = generate_results_from_ir(
+        target_ir=analyse(source),
+        import_irs={},
+        engine=ResultsEngine.scc,
+    )
+
+    # Each call is bound once, i.e. `inner` is not simplified again for `outer` and
+    # `other`, nor are `outer` and `other` for `fn`
+    assert unbind.call_count == 5
+    assert results == generate_results_from_ir(
+        target_ir=analyse(source),
+        import_irs={},
+        engine=ResultsEngine.tree,
+    )
+
+
+@pytest.mark.parametrize("engine", list(ResultsEngine), ids=str)
+def test_iter_results_from_ir(analyse: Callable[[str], FileIr], engine: ResultsEngine):
+    source = """
+        def fn(a):
+            return helper(a.b)
+
+        def helper(x):
+            return x.c
+
+        def recursive(node):
+            return recursive(node.next)
+        """
+
+    expected = generate_results_from_ir(
+        target_ir=analyse(source),
+        import_irs={},
+        engine=engine,
+    )
+    results = iter_results_from_ir(
+        target_ir=analyse(source),
+        import_irs={},
+        engine=engine,
+    )
+
+    function, function_results = next(results)
+
+    assert function == "fn"
+    assert function_results == expected["fn"]
+    assert [function for function, _ in results] == ["helper", "recursive"]
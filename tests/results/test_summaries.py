@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+from unittest import mock
+
+import pytest
+
+from rattr.analyser.file import parse_and_analyse_file
+from rattr.config import ResultsEngine
+from rattr.config.state import enter_target
+from rattr.results import (
+    FunctionSummaries,
+    generate_results_from_ir,
+    unbind_ir_with_call_swaps,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from rattr.models.results import FileResults
+
+
+@pytest.fixture(autouse=True)
+def __set_current_file() -> Iterator[None]:
+    # Overrides `tests/results/conftest.py`, each target sets its own current file
+    yield
+
+
+@pytest.fixture
+def project(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    (tmp_path / "lib.py").write_text(
+        "from util import helper\n"
+        "\n"
+        "def compute_metric(a, b):\n"
+        "    a.total = helper(b)\n"
+        "    return a\n"
+        "\n"
+        "def recursive(node):\n"
+        "    return recursive(node.next)\n"
+    )
+    (tmp_path / "util.py").write_text(
+        "def helper(x):\n    return x.numerator / x.denominator\n"
+    )
+    (tmp_path / "first.py").write_text(
+        "from lib import compute_metric, recursive\n"
+        "\n"
+        "def first(p, q):\n"
+        "    return compute_metric(p, q) + recursive(q)\n"
+    )
+    (tmp_path / "second.py").write_text(
+        "import lib\n"
+        "\n"
+        "def second(r):\n"
+        "    return lib.compute_metric(r.out, r)\n"
+    )
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(
+        "rattr.module_locator._locate.derive_working_dir",
+        lambda: str(tmp_path),
+    )
+
+    with mock.patch(
+        "rattr.models.results.util.get_summaries_cache_file",
+        lambda origin: tmp_path / "cache" / f"{Path(origin).stem}.json",
+    ):
+        yield tmp_path
+
+
+def results_for(
+    target: Path,
+    summaries: FunctionSummaries | None = None,
+) -> FileResults:
+    with enter_target(target):
+        file_ir, import_irs, _ = parse_and_analyse_file()
+        return generate_results_from_ir(
+            target_ir=file_ir,
+            import_irs=import_irs,
+            engine=ResultsEngine.scc,
+            summaries=summaries,
+        )
+
+
+def test_summaries_are_shared_between_targets(project: Path):
+    summaries = FunctionSummaries()
+
+    first = results_for(project / "first.py", summaries)
+
+    # The recursive function is not cached
+    assert {name for (_, _, name) in summaries._summaries} == {
+        "compute_metric",
+        "helper",
+    }
+
+    with mock.patch.object(
+        FunctionSummaries,
+        "get",
+        autospec=True,
+        side_effect=FunctionSummaries.get,
+    ) as get:
+        second = results_for(project / "second.py", summaries)
+
+    assert get.call_count == 1
+
+    assert first == results_for(project / "first.py")
+    assert second == results_for(project / "second.py")
+    assert second["second"]["gets"] == {
+        "r",
+        "r.denominator",
+        "r.numerator",
+        "r.out",
+    }
+    assert second["second"]["sets"] == {"r.out.total"}
+
+
+def test_summaries_are_persisted(project: Path):
+    summaries = FunctionSummaries(persist=True)
+    expected = results_for(project / "second.py", summaries)
+    summaries.flush()
+
+    assert sorted(p.name for p in (project / "cache").iterdir()) == [
+        "lib.json",
+        "util.json",
+    ]
+
+    summaries = FunctionSummaries(persist=True)
+    lib = (project / "lib.py").resolve()
+
+    assert summaries.get(lib, "compute_metric") is not None
+    assert results_for(project / "second.py", summaries) == expected
+
+
+def test_summaries_are_invalidated_by_dependencies(project: Path):
+    summaries = FunctionSummaries(persist=True)
+    results_for(project / "second.py", summaries)
+    summaries.flush()
+
+    (project / "util.py").write_text("def helper(x):\n    return x.changed\n")
+
+    summaries = FunctionSummaries(persist=True)
+    lib = (project / "lib.py").resolve()
+
+    assert summaries.get(lib, "compute_metric") is None
+    assert results_for(project / "second.py", summaries)["second"]["gets"] == {
+        "r",
+        "r.changed",
+        "r.out",
+    }
+
+
+@pytest.fixture
+def shadowed(project: Path) -> Path:
+    (project / "classes.py").write_text(
+        "class Foo:\n"
+        "    def __init__(self, a):\n"
+        "        a.lib_attr = 1\n"
+        "\n"
+        "def make(x):\n"
+        "    return Foo(x)\n"
+    )
+    (project / "t1.py").write_text(
+        "from classes import make\n\ndef f1(p):\n    return make(p)\n"
+    )
+    (project / "t2.py").write_text(
+        "from classes import make\n"
+        "\n"
+        "class Foo:\n"
+        "    def __init__(self, a):\n"
+        "        a.target_attr = 1\n"
+        "\n"
+        "def f2(p):\n"
+        "    return make(p)\n"
+    )
+
+    return project
+
+
+def test_summaries_of_shadowed_classes_are_not_shared(shadowed: Path):
+    summaries = FunctionSummaries()
+
+    # `Foo` is resolved by name, preferring the class in the target
+    assert results_for(shadowed / "t1.py", summaries)["f1"]["sets"] == {"p.lib_attr"}
+    assert results_for(shadowed / "t2.py", summaries)["f2"]["sets"] == {"p.target_attr"}
+
+    assert results_for(shadowed / "t2.py", summaries) == results_for(shadowed / "t2.py")
+
+
+def test_summaries_of_shadowed_classes_are_not_persisted(shadowed: Path):
+    summaries = FunctionSummaries(persist=True)
+    results_for(shadowed / "t1.py", summaries)
+    summaries.flush()
+
+    summaries = FunctionSummaries(persist=True)
+    classes = (shadowed / "classes.py").resolve()
+
+    assert summaries.get(classes, "make") is not None
+    assert results_for(shadowed / "t2.py", summaries)["f2"]["sets"] == {"p.target_attr"}
+
+    # Where the class is not shadowed the persisted summary is used
+    with mock.patch(
+        "rattr.results._scc.unbind_ir_with_call_swaps",
+        side_effect=unbind_ir_with_call_swaps,
+    ) as m_unbind_ir_with_call_swaps:
+        assert results_for(shadowed / "t1.py", summaries)["f1"]["sets"] == {
+            "p.lib_attr"
+        }
+
+    assert m_unbind_ir_with_call_swaps.call_count == 1  # i.e. `make(p)` in `f1`
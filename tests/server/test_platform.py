@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from rattr.cli.exit_codes import EXIT_FAILURE
+from rattr.config import Config
+from rattr.server import is_serving, serve
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pytest
+
+    from tests.shared import ArgumentsFn
+
+
+def test_serve_without_unix_sockets(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    arguments: ArgumentsFn,
+    capfd: pytest.CaptureFixture[str],
+):
+    socket_path = tmp_path / "rattr.sock"
+
+    monkeypatch.setattr("rattr.server._server.HAS_UNIX_SOCKETS", False)
+    monkeypatch.setattr(Config().arguments, "socket", socket_path, raising=False)
+
+    with arguments():
+        assert serve(Config()) == EXIT_FAILURE
+
+    _, stderr = capfd.readouterr()
+
+    assert "requires Unix sockets" in stderr
+    assert not is_serving(socket_path)
+    assert not socket_path.exists()
@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+import threading
+from contextlib import ExitStack
+from typing import TYPE_CHECKING
+
+import pytest
+
+from rattr.analyser.parallel import make_import_executor
+from rattr.error.diagnostics import diagnostics
+from rattr.module_locator.util import caches_generation
+from rattr.server import RattrServer, is_serving, send_request
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from concurrent.futures import Executor
+    from pathlib import Path
+
+
+pytestmark = pytest.mark.posix
+
+
+@pytest.fixture
+def project(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    (tmp_path / "util.py").write_text("def helper(x):\n    return x.numerator\n")
+    (tmp_path / "target.py").write_text(
+        "from util import helper\n"
+        "\n"
+        "def fn(a):\n"
+        "    return helper(a)\n"
+        "\n"
+        "def other(b):\n"
+        "    del b.attr\n"
+    )
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(
+        "rattr.module_locator._locate.derive_working_dir",
+        lambda: str(tmp_path),
+    )
+
+    return tmp_path
+
+
+@pytest.fixture
+def server(project: Path, request: pytest.FixtureRequest) -> Iterator[RattrServer]:
+    # Given the number of jobs, indirectly, the server analyses the imports in a pool
+    jobs: int | None = getattr(request, "param", None)
+
+    with ExitStack() as stack:
+        executor = stack.enter_context(make_import_executor(jobs)) if jobs else None
+        yield from _serve_in_thread(project, executor)
+
+
+def _serve_in_thread(project: Path, executor: Executor | None) -> Iterator[RattrServer]:
+    server = RattrServer(project / "rattr.sock", executor=executor)
+
+    def _serve() -> None:
+        while not server.is_shutting_down:
+            server.handle_request()
+
+    thread = threading.Thread(target=_serve, daemon=True)
+    thread.start()
+
+    yield server
+
+    if not server.is_shutting_down:
+        send_request(project / "rattr.sock", "shutdown")
+
+    thread.join(timeout=5)
+    server.server_close()
+
+
+def test_ping_and_shutdown(project: Path, server: RattrServer):
+    socket_path = project / "rattr.sock"
+
+    assert is_serving(socket_path)
+    assert send_request(socket_path, "ping") == {"ok": True}
+    assert send_request(socket_path, "shutdown") == {"ok": True}
+    assert server.is_shutting_down
+
+
+def test_analyse(project: Path, server: RattrServer):
+    response = send_request(project / "rattr.sock", "analyse", target="target.py")
+
+    assert response["ok"]
+    assert response["results"]["fn"]["gets"] == ["a", "a.numerator"]
+    assert response["results"]["other"]["dels"] == ["b.attr"]
+    assert str(project / "util.py") in {str(p) for p in server.signatures}
+
+
+def test_results_for_function(project: Path, server: RattrServer):
+    socket_path = project / "rattr.sock"
+
+    response = send_request(socket_path, "results", target="target.py", function="fn")
+
+    assert response["ok"]
+    assert response["function"] == "fn"
+    assert response["results"]["gets"] == ["a", "a.numerator"]
+
+    response = send_request(socket_path, "results", target="target.py", function="x")
+
+    assert not response["ok"]
+    assert response["error"] == "no function 'x' in 'target.py'"
+
+
+def test_changed_imports_are_reanalysed(project: Path, server: RattrServer):
+    socket_path = project / "rattr.sock"
+
+    first = send_request(socket_path, "results", target="target.py", function="fn")
+    assert first["results"]["gets"] == ["a", "a.numerator"]
+
+    (project / "util.py").write_text("def helper(x):\n    return x.denominator\n")
+
+    second = send_request(socket_path, "results", target="target.py", function="fn")
+    assert second["results"]["gets"] == ["a", "a.denominator"]
+
+
+@pytest.mark.parametrize("server", [None, 1], indirect=True, ids=["serial", "pool"])
+def test_new_modules_are_found(project: Path, server: RattrServer):
+    socket_path = project / "rattr.sock"
+
+    # NB: `mid` is analysed in the pool, where given, thus so is the import of `late`
+    (project / "mid.py").write_text("from late import helper\n")
+    (project / "late_target.py").write_text(
+        "from mid import helper\n\ndef fn(a):\n    return helper(a)\n"
+    )
+
+    first = send_request(socket_path, "analyse", target="late_target.py")
+    assert not first["ok"]
+    assert "unable to find module 'late'" in first["stderr"]
+
+    (project / "late.py").write_text("def helper(x):\n    return x.numerator\n")
+
+    second = send_request(socket_path, "analyse", target="late_target.py")
+    assert second["badness"] == 0
+    assert second["results"]["fn"]["gets"] == ["a", "a.numerator"]
+
+
+def test_modified_imports_keep_the_located_modules(project: Path, server: RattrServer):
+    socket_path = project / "rattr.sock"
+
+    send_request(socket_path, "analyse", target="target.py")
+    generation = caches_generation()
+
+    (project / "util.py").write_text("def helper(x):\n    return x.denominator\n")
+    send_request(socket_path, "analyse", target="target.py")
+
+    assert caches_generation() == generation
+
+    (project / "new.py").write_text("")
+    send_request(socket_path, "analyse", target="target.py")
+
+    assert caches_generation() == generation + 1
+
+
+def test_diagnostics_are_per_request(project: Path, server: RattrServer):
+    socket_path = project / "rattr.sock"
+
+    (project / "first.py").write_text("def fn(a):\n    return undefined(a)\n")
+    (project / "second.py").write_text("def fn(a):\n    return missing(a)\n")
+
+    first = send_request(socket_path, "analyse", target="first.py")
+    second = send_request(socket_path, "analyse", target="second.py")
+
+    assert "undefined" in first["stderr"]
+    assert "missing" in second["stderr"]
+    assert {record.file for record in diagnostics.records.values()} == {"second.py"}
+
+
+def test_unchanged_imports_are_not_reanalysed(project: Path, server: RattrServer):
+    socket_path = project / "rattr.sock"
+
+    send_request(socket_path, "analyse", target="target.py")
+    analysed = dict(server.analysed_imports)
+
+    send_request(socket_path, "analyse", target="target.py")
+
+    assert server.analysed_imports == analysed
+    assert all(
+        server.analysed_imports[origin] is analysed[origin] for origin in analysed
+    )
+
+
+@pytest.mark.parametrize(
+    "request_, error",
+    [
+        ({"method": "analyse", "params": {}}, "missing target"),
+        ({"method": "analyse", "params": {"target": "nope.py"}}, "does not exist"),
+        ({"method": "results", "params": {"target": "target.py"}}, "missing function"),
+        ({"method": "unknown"}, "unknown method 'unknown'"),
+    ],
+)
+def test_bad_requests(project: Path, server: RattrServer, request_, error):
+    response = send_request(
+        project / "rattr.sock",
+        request_["method"],
+        **request_.get("params", {}),
+    )
+
+    assert not response["ok"]
+    assert error in response["error"]
+
+
+def test_malformed_request(server: RattrServer):
+    assert server.dispatch(b"not json") == {"ok": False, "error": "malformed request"}
+    assert server.dispatch(b"[]") == {"ok": False, "error": "malformed request"}
+
+
+def test_error_in_analysis(project: Path, server: RattrServer):
+    socket_path = project / "rattr.sock"
+
+    (project / "broken.py").write_text("def fn(a):\n    return a.\n")
+
+    response = send_request(socket_path, "analyse", target="broken.py")
+
+    assert not response["ok"]
+    assert response["target"] == "broken.py"
+    assert response["error"].startswith("SyntaxError: ")
+
+    # The server is still serving
+    assert send_request(socket_path, "analyse", target="target.py")["ok"]
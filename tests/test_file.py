@@ -1,19 +1,32 @@
 """Tests for module/file level features."""
 from __future__ import annotations
 
+import tracemalloc
 from pathlib import Path
 from typing import TYPE_CHECKING
 from unittest import mock
 
 import pytest
 
-from rattr.analyser.file import FileAnalyser
+from rattr.analyser.file import (
+    FileAnalyser,
+    parse_and_analyse_file,
+    parse_and_analyse_import,
+)
+from rattr.analyser.instrumentation import instrumentation
+from rattr.analyser.util import read
+from rattr.config import CacheFormat, Config
+from rattr.config.state import enter_target
+from rattr.error.diagnostics import diagnostics
 from rattr.models.context import compile_root_context
 from rattr.models.symbol import CallInterface, Func, Name
+from rattr.results import generate_results_from_ir
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
 
+    from rattr.analyser.file import AnalysedImports
+    from rattr.models.results import FileResults
     from tests.shared import StateFn
 
 
@@ -210,3 +223,232 @@ class TestModuleLevelStatements:
         }
 
         assert results.ir_as_dict() == expected
+
+
+class TestSharedImports:
+    @pytest.fixture
+    def batch(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> list[Path]:
+        (tmp_path / "shared.py").write_text(
+            "def helper(obj):\n    obj.mutated = True\n    return obj.attr\n"
+        )
+        (tmp_path / "a.py").write_text(
+            "from shared import helper\n\ndef fn_a(a):\n    return helper(a)\n"
+        )
+        (tmp_path / "b.py").write_text(
+            "from shared import helper\n"
+            "\n"
+            "def fn_b(b):\n"
+            "    return helper(b.inner)\n"
+        )
+
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.syspath_prepend(str(tmp_path))
+        monkeypatch.setattr(
+            "rattr.module_locator._locate.derive_working_dir",
+            lambda: str(tmp_path),
+        )
+
+        return [tmp_path / "a.py", tmp_path / "b.py"]
+
+    def test_imports_are_analysed_once(self, batch: list[Path]):
+        analysed_imports: AnalysedImports = {}
+
+        with mock.patch(
+            "rattr.analyser.file.parse_and_analyse_import",
+            side_effect=parse_and_analyse_import,
+        ) as m_parse_and_analyse_import:
+            for target in batch:
+                with enter_target(target):
+                    _, import_irs, stats = parse_and_analyse_file(analysed_imports)
+
+                assert list(import_irs.keys()) == ["shared"]
+                assert stats.number_of_unique_imports == 1
+
+        assert m_parse_and_analyse_import.call_count == 1
+        assert len(analysed_imports) == 1
+
+    def test_results_match_independent_runs(self, batch: list[Path]):
+        analysed_imports: AnalysedImports = {}
+
+        def results_of(target: Path, analysed_imports: AnalysedImports | None):
+            with enter_target(target):
+                file_ir, import_irs, _ = parse_and_analyse_file(analysed_imports)
+                return generate_results_from_ir(
+                    target_ir=file_ir,
+                    import_irs=import_irs,
+                )
+
+        independent = [results_of(target, None) for target in batch]
+        shared = [results_of(target, analysed_imports) for target in batch]
+
+        assert shared == independent
+        assert shared[1]["fn_b"]["sets"] == {"b.inner.mutated"}
+
+    def test_badness_and_diagnostics_match_independent_runs(
+        self,
+        batch: list[Path],
+        tmp_path: Path,
+        capfd,
+    ):
+        (tmp_path / "shared.py").write_text(
+            "def helper(obj):\n"
+            "    obj.mutated = undefined_fn(obj)\n"
+            "    return obj.attr\n"
+        )
+
+        config = Config()
+
+        def analyse(target: Path, analysed_imports: AnalysedImports | None):
+            with enter_target(target):
+                parse_and_analyse_file(analysed_imports)
+                diagnostics.flush()
+
+                badness = config.state.badness_from_imports
+
+            return badness, capfd.readouterr().err
+
+        independent = [analyse(target, None) for target in batch]
+
+        analysed_imports: AnalysedImports = {}
+        shared = [analyse(target, analysed_imports) for target in batch]
+
+        assert shared == independent
+        assert shared[1][0] > 0
+        assert "'undefined_fn' potentially undefined" in shared[1][1]
+
+    def test_imports_are_cached(self, batch: list[Path], tmp_path: Path, arguments):
+        def analyse_all() -> list[FileResults]:
+            results: list[FileResults] = []
+
+            for target in batch:
+                with enter_target(target):
+                    file_ir, import_irs, _ = parse_and_analyse_file()
+                    results.append(
+                        generate_results_from_ir(
+                            target_ir=file_ir,
+                            import_irs=import_irs,
+                        )
+                    )
+
+            return results
+
+        with mock.patch(
+            "rattr.models.results.util.get_import_cache_file",
+            lambda origin: tmp_path / "cache" / f"{Path(origin).stem}.json",
+        ), mock.patch(
+            "rattr.analyser.file.read",
+            side_effect=read,
+        ) as m_read, arguments(cache_imports=True):
+            uncached = analyse_all()
+            assert m_read.call_count == 2 + 1  # targets + first import of "shared"
+            assert (tmp_path / "cache" / "shared.json").is_file()
+
+            m_read.reset_mock()
+            cached = analyse_all()
+            assert m_read.call_count == 2  # targets only
+
+        assert cached == uncached
+
+    @pytest.mark.parametrize("cache_format", list(CacheFormat))
+    def test_cached_imports_replay_badness_and_diagnostics(
+        self,
+        batch: list[Path],
+        tmp_path: Path,
+        arguments,
+        capfd,
+        cache_format: CacheFormat,
+    ):
+        (tmp_path / "shared.py").write_text(
+            "def helper(obj):\n"
+            "    obj.mutated = undefined_fn(obj)\n"
+            "    return obj.attr\n"
+        )
+
+        config = Config()
+
+        def analyse() -> tuple[int, str]:
+            diagnostics.reset()
+
+            with enter_target(batch[0]):
+                parse_and_analyse_file()
+                diagnostics.flush()
+
+                badness = config.state.badness_from_imports
+
+            return badness, capfd.readouterr().err
+
+        with mock.patch(
+            "rattr.models.results.util.get_import_cache_file",
+            lambda origin: tmp_path / "cache" / f"{Path(origin).stem}.json",
+        ), arguments(cache_imports=True, cache_format=cache_format):
+            cold = analyse()
+            assert (tmp_path / "cache" / "shared.json").is_file()
+
+            with mock.patch("rattr.analyser.file.read", side_effect=read) as m_read:
+                warm = analyse()
+                assert m_read.call_count == 1  # the target only
+
+        assert warm == cold
+        assert cold[0] > 0
+        assert "'undefined_fn' potentially undefined" in cold[1]
+
+    def test_memory_stats(self, batch: list[Path]):
+        tracemalloc.start()
+
+        try:
+            with enter_target(batch[0]):
+                _, _, stats = parse_and_analyse_file()
+        finally:
+            tracemalloc.stop()
+
+        assert list(stats.memory.keys()) == [
+            "parse",
+            "root_context",
+            "assert",
+            "analyse_imports",
+            "analyse_file",
+        ]
+        assert list(stats.memory_by_import.keys()) == ["shared"]
+
+        imports = stats.memory["analyse_imports"]
+        shared = stats.memory_by_import["shared"]
+
+        assert imports.peak >= shared.peak
+        assert imports.retained >= shared.retained > 0
+
+    def test_memory_stats_are_not_measured_when_not_tracing(self, batch: list[Path]):
+        with enter_target(batch[0]):
+            _, _, stats = parse_and_analyse_file()
+
+        assert stats.memory == {}
+        assert stats.memory_by_import == {}
+
+    def test_visitor_stats(self, batch: list[Path]):
+        analysed_imports: AnalysedImports = {}
+
+        instrumentation.start()
+
+        try:
+            with enter_target(batch[0]):
+                _, _, first = parse_and_analyse_file(analysed_imports)
+
+            with enter_target(batch[1]):
+                _, _, second = parse_and_analyse_file(analysed_imports)
+        finally:
+            instrumentation.stop()
+
+        assert first.visitors is not None
+        assert second.visitors is not None
+
+        # The stats are those of each target, only the first analysed the import
+        assert first.visitors.by_node_type["Module"].count == 2
+        assert second.visitors.by_node_type["Module"].count == 1
+
+    def test_visitor_stats_are_not_measured_when_not_instrumenting(
+        self,
+        batch: list[Path],
+    ):
+        with enter_target(batch[0]):
+            _, _, stats = parse_and_analyse_file()
+
+        assert stats.visitors is None
@@ -0,0 +1,136 @@
+"""Tests for the entry point, i.e. the outputs of `rattr <file> [<file> ...]`."""
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+from unittest import mock
+
+import pytest
+
+from rattr.__main__ import main
+from rattr.cli.exit_codes import EXIT_SUCCESS
+from rattr.config import Config, Output, ResultsEngine
+from rattr.results import FunctionSummaries
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from tests.shared import ArgumentsFn
+
+
+@pytest.fixture
+def batch(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> list[Path]:
+    (tmp_path / "shared.py").write_text(
+        "def helper(obj):\n"
+        "    obj.mutated = undefined_fn(obj)\n"
+        "    return obj.attr\n"
+    )
+    (tmp_path / "a.py").write_text(
+        "from shared import helper\n\ndef fn_a(a):\n    return helper(a)\n"
+    )
+    (tmp_path / "b.py").write_text(
+        "from shared import helper\n"
+        "\n"
+        "def fn_b(b):\n"
+        "    b.set = b.get\n"
+        "    return helper(b.inner)\n"
+    )
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(
+        "rattr.module_locator._locate.derive_working_dir",
+        lambda: str(tmp_path),
+    )
+
+    return [tmp_path / "a.py", tmp_path / "b.py"]
+
+
+@pytest.fixture
+def run(
+    arguments: ArgumentsFn,
+    monkeypatch: pytest.MonkeyPatch,
+    capfd,
+):
+    def _run(targets: list[Path], stdout: Output) -> str:
+        config = Config()
+
+        monkeypatch.setattr(config.arguments, "_targets", targets, raising=False)
+        monkeypatch.setattr(config.arguments, "cache_file", None, raising=False)
+
+        with arguments(target=targets[0], stdout=stdout):
+            assert main(config) == EXIT_SUCCESS
+
+        out, _ = capfd.readouterr()
+
+        return out
+
+    return _run
+
+
+class TestBatchMode:
+    @pytest.mark.parametrize(
+        "stdout",
+        [Output.ir, Output.results, Output.cacheable, Output.stats_json],
+    )
+    def test_output_is_a_single_json_object(self, batch, run, stdout: Output):
+        output = json.loads(run(batch, stdout))
+
+        assert list(output) == [str(target) for target in batch]
+
+    def test_output_matches_independent_runs(self, batch, run):
+        batched = json.loads(run(batch, Output.results))
+
+        for target in batch:
+            assert batched[str(target)] == json.loads(run([target], Output.results))
+
+    def test_badness_matches_independent_runs(self, batch, run):
+        batched = json.loads(run(batch, Output.stats_json))
+
+        for target in batch:
+            independent = json.loads(run([target], Output.stats_json))
+
+            assert batched[str(target)]["badness"] == independent["badness"]
+            assert independent["badness"]["from_imports"] > 0
+
+    @pytest.mark.parametrize(
+        "engine, expected",
+        [(ResultsEngine.tree, 0), (ResultsEngine.scc, 1)],
+    )
+    def test_summaries_are_only_built_for_the_scc_engine(
+        self,
+        batch,
+        run,
+        arguments: ArgumentsFn,
+        engine: ResultsEngine,
+        expected: int,
+    ):
+        with arguments(results_engine=engine), mock.patch(
+            "rattr.results.FunctionSummaries", wraps=FunctionSummaries
+        ) as m_summaries:
+            run(batch, Output.results)
+
+        assert m_summaries.call_count == expected
+
+
+class TestNdjson:
+    def test_output_matches_results(self, tmp_path: Path, run):
+        target = tmp_path / "target.py"
+        target.write_text(
+            "def fn(a, b):\n"
+            "    a.zeta = b.eta\n"
+            "    a.alpha = b.beta + b.gamma + b.delta\n"
+            "    del a.theta, a.iota\n"
+            "    return other(a.kappa, b.lambda_)\n"
+            "\n"
+            "def other(x, y):\n"
+            "    return x.mu + y.nu\n"
+        )
+
+        records = [
+            json.loads(line) for line in run([target], Output.ndjson).splitlines()
+        ]
+        results = json.loads(run([target], Output.results))
+
+        assert {record["target"] for record in records} == {str(target)}
+        assert {record["function"]: record["results"] for record in records} == results
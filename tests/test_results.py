@@ -7,6 +7,7 @@ from unittest import mock
 
 import pytest
 
+from rattr.config import ResultsEngine
 from rattr.models.ir import FileIr
 from rattr.models.results.file import FileResults
 from rattr.models.symbol import (
@@ -24,7 +25,12 @@ from tests.shared import Import_
 if TYPE_CHECKING:
     from collections.abc import Iterator
 
-    from tests.shared import FileIrFromDictFn, MakeRootContextFn, StateFn
+    from tests.shared import (
+        ArgumentsFn,
+        FileIrFromDictFn,
+        MakeRootContextFn,
+        StateFn,
+    )
 
 
 @pytest.fixture(autouse=True)
@@ -33,6 +39,15 @@ def __set_current_file(state: StateFn) -> Iterator[None]:
         yield
 
 
+@pytest.fixture(autouse=True, params=list(ResultsEngine), ids=str)
+def __results_engine(
+    request: pytest.FixtureRequest,
+    arguments: ArgumentsFn,
+) -> Iterator[None]:
+    with arguments(results_engine=request.param):
+        yield
+
+
 class TestResults:
     def test_generate_results_from_ir_no_calls(
         self,
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from typing import Final
+
+
+STARTUP_BUDGET_IN_MICROSECONDS: Final = 100_000
+"""The budget for `import rattr.__main__`, excluding the interpreter's own startup.
+
+This depends upon the machine, thus is only checked given `-m wall_clock`.
+"""
+
+DEFERRED_MODULES: Final = (
+    "cattrs",
+    "isort",
+    "rattr.analyser.file",
+    "rattr.models.util._serialisation_helpers",
+    "rattr.plugins",
+    "rattr.results",
+    "rattr.server",
+)
+"""The modules which must not be imported before the arguments are parsed."""
+
+
+def import_times(module: str, *args: str) -> dict[str, int]:
+    """Return the cumulative import time (us) of each module imported by `module`.
+
+    Given arguments, the module is run as `python -m <module> <args>` instead.
+    """
+    if args:
+        command = ["-m", module, *args]
+    else:
+        command = ["-c", f"import {module}"]
+
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", *command],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+    # import time: self [us] | cumulative | imported package
+    times: dict[str, int] = {}
+
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = int(cumulative)
+
+    return times
+
+
+def test_startup_does_not_import_the_analyser():
+    imported = import_times("rattr.__main__")
+
+    assert "rattr.__main__" in imported
+    assert not [module for module in DEFERRED_MODULES if module in imported]
+
+
+def test_version_does_not_import_the_analyser():
+    imported = import_times("rattr", "--version")
+
+    assert "rattr.cli" in imported
+    assert not [module for module in DEFERRED_MODULES if module in imported]
+
+
+@pytest.mark.cpython
+@pytest.mark.wall_clock
+def test_startup_is_within_budget():
+    # The best of several runs, to be robust to a noisy machine
+    best = min(import_times("rattr.__main__")["rattr.__main__"] for _ in range(5))
+
+    assert best <= STARTUP_BUDGET_IN_MICROSECONDS
+
+
+def test_cache_check_does_not_import_the_analyser():
+    imported = import_times("rattr.models.results.util")
+
+    assert "rattr.analyser.file" not in imported
+    assert "isort" not in imported
@@ -3,6 +3,7 @@ from __future__ import annotations
 import ast
 import re
 import sys
+import tracemalloc
 from pathlib import Path
 from typing import TYPE_CHECKING
 from unittest import mock
@@ -47,9 +48,11 @@ from rattr.analyser.util import (
     is_starred_import,
     is_stdlib_module,
     lambda_in_rhs,
+    memory_usage,
     namedtuple_in_rhs,
     parse_annotation,
     parse_rattr_results_from_annotation,
+    peak_rss,
     unravel_names,
     validate_rattr_results,
     walrus_in_rhs,
@@ -1452,3 +1455,47 @@ class TestGetNamedTupleAttrsFromCall:
 
         expected = ["self", "a", "b", "c", "d"]
         assert get_namedtuple_attrs_from_call(assignment) == expected
+
+
+class TestMemoryUsage:
+    @pytest.fixture
+    def tracing(self):
+        tracemalloc.start()
+        yield
+        tracemalloc.stop()
+
+    def test_not_tracing(self):
+        with memory_usage() as memory:
+            _ = bytearray(2**16)
+
+        assert memory.usage is None
+
+    def test_memory_usage(self, tracing):
+        with memory_usage() as memory:
+            retained = bytearray(2**20)
+            del retained
+            retained = bytearray(2**16)
+
+        # Still referenced, thus retained
+        assert len(retained) == 2**16
+        assert memory.usage.peak >= 2**20
+        assert 2**16 <= memory.usage.retained < 2**20
+
+    def test_nested_memory_usage(self, tracing):
+        with memory_usage() as outer:
+            with memory_usage() as before:
+                transient = bytearray(2**20)
+                del transient
+
+            with memory_usage() as inner:
+                pass
+
+        # The peak of the outer context is not lost when the inner context resets it
+        assert inner.usage.peak < 2**20
+        assert outer.usage.peak >= before.usage.peak >= 2**20
+
+    def test_peak_rss(self):
+        if sys.platform == "win32":
+            assert peak_rss() is None
+        else:
+            assert peak_rss() > 0